@@ -0,0 +1,7 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+"""
+Benchmarks for celery-sqlalchemy serialization.
+"""
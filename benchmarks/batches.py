@@ -0,0 +1,73 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+"""
+Compare columnar batches against one JSON object per model instance.
+
+    python -m benchmarks.batches
+"""
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.json import JsonSerializer
+
+from celery_sqlalchemy.types import Args
+
+from .models import make_instances
+from .models import make_model
+
+# system imports
+from timeit import timeit
+
+from typing import Dict
+
+
+def main(width: int = 20, count: int = 5000, number: int = 5) -> Dict[str, Dict]:
+    """
+    Run the benchmark and return the payload size and timings for each layout.
+
+    Parameters:
+        width (int): Number of model columns.
+        count (int): Number of instances in the list argument.
+        number (int): Number of timeit repetitions.
+    """
+    instances = make_instances(make_model(f"Batches{width}", width), count)
+    args = Args(args=[instances], kwargs={})
+    results = {}
+
+    for name, serializer in [
+        ("objects", JsonSerializer(compiled=True)),
+        ("batches", JsonSerializer(batches=True, compiled=True)),
+    ]:
+        message = serializer.message_from_args(args)
+
+        results[name] = {
+            "bytes": len(message),
+            "encode ms": timeit(
+                lambda: serializer.message_from_args(args), number=number
+            )
+            / number
+            * 1000,
+            "decode ms": timeit(
+                lambda: serializer.message_to_args(message), number=number
+            )
+            / number
+            * 1000,
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    results = main()
+
+    for name, result in results.items():
+        print(
+            f"{name:<8} {result['bytes']:>10} bytes"
+            f" {result['encode ms']:8.2f} ms encode"
+            f" {result['decode ms']:8.2f} ms decode"
+        )
+
+    saved = 1 - results["batches"]["bytes"] / results["objects"]["bytes"]
+
+    print(f"batches are {saved:.0%} smaller")
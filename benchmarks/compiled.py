@@ -0,0 +1,106 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+"""
+Compare compiled schema functions and the split identity and transforming fields of
+interpreted schemas against the per-field serialization loop.
+
+    python -m benchmarks.compiled
+"""
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.model import map_model
+from celery_sqlalchemy.model import values_from_json
+from celery_sqlalchemy.model import values_to_json
+
+from celery_sqlalchemy import json
+
+from .models import make_instances
+from .models import make_model
+
+# system imports
+from timeit import timeit
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import cast
+
+# dependency imports
+from sqlalchemy import inspect
+
+import orjson
+
+
+def main(width: int = 60, count: int = 1000, number: int = 20) -> Dict[str, float]:
+    """
+    Run the benchmark and return the seconds per instance for each path.
+
+    Parameters:
+        width (int): Number of model columns.
+        count (int): Number of instances.
+        number (int): Number of timeit repetitions.
+    """
+    model = make_model(f"Compiled{width}", width)
+    mapper = inspect(model)
+    loop = map_model(model, mapper, json)
+    compiled = map_model(model, mapper, json, compiled=True)
+    from_json = cast(Callable, compiled.from_json)
+    to_json = cast(Callable, compiled.to_json)
+    instances = make_instances(model, count)
+    encoded = orjson.loads(orjson.dumps([to_json(i) for i in instances]))
+
+    def loop_from_json() -> List[Any]:
+        return [
+            {f.name: f.from_json(f, row.get(f.name)) for f in loop.fields}
+            for row in encoded
+        ]
+
+    def loop_to_json() -> List[Any]:
+        return [
+            {f.name: f.to_json(f, getattr(i, f.name)) for f in loop.fields}
+            for i in instances
+        ]
+
+    def split_from_json() -> List[Any]:
+        return [values_from_json(loop, row) for row in encoded]
+
+    def split_to_json() -> List[Any]:
+        return [values_to_json(loop, i) for i in instances]
+
+    def compiled_from_json() -> List[Any]:
+        return [from_json(row) for row in encoded]
+
+    def compiled_to_json() -> List[Any]:
+        return [to_json(i) for i in instances]
+
+    assert loop_from_json() == compiled_from_json()
+    assert loop_to_json() == compiled_to_json()
+    assert loop_from_json() == split_from_json()
+    assert loop_to_json() == split_to_json()
+
+    return {
+        name: timeit(function, number=number) / (number * count)
+        for name, function in [
+            ("to_json loop", loop_to_json),
+            ("to_json split", split_to_json),
+            ("to_json compiled", compiled_to_json),
+            ("from_json loop", loop_from_json),
+            ("from_json split", split_from_json),
+            ("from_json compiled", compiled_from_json),
+        ]
+    }
+
+
+if __name__ == "__main__":
+    results = main()
+
+    for name, seconds in results.items():
+        print(f"{name:<20} {seconds * 1_000_000:8.2f} us/instance")
+
+    for direction in ("to_json", "from_json"):
+        speedup = results[f"{direction} loop"] / results[f"{direction} compiled"]
+
+        print(f"{direction:<20} {speedup:8.2f}x")
@@ -0,0 +1,118 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+"""
+Compare the throughput and compression ratio of zlib and lzma on model batches.
+
+    python -m benchmarks.compression
+"""
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.json import JsonSerializer
+
+from celery_sqlalchemy.types import Args
+
+from .models import make_instances
+from .models import make_model
+
+# system imports
+from random import Random
+
+from timeit import timeit
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# dependency imports
+from sqlalchemy import Integer
+from sqlalchemy import String
+
+words = "alpha bravo charlie delta echo foxtrot golf hotel india juliet kilo".split()
+
+cases: List[Tuple[str, Optional[str], Optional[int]]] = [
+    ("none", None, None),
+    ("zlib 1", "zlib", 1),
+    ("zlib 6", "zlib", 6),
+    ("zlib 9", "zlib", 9),
+    ("lzma 0", "lzma", 0),
+    ("lzma 6", "lzma", 6),
+]
+
+
+def make_batch(width: int, count: int) -> List[Any]:
+    """
+    Returns `count` instances of a synthetic model with varied strings and integers,
+    as in a table export rather than copies of one row.
+
+    Parameters:
+        width (int): Number of model columns.
+        count (int): Number of instances.
+    """
+    random = Random(count)
+    instances = make_instances(make_model(f"Compression{width}", width), count)
+
+    for instance in instances:
+        for column in instance.__table__.columns:
+            if column.name == "id":
+                continue
+
+            elif isinstance(column.type, String):
+                value = " ".join(random.choices(words, k=random.randint(1, 4)))
+
+                setattr(instance, column.name, value)
+
+            elif isinstance(column.type, Integer):
+                setattr(instance, column.name, random.randint(0, 100_000))
+
+    return instances
+
+
+def main(
+    width: int = 20, count: int = 5000, number: int = 5
+) -> Dict[str, Dict[str, float]]:
+    """
+    Run the benchmark and return the size, ratio and throughput of each compression.
+
+    Parameters:
+        width (int): Number of model columns.
+        count (int): Number of instances in the list argument.
+        number (int): Number of timeit repetitions.
+    """
+    args = Args(args=[make_batch(width, count)], kwargs={})
+    results = {}
+    size = 0
+
+    for name, compression, level in cases:
+        serializer = JsonSerializer(
+            compiled=True,
+            compression=compression,
+            compression_level=level,
+            compression_threshold=0,
+        )
+        message = serializer.message_from_args(args)
+        encode = timeit(lambda: serializer.message_from_args(args), number=number)
+        decode = timeit(lambda: serializer.message_to_args(message), number=number)
+        size = size or len(message)
+
+        results[name] = {
+            "bytes": len(message),
+            "ratio": size / len(message),
+            "encode MB/s": size * number / encode / 1_000_000,
+            "decode MB/s": size * number / decode / 1_000_000,
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    for name, result in main().items():
+        print(
+            f"{name:<8} {result['bytes']:>10} bytes"
+            f" {result['ratio']:6.2f}x"
+            f" {result['encode MB/s']:8.2f} MB/s encode"
+            f" {result['decode MB/s']:8.2f} MB/s decode"
+        )
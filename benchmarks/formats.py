@@ -0,0 +1,98 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+"""
+Compare MessagePack and positional messages against JSON messages whose binary columns
+are sent as base64 text.
+
+    python -m benchmarks.formats
+"""
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.json import JsonSerializer
+
+from celery_sqlalchemy.msgpack import MsgpackSerializer
+
+from celery_sqlalchemy.positional import PositionalSerializer
+
+from celery_sqlalchemy.types import Args
+
+from .models import Base
+from .models import encode_fallback
+from .models import make_instances
+from .models import make_model
+
+# system imports
+from timeit import timeit
+
+from typing import Dict
+
+import os
+
+# dependency imports
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import LargeBinary
+
+
+class Blob(Base):  # type: ignore
+    __tablename__ = "blob"
+
+    id = Column(Integer, primary_key=True)
+    data = Column(LargeBinary)
+
+
+def main(
+    width: int = 20, count: int = 1000, size: int = 4096, number: int = 5
+) -> Dict[str, Dict]:
+    """
+    Run the benchmark and return the payload size and timings for each format.
+
+    Parameters:
+        width (int): Number of model columns.
+        count (int): Number of instances in each list argument.
+        size (int): Number of bytes in each binary column.
+        number (int): Number of timeit repetitions.
+    """
+    args = Args(
+        args=[
+            make_instances(make_model(f"Formats{width}", width), count),
+            [Blob(id=n, data=os.urandom(size)) for n in range(count)],
+        ],
+        kwargs={},
+    )
+    results = {}
+
+    for name, serializer in [
+        ("json", JsonSerializer(compiled=True, on_serialize_arg=encode_fallback)),
+        ("msgpack", MsgpackSerializer(compiled=True)),
+        ("positional", PositionalSerializer(compiled=True)),
+    ]:
+        message = serializer.message_from_args(args)
+
+        results[name] = {
+            "bytes": len(message),
+            "encode ms": timeit(
+                lambda: serializer.message_from_args(args), number=number
+            )
+            / number
+            * 1000,
+        }
+
+    return results
+
+
+if __name__ == "__main__":
+    results = main()
+
+    for name, result in results.items():
+        print(
+            f"{name:<10} {result['bytes']:>10} bytes"
+            f" {result['encode ms']:8.2f} ms encode"
+        )
+
+    for name in ("msgpack", "positional"):
+        saved = 1 - results[name]["bytes"] / results["json"]["bytes"]
+
+        print(f"{name} is {saved:.0%} smaller")
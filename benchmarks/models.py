@@ -0,0 +1,262 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.model import type_maps
+
+# system imports
+from base64 import b64encode
+
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+
+from decimal import Decimal
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+from uuid import uuid4
+
+# dependency imports
+from sqlalchemy.dialects import postgresql
+
+from sqlalchemy.orm import declarative_base
+
+from sqlalchemy.sql import sqltypes
+
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import Integer
+from sqlalchemy import Interval
+from sqlalchemy import Numeric
+from sqlalchemy import String
+from sqlalchemy import UUID
+
+Base = declarative_base()
+
+
+def make_model(name: str, width: int) -> Any:
+    """
+    Returns a synthetic model with `width` columns, one in six being transforming.
+
+    Parameters:
+        name (str): Model class name.
+        width (int): Number of columns including the primary key.
+    """
+    columns: Dict[str, Any] = {
+        "__module__": __name__,
+        "__tablename__": name.lower(),
+        "id": Column(Integer, primary_key=True),
+    }
+
+    for n in range(1, width):
+        columns[f"column_{n}"] = Column(column_types[n % len(column_types)]())
+
+    model = type(name, (Base,), columns)
+
+    globals()[name] = model
+
+    return model
+
+
+def make_surface_model(name: str, width: int) -> Any:
+    """
+    Returns a synthetic model with `width` columns cycling through every type in
+    `type_maps`, including the PostgreSQL types.
+
+    Parameters:
+        name (str): Model class name.
+        width (int): Number of columns including the primary key.
+    """
+    types = list(type_maps)
+    columns: Dict[str, Any] = {
+        "__module__": __name__,
+        "__tablename__": name.lower(),
+        "id": Column(Integer, primary_key=True),
+    }
+
+    for n in range(1, width):
+        columns[f"column_{n}"] = Column(surface_types[types[(n - 1) % len(types)]]())
+
+    model = type(name, (Base,), columns)
+
+    globals()[name] = model
+
+    return model
+
+
+def encode_fallback(arg: Any) -> Any:
+    """
+    Serialize the values the JSON functions pass through but orjson cannot encode,
+    which are bytes as base64 text and PostgreSQL intervals as seconds.
+
+    Parameters:
+        arg (object): Any object type.
+    """
+    if isinstance(arg, bytes):
+        return b64encode(arg).decode()
+
+    elif isinstance(arg, timedelta):
+        return arg.total_seconds()
+
+    raise TypeError
+
+
+def make_instances(model: Any, count: int) -> List[Any]:
+    """
+    Returns `count` populated instances of a synthetic model.
+
+    Parameters:
+        model (Any): Model class made by `make_model` or `make_surface_model`.
+        count (int): Number of instances.
+    """
+    return [
+        model(
+            id=n,
+            **{
+                column.name: sample_values[column.type.__class__]
+                for column in model.__table__.columns
+                if column.name != "id"
+            },
+        )
+        for n in range(count)
+    ]
+
+
+column_types = [String, Integer, String, Integer, String, DateTime]
+column_types += [String, Integer, String, Integer, String, Numeric]
+column_types += [String, Integer, String, Integer, String, UUID]
+column_types += [String, Integer, String, Integer, String, Interval]
+
+# column type factories for every type in `type_maps`
+surface_types: Dict[type, Callable[[], Any]] = {
+    sqltypes.ARRAY: lambda: sqltypes.ARRAY(Integer),
+    sqltypes.BigInteger: sqltypes.BigInteger,
+    sqltypes.Boolean: sqltypes.Boolean,
+    sqltypes.Date: sqltypes.Date,
+    sqltypes.DateTime: sqltypes.DateTime,
+    sqltypes.Double: sqltypes.Double,
+    sqltypes.Enum: lambda: sqltypes.Enum("a", "b", name="surface_enum"),
+    sqltypes.Float: sqltypes.Float,
+    sqltypes.Integer: sqltypes.Integer,
+    sqltypes.Interval: sqltypes.Interval,
+    sqltypes.JSON: sqltypes.JSON,
+    sqltypes.LargeBinary: sqltypes.LargeBinary,
+    sqltypes.Numeric: lambda: sqltypes.Numeric(10, 2),
+    sqltypes.SmallInteger: sqltypes.SmallInteger,
+    sqltypes.String: sqltypes.String,
+    sqltypes.Text: sqltypes.Text,
+    sqltypes.Time: sqltypes.Time,
+    sqltypes.UUID: sqltypes.UUID,
+    sqltypes.Unicode: sqltypes.Unicode,
+    sqltypes.UnicodeText: sqltypes.UnicodeText,
+    postgresql.ARRAY: lambda: postgresql.ARRAY(Integer),
+    postgresql.BIT: postgresql.BIT,
+    postgresql.BYTEA: postgresql.BYTEA,
+    postgresql.CIDR: postgresql.CIDR,
+    postgresql.CITEXT: postgresql.CITEXT,
+    postgresql.DATEMULTIRANGE: postgresql.DATEMULTIRANGE,
+    postgresql.DATERANGE: postgresql.DATERANGE,
+    postgresql.DOMAIN: lambda: postgresql.DOMAIN("surface_domain", Integer),
+    postgresql.DOUBLE_PRECISION: postgresql.DOUBLE_PRECISION,
+    postgresql.ENUM: lambda: postgresql.ENUM("a", "b", name="surface_pg_enum"),
+    postgresql.HSTORE: postgresql.HSTORE,
+    postgresql.INET: postgresql.INET,
+    postgresql.INT4MULTIRANGE: postgresql.INT4MULTIRANGE,
+    postgresql.INT4RANGE: postgresql.INT4RANGE,
+    postgresql.INT8MULTIRANGE: postgresql.INT8MULTIRANGE,
+    postgresql.INT8RANGE: postgresql.INT8RANGE,
+    postgresql.INTERVAL: postgresql.INTERVAL,
+    postgresql.JSON: postgresql.JSON,
+    postgresql.JSONB: postgresql.JSONB,
+    postgresql.JSONPATH: postgresql.JSONPATH,
+    postgresql.MACADDR: postgresql.MACADDR,
+    postgresql.MACADDR8: postgresql.MACADDR8,
+    postgresql.MONEY: postgresql.MONEY,
+    postgresql.NUMMULTIRANGE: postgresql.NUMMULTIRANGE,
+    postgresql.NUMRANGE: postgresql.NUMRANGE,
+    postgresql.OID: postgresql.OID,
+    postgresql.REAL: postgresql.REAL,
+    postgresql.REGCLASS: postgresql.REGCLASS,
+    postgresql.REGCONFIG: postgresql.REGCONFIG,
+    postgresql.TIME: postgresql.TIME,
+    postgresql.TIMESTAMP: postgresql.TIMESTAMP,
+    postgresql.TSMULTIRANGE: postgresql.TSMULTIRANGE,
+    postgresql.TSQUERY: postgresql.TSQUERY,
+    postgresql.TSRANGE: postgresql.TSRANGE,
+    postgresql.TSTZMULTIRANGE: postgresql.TSTZMULTIRANGE,
+    postgresql.TSTZRANGE: postgresql.TSTZRANGE,
+    postgresql.TSVECTOR: postgresql.TSVECTOR,
+}
+
+# column values by column type
+sample_values: Dict[type, Any] = {
+    sqltypes.ARRAY: [1, 2, 3],
+    sqltypes.BigInteger: 2**40,
+    sqltypes.Boolean: True,
+    sqltypes.Date: date(2023, 1, 1),
+    sqltypes.DateTime: datetime(2023, 1, 1, 12, 30),
+    sqltypes.Double: 1.5,
+    sqltypes.Enum: "a",
+    sqltypes.Float: 1.5,
+    sqltypes.Integer: 1,
+    sqltypes.Interval: timedelta(hours=1),
+    sqltypes.JSON: {"key": [1, "value"]},
+    sqltypes.LargeBinary: bytes(range(64)),
+    sqltypes.Numeric: Decimal("10.25"),
+    sqltypes.SmallInteger: 1,
+    sqltypes.String: "value",
+    sqltypes.Text: "value " * 8,
+    sqltypes.Time: time(12, 30),
+    sqltypes.UUID: uuid4(),
+    sqltypes.Unicode: "valüe",
+    sqltypes.UnicodeText: "valüe " * 8,
+    postgresql.ARRAY: [1, 2, 3],
+    postgresql.BIT: "1010",
+    postgresql.BYTEA: bytes(range(64)),
+    postgresql.CIDR: "10.0.0.0/8",
+    postgresql.CITEXT: "Value",
+    postgresql.DATEMULTIRANGE: [
+        postgresql.Range(date(2023, 1, 1), date(2023, 2, 1)),
+    ],
+    postgresql.DATERANGE: postgresql.Range(date(2023, 1, 1), date(2023, 2, 1)),
+    postgresql.DOMAIN: 1,
+    postgresql.DOUBLE_PRECISION: 1.5,
+    postgresql.ENUM: "a",
+    postgresql.HSTORE: {"key": "value"},
+    postgresql.INET: "10.0.0.1",
+    postgresql.INT4MULTIRANGE: [postgresql.Range(1, 10)],
+    postgresql.INT4RANGE: postgresql.Range(1, 10),
+    postgresql.INT8MULTIRANGE: [postgresql.Range(1, 2**40)],
+    postgresql.INT8RANGE: postgresql.Range(1, 2**40),
+    postgresql.INTERVAL: timedelta(hours=1),
+    postgresql.JSON: {"key": [1, "value"]},
+    postgresql.JSONB: {"key": [1, "value"]},
+    postgresql.JSONPATH: "$.key",
+    postgresql.MACADDR: "08:00:2b:01:02:03",
+    postgresql.MACADDR8: "08:00:2b:01:02:03:04:05",
+    postgresql.MONEY: "$10.25",
+    postgresql.NUMMULTIRANGE: [postgresql.Range(1.5, 2.5)],
+    postgresql.NUMRANGE: postgresql.Range(1.5, 2.5),
+    postgresql.OID: 1,
+    postgresql.REAL: 1.5,
+    postgresql.REGCLASS: "table",
+    postgresql.REGCONFIG: "english",
+    postgresql.TIME: time(12, 30),
+    postgresql.TIMESTAMP: datetime(2023, 1, 1, 12, 30),
+    postgresql.TSMULTIRANGE: [
+        postgresql.Range(datetime(2023, 1, 1), datetime(2023, 2, 1)),
+    ],
+    postgresql.TSQUERY: "value & other",
+    postgresql.TSRANGE: postgresql.Range(datetime(2023, 1, 1), datetime(2023, 2, 1)),
+    postgresql.TSTZMULTIRANGE: [
+        postgresql.Range(datetime(2023, 1, 1), datetime(2023, 2, 1)),
+    ],
+    postgresql.TSTZRANGE: postgresql.Range(datetime(2023, 1, 1), datetime(2023, 2, 1)),
+    postgresql.TSVECTOR: "value other",
+}
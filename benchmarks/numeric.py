@@ -0,0 +1,128 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+"""
+Compare the string and scaled integer encodings of numeric columns on model batches.
+
+    python -m benchmarks.numeric
+"""
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.json import JsonSerializer
+
+from celery_sqlalchemy.msgpack import MsgpackSerializer
+
+from celery_sqlalchemy.schema import SCALED_NUMERIC
+
+from celery_sqlalchemy.types import Args
+
+from .models import Base
+
+# system imports
+from decimal import Decimal
+
+from random import Random
+
+from timeit import timeit
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+# dependency imports
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import Numeric
+
+
+def make_ledger(name: str, scaled: bool) -> Any:
+    """
+    Returns a synthetic ledger model of four numeric columns.
+
+    Parameters:
+        name (str): Model class name.
+        scaled (bool): Serialize the numeric columns as scaled integers.
+    """
+    info = {SCALED_NUMERIC: scaled}
+
+    return type(
+        name,
+        (Base,),
+        {
+            "__module__": __name__,
+            "__tablename__": name.lower(),
+            "id": Column(Integer, primary_key=True),
+            "amount": Column(Numeric(14, 2), info=info),
+            "balance": Column(Numeric(18, 2), info=info),
+            "fee": Column(Numeric(10, 4), info=info),
+            "rate": Column(Numeric(10, 6), info=info),
+        },
+    )
+
+
+ledgers = {
+    False: make_ledger("LedgerString", False),
+    True: make_ledger("LedgerScaled", True),
+}
+
+
+def make_batch(model: Any, count: int) -> List[Any]:
+    """
+    Returns `count` instances of a ledger model with random values at column scale.
+
+    Parameters:
+        model (type): Ledger model class.
+        count (int): Number of instances.
+    """
+    random = Random(count)
+
+    return [
+        model(
+            id=n,
+            amount=Decimal(random.randint(-(10**8), 10**8)).scaleb(-2),
+            balance=Decimal(random.randint(0, 10**12)).scaleb(-2),
+            fee=Decimal(random.randint(0, 10**6)).scaleb(-4),
+            rate=Decimal(random.randint(0, 10**6)).scaleb(-6),
+        )
+        for n in range(count)
+    ]
+
+
+def main(count: int = 10000, number: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    Run the benchmark and return the size and encode and decode milliseconds of each
+    encoding.
+
+    Parameters:
+        count (int): Number of instances in the list argument.
+        number (int): Number of timeit repetitions.
+    """
+    results = {}
+
+    for serializer_name, serializer in [
+        ("json", JsonSerializer(batches=True, compiled=True)),
+        ("msgpack", MsgpackSerializer(batches=True, compiled=True)),
+    ]:
+        for scaled, model in ledgers.items():
+            args = Args(args=[make_batch(model, count)], kwargs={})
+            message = serializer.message_from_args(args)
+            encode = timeit(lambda: serializer.message_from_args(args), number=number)
+            decode = timeit(lambda: serializer.message_to_args(message), number=number)
+
+            results[f"{serializer_name} {'scaled' if scaled else 'string'}"] = {
+                "bytes": len(message),
+                "encode ms": encode / number * 1000,
+                "decode ms": decode / number * 1000,
+            }
+
+    return results
+
+
+if __name__ == "__main__":
+    for name, result in main().items():
+        print(
+            f"{name:<16} {result['bytes']:>10} bytes"
+            f" {result['encode ms']:8.2f} ms encode"
+            f" {result['decode ms']:8.2f} ms decode"
+        )
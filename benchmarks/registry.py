@@ -0,0 +1,65 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+"""
+Count schema builds and time worker-side decodes through the schema registry.
+
+    python -m benchmarks.registry
+"""
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.json import JsonSerializer
+
+from celery_sqlalchemy.types import Args
+
+from celery_sqlalchemy import model
+
+from .models import make_instances
+from .models import make_model
+
+# system imports
+from time import perf_counter
+
+from typing import Dict
+
+from unittest.mock import patch
+
+
+def main(decodes: int = 100_000, width: int = 20) -> Dict[str, float]:
+    """
+    Decode one message `decodes` times and return the schema build count and timing.
+
+    Parameters:
+        decodes (int): Number of decodes.
+        width (int): Number of model columns.
+    """
+    instance = make_instances(make_model(f"Registry{width}", width), 1)[0]
+    serializer = JsonSerializer()
+    message = serializer.message_from_args(Args(args=[instance], kwargs={}))
+
+    model.schema_maps.clear()
+    model.schema_models.clear()
+
+    with patch.object(model, "map_model", wraps=model.map_model) as map_model:
+        start = perf_counter()
+
+        for _ in range(decodes):
+            serializer.message_to_args(message)
+
+        seconds = perf_counter() - start
+
+    return {
+        "decodes": decodes,
+        "map_model calls": map_model.call_count,
+        "us/decode": seconds / decodes * 1_000_000,
+    }
+
+
+if __name__ == "__main__":
+    results = main()
+
+    for name, value in results.items():
+        print(f"{name:<16} {value:10.2f}")
+
+    assert results["map_model calls"] == 1, "schema registry missed"
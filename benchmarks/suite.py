@@ -0,0 +1,230 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+"""
+Measure the serializer across synthetic models covering every type in `type_maps`.
+
+Each case times `celery.serialize()`, `celery.deserialize()`, `arg_to_json()`,
+`arg_from_json()` and schema builds, and records the peak memory of one serialize and
+deserialize round trip. Results are written as JSON, and a run fails when any result
+regresses past the threshold against a baseline results file.
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --baseline results.json --threshold 0.25
+"""
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.json import JsonSerializer
+
+from celery_sqlalchemy.model import map_model
+
+from celery_sqlalchemy import celery
+from celery_sqlalchemy import json
+
+from .models import encode_fallback
+from .models import make_instances
+from .models import make_surface_model
+
+# system imports
+from argparse import ArgumentParser
+
+from timeit import Timer
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+import platform
+import sys
+import tracemalloc
+
+# dependency imports
+from celery import Celery
+
+from sqlalchemy import inspect
+
+import orjson
+import sqlalchemy
+
+Results = Dict[str, Dict[str, float]]
+
+serializers = {
+    "json": lambda: JsonSerializer(on_serialize_arg=encode_fallback),
+    "json-compiled": lambda: JsonSerializer(
+        compiled=True, on_serialize_arg=encode_fallback
+    ),
+}
+
+
+def compare(results: Results, baseline: Results, threshold: float) -> List[str]:
+    """
+    Returns a description of each result that regressed past the threshold.
+
+    Parameters:
+        results (dict): Results of this run.
+        baseline (dict): Results of the baseline run.
+        threshold (float): Allowed fractional increase over the baseline.
+    """
+    regressions = []
+
+    for case, metrics in results.items():
+        for metric, value in metrics.items():
+            previous = baseline.get(case, {}).get(metric)
+
+            if previous and value > previous * (1 + threshold):
+                regressions.append(
+                    f"{case} {metric}: {previous:.6g} -> {value:.6g}"
+                    f" (+{value / previous - 1:.0%})"
+                )
+
+    return regressions
+
+
+def measure(function: Callable[[], Any], repeat: int) -> float:
+    """
+    Returns the best seconds per call over `repeat` timing runs.
+
+    Parameters:
+        function (Callable): Function to time.
+        repeat (int): Number of timing runs.
+    """
+    timer = Timer(function)
+    number, _ = timer.autorange()
+
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def peak_memory(function: Callable[[], Any]) -> int:
+    """
+    Returns the peak number of bytes allocated by one call.
+
+    Parameters:
+        function (Callable): Function to measure.
+    """
+    tracemalloc.start()
+
+    try:
+        function()
+
+        return tracemalloc.get_traced_memory()[1]
+
+    finally:
+        tracemalloc.stop()
+
+
+def run(widths: List[int], counts: List[int], repeat: int = 3) -> Results:
+    """
+    Run every case and return its results keyed by case name.
+
+    Parameters:
+        widths (list): Model column counts.
+        counts (list): Instance counts of the list argument.
+        repeat (int): Number of timing runs per measurement.
+    """
+    results: Results = {}
+
+    for width in widths:
+        model = make_surface_model(f"Surface{width}", width)
+        mapper = inspect(model)
+
+        for compiled in (False, True):
+            results[f"schema/width={width}/compiled={compiled}"] = {
+                "build s": measure(
+                    lambda: map_model(model, mapper, json, compiled=compiled), repeat
+                )
+            }
+
+        for name, factory in serializers.items():
+            serializer = factory()
+
+            celery.initialize(Celery(), serializer, apply_serializer=False)
+
+            for count in counts:
+                instances = make_instances(model, count)
+                args: Tuple[List[Any], Dict[str, Any], Any] = ([instances], {}, None)
+                message = celery.serialize(args)
+                encoded = orjson.loads(
+                    orjson.dumps(
+                        [serializer.arg_to_json(i) for i in instances],
+                        default=encode_fallback,
+                    )
+                )
+
+                results[f"{name}/width={width}/count={count}"] = {
+                    "serialize s": measure(lambda: celery.serialize(args), repeat),
+                    "deserialize s": measure(
+                        lambda: celery.deserialize(message), repeat
+                    ),
+                    "arg_to_json s": measure(
+                        lambda: [serializer.arg_to_json(i) for i in instances],
+                        repeat,
+                    ),
+                    "arg_from_json s": measure(
+                        lambda: serializer.arg_from_json(encoded), repeat
+                    ),
+                    "message bytes": len(message),
+                    "peak bytes": peak_memory(
+                        lambda: celery.deserialize(celery.serialize(args))
+                    ),
+                }
+
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the suite from the command line and return its exit status.
+
+    Parameters:
+        argv (list): Command line arguments.
+    """
+    parser = ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--counts", default=[1, 100, 1000], nargs="+", type=int)
+    parser.add_argument("--output", help="file to write the results to")
+    parser.add_argument("--repeat", default=3, type=int)
+    parser.add_argument("--threshold", default=0.25, type=float)
+    parser.add_argument("--widths", default=[10, 60], nargs="+", type=int)
+
+    options = parser.parse_args(argv)
+    results = run(options.widths, options.counts, repeat=options.repeat)
+    report = {
+        "environment": {
+            "machine": platform.machine(),
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+        },
+        "results": results,
+    }
+
+    for case, metrics in results.items():
+        print(case)
+
+        for metric, value in metrics.items():
+            print(f"    {metric:<16} {value:14.6g}")
+
+    if options.output:
+        with open(options.output, "wb") as file:
+            file.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+
+    if options.baseline:
+        with open(options.baseline, "rb") as file:
+            baseline = orjson.loads(file.read())["results"]
+
+        regressions = compare(results, baseline, options.threshold)
+
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
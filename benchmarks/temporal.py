@@ -0,0 +1,153 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+"""
+Compare the ISO string and epoch integer encodings of temporal columns, with and
+without a message memo, on model batches of repeated and of unique values.
+
+    python -m benchmarks.temporal
+"""
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.json import JsonSerializer
+
+from celery_sqlalchemy.schema import EPOCH_TEMPORAL
+from celery_sqlalchemy.schema import MEMOIZE_TEMPORAL
+
+from celery_sqlalchemy.types import Args
+
+from .models import Base
+
+# system imports
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from datetime import timezone
+
+from random import Random
+
+from timeit import repeat
+
+from typing import Any
+from typing import Dict
+from typing import List
+
+# dependency imports
+from sqlalchemy import Column
+from sqlalchemy import Date
+from sqlalchemy import DateTime
+from sqlalchemy import Integer
+from sqlalchemy import Time
+
+
+def make_visit(name: str, epoch: bool, memoize: bool) -> Any:
+    """
+    Returns a synthetic visit model of three temporal columns.
+
+    Parameters:
+        name (str): Model class name.
+        epoch (bool): Serialize the temporal columns as epoch integers.
+        memoize (bool): Decode each repeated temporal value once per message.
+    """
+    info = {EPOCH_TEMPORAL: epoch, MEMOIZE_TEMPORAL: memoize}
+
+    return type(
+        name,
+        (Base,),
+        {
+            "__module__": __name__,
+            "__tablename__": name.lower(),
+            "id": Column(Integer, primary_key=True),
+            "created_at": Column(DateTime(timezone=True), info=info),
+            "day": Column(Date, info=info),
+            "opened": Column(Time, info=info),
+        },
+    )
+
+
+visits = {
+    "iso": make_visit("VisitIso", False, False),
+    "iso memo": make_visit("VisitIsoMemo", False, True),
+    "epoch": make_visit("VisitEpoch", True, False),
+    "epoch memo": make_visit("VisitEpochMemo", True, True),
+}
+
+
+def make_batch(model: Any, count: int, distinct: int) -> List[Any]:
+    """
+    Returns `count` instances of a visit model with `distinct` values per column.
+
+    Parameters:
+        model (type): Visit model class.
+        count (int): Number of instances.
+        distinct (int): Number of distinct values per column.
+    """
+    random = Random(count)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    values = [
+        start + timedelta(seconds=random.randrange(10**8), microseconds=n)
+        for n in range(distinct)
+    ]
+
+    return [
+        model(
+            id=n,
+            created_at=created_at,
+            day=created_at.date(),
+            opened=time(created_at.hour, created_at.minute, created_at.second),
+        )
+        for n, created_at in enumerate(random.choice(values) for _ in range(count))
+    ]
+
+
+def main(
+    count: int = 100000, number: int = 5
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Run the benchmark and return the size and best encode and decode milliseconds of
+    each encoding, on batches of repeated and of unique values.
+
+    Parameters:
+        count (int): Number of instances in the list argument.
+        number (int): Number of timeit repetitions.
+    """
+    serializer = JsonSerializer(batches=True, bypass_init=True, compiled=True)
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    for values, distinct in [("repeated", 100), ("unique", count)]:
+        results[values] = {}
+
+        for name, model in visits.items():
+            args = Args(args=[make_batch(model, count, distinct)], kwargs={})
+            message = serializer.message_from_args(args)
+            encode = min(
+                repeat(
+                    lambda: serializer.message_from_args(args), number=1, repeat=number
+                )
+            )
+            decode = min(
+                repeat(
+                    lambda: serializer.message_to_args(message), number=1, repeat=number
+                )
+            )
+
+            results[values][name] = {
+                "bytes": len(message),
+                "encode ms": encode * 1000,
+                "decode ms": decode * 1000,
+            }
+
+    return results
+
+
+if __name__ == "__main__":
+    for values, encodings in main().items():
+        print(values)
+
+        for name, result in encodings.items():
+            print(
+                f"  {name:<12} {result['bytes']:>10} bytes"
+                f" {result['encode ms']:8.2f} ms encode"
+                f" {result['decode ms']:8.2f} ms decode"
+            )
@@ -3,14 +3,27 @@
 # --------------------------------------------------------------------------------------
 
 # celery-sqlalchemy imports
+from .claim_check import check_in
+from .claim_check import check_out
+
+from .model import build_schemas
+
 from .types import Args
+from .types import BlobStore
+from .types import Measurement
 from .types import Message
 from .types import Serializer
+from .types import WarmUp
 
 from . import errors
 
 # system imports
+from functools import partial
+
+from time import perf_counter
+
 from typing import Any
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
@@ -24,7 +37,13 @@ from kombu import serialization
 
 import orjson
 
+__BLOB_STORE__: Optional[BlobStore] = None
+__BLOB_THRESHOLD__: int = 0
+__FALLBACK_MESSAGES__: int = 0
+__MEASUREMENT__: Optional[Callable[[Measurement], None]] = None
+__MIME_TYPES__: Dict[str, str] = {}
 __SERIALIZER__: Optional[Serializer] = None
+__SERIALIZERS__: Dict[str, Serializer] = {}
 
 
 def initialize(
@@ -32,35 +51,101 @@ def initialize(
     serializer: Serializer,
     apply_serializer: bool = True,
     content_type: str = "json+sqlalchemy",
-) -> None:
+    mime_type: str = "json",
+    content_encoding: str = "utf-8",
+    on_measurement: Optional[Callable[[Measurement], None]] = None,
+    models: Any = None,
+    blob_store: Optional[BlobStore] = None,
+    blob_threshold: int = 1048576,
+) -> Optional[WarmUp]:
     """
-    Initialize the celery module.
+    Initialize the celery module, returning the warm-up report when models are given.
+
+    Each content type is registered with its own serializer, so a process can
+    initialize several content types, such as a binary one for bulk queues and plain
+    JSON for the others. The serializer of the applied content type, or of the first
+    content type initialized, is the default used by `serialize()`, `deserialize()`
+    and `warm_up()`.
+
+    Kombu finds the decoder of a message by its mime type, so each content type needs
+    a mime type of its own.
 
     Parameters:
         celery (Celery): Celery instance.
         serializer (Serializer): Serializer instance.
         content_type (str): The content type to use for this serializer.
+        mime_type (str): The mime type messages are sent with.
+        content_encoding (str): The message content encoding, which is "binary" for
+                                binary serializers and serializers that compress
+                                messages.
+        on_measurement (Callback): Receives the timing and size of each serialized
+                                   and deserialized message.
+        models (object): Declarative base, mapper registry, or list of model classes
+                         and model paths to build the schemas of, see `warm_up()`.
+        blob_store (BlobStore): Stores messages of at least `blob_threshold` bytes,
+                                which are sent as a claim check referring to the
+                                stored message.
+        blob_threshold (int): Minimum size in bytes of messages sent as claim checks.
+
+    Raises:
+        SerializationError: If the mime type is registered to another content type.
     """
+    global __BLOB_STORE__
+    global __BLOB_THRESHOLD__
+    global __MEASUREMENT__
     global __SERIALIZER__
 
+    registered = __MIME_TYPES__.get(mime_type, content_type)
+
+    if registered != content_type:
+        # the decoder of the other content type would be replaced
+        raise errors.SerializationError(
+            f"Mime type {mime_type} is registered to {registered}"
+        )
+
+    if getattr(serializer, "compression", None):
+        # compressed messages are not text
+        content_encoding = "binary"
+
     serialization.register(
         content_type,
-        serialize,
-        deserialize,
-        "json",
+        partial(
+            serialize_args,
+            serializer,
+            on_measurement,
+            blob_store=blob_store,
+            blob_threshold=blob_threshold,
+        ),
+        partial(deserialize_message, serializer, on_measurement, blob_store=blob_store),
+        mime_type,
+        content_encoding,
     )
 
     if apply_serializer:
         celery.conf.accept_content = [content_type]
         celery.conf.result_accept_content = [content_type]
+        celery.conf.result_serializer = content_type
         celery.conf.task_serializer = content_type
 
-    __SERIALIZER__ = serializer
+    if apply_serializer or not __SERIALIZER__:
+        __BLOB_STORE__ = blob_store
+        __BLOB_THRESHOLD__ = blob_threshold
+        __MEASUREMENT__ = on_measurement
+        __SERIALIZER__ = serializer
+
+    __MIME_TYPES__[mime_type] = content_type
+    __SERIALIZERS__[content_type] = serializer
+
+    if models is not None:
+        return warm_up(models, serializer)
+
+    return None
 
 
 def deserialize(message: Message) -> Union[List[Any], str]:
     """
-    Deserialize a Celery message into its python equivalent.
+    Deserialize a Celery message into its python equivalent with the default
+    serializer.
 
     Parameters:
         message (Message): Message.
@@ -68,10 +153,110 @@ def deserialize(message: Message) -> Union[List[Any], str]:
     if not __SERIALIZER__:
         raise errors.SerializationError("Serializer has not been initialized")
 
-    try:
-        args = __SERIALIZER__.message_to_args(message)
+    return deserialize_message(
+        __SERIALIZER__, __MEASUREMENT__, message, blob_store=__BLOB_STORE__
+    )
+
+
+def deserialize_message(
+    serializer: Serializer,
+    on_measurement: Optional[Callable[[Measurement], None]],
+    message: Message,
+    blob_store: Optional[BlobStore] = None,
+) -> Union[List[Any], str]:
+    """
+    Deserialize a Celery message into its python equivalent.
+
+    Parameters:
+        serializer (Serializer): Serializer instance.
+        on_measurement (Callback): Receives the timing and size of the message.
+        message (Message): Message.
+        blob_store (BlobStore): Blob store that claim checks are fetched from.
+    """
+    global __FALLBACK_MESSAGES__
+
+    start = perf_counter() if on_measurement else 0.0
+    value = message_to_object(
+        serializer, check_out(message, blob_store) if blob_store else message
+    )
+
+    if on_measurement:
+        on_measurement(
+            Measurement(
+                operation="deserialize",
+                seconds=perf_counter() - start,
+                size=len(message),
+            )
+        )
+
+    if isinstance(value, Args):
+        return [value.args, value.kwargs, value.arg]
+
+    # celery message
+    __FALLBACK_MESSAGES__ += 1
+
+    return value
+
+
+def fallback_messages() -> int:
+    """
+    Returns the number of deserialized messages that were not task messages.
+    """
+    return __FALLBACK_MESSAGES__
+
+
+def get_serializer(content_type: Optional[str] = None) -> Serializer:
+    """
+    Returns the serializer initialized for a content type, or the default serializer.
+
+    Parameters:
+        content_type (str): The content type the serializer was initialized with.
+
+    Raises:
+        SerializationError: If no serializer has been initialized for the content type.
+    """
+    serializer = __SERIALIZERS__.get(content_type) if content_type else __SERIALIZER__
+
+    if not serializer:
+        raise errors.SerializationError("Serializer has not been initialized")
+
+    return serializer
+
+
+def message_from_object(serializer: Serializer, value: Any) -> Message:
+    """
+    Serialize a value that is not a task message with the `message_from_object()` of
+    the serializer, or with orjson when the serializer does not define it.
 
-        return [args.args, args.kwargs, args.arg]
+    Parameters:
+        serializer (Serializer): Serializer instance.
+        value (object): Any object type.
+    """
+    from_object = getattr(serializer, "message_from_object", None)
+
+    if from_object is None:
+        return orjson.dumps(value)
+
+    return from_object(value)
+
+
+def message_to_object(serializer: Serializer, message: Message) -> Any:
+    """
+    Deserialize a message with the `message_to_object()` of the serializer, or when the
+    serializer does not define it, into its arguments when it is a task message and
+    otherwise with orjson.
+
+    Parameters:
+        serializer (Serializer): Serializer instance.
+        message (Message): Message.
+    """
+    to_object = getattr(serializer, "message_to_object", None)
+
+    if to_object is not None:
+        return to_object(message)
+
+    try:
+        return serializer.message_to_args(message)
 
     except (KeyError, TypeError):
         # celery message
@@ -79,10 +264,11 @@ def deserialize(message: Message) -> Union[List[Any], str]:
 
 
 def serialize(
-    args: Union[Dict[str, Any], Tuple[List[Any], Dict[str, Any], Any]]
+    args: Union[Dict[str, Any], Tuple[List[Any], Dict[str, Any], Any]],
 ) -> Message:
     """
-    Serialize arguments into their Celery message equivalent.
+    Serialize arguments into their Celery message equivalent with the default
+    serializer.
 
     Parameters:
         args (dict | tuple): Task arguments.
@@ -90,12 +276,97 @@ def serialize(
     if not __SERIALIZER__:
         raise errors.SerializationError("Serializer has not been initialized")
 
+    return serialize_args(
+        __SERIALIZER__,
+        __MEASUREMENT__,
+        args,
+        blob_store=__BLOB_STORE__,
+        blob_threshold=__BLOB_THRESHOLD__,
+    )
+
+
+def serialize_args(
+    serializer: Serializer,
+    on_measurement: Optional[Callable[[Measurement], None]],
+    args: Union[Dict[str, Any], Tuple[List[Any], Dict[str, Any], Any]],
+    blob_store: Optional[BlobStore] = None,
+    blob_threshold: int = 0,
+) -> Message:
+    """
+    Serialize arguments into their Celery message equivalent.
+
+    Parameters:
+        serializer (Serializer): Serializer instance.
+        on_measurement (Callback): Receives the timing and size of the message.
+        args (dict | tuple): Task arguments.
+        blob_store (BlobStore): Stores messages of at least `blob_threshold` bytes,
+                                which are sent as a claim check.
+        blob_threshold (int): Minimum size in bytes of messages sent as claim checks.
+    """
+    start = perf_counter() if on_measurement else 0.0
+
     if isinstance(args, tuple):
         # task
-        return __SERIALIZER__.message_from_args(
+        message = serializer.message_from_args(
             Args(arg=args[2], args=args[0], kwargs=args[1])
         )
 
     else:
         # celery message
-        return orjson.dumps(args)
+        message = message_from_object(serializer, args)
+
+    if blob_store:
+        message = check_in(message, blob_store, blob_threshold)
+
+    if on_measurement:
+        on_measurement(
+            Measurement(
+                operation="serialize",
+                seconds=perf_counter() - start,
+                size=len(message),
+            )
+        )
+
+    return message
+
+
+def warm_up(models: Any, serializer: Optional[Serializer] = None) -> WarmUp:
+    """
+    Build the schemas of models before the first message, and return a report of the
+    number of models, the number of schemas built and the seconds taken.
+
+    Warming up before the worker pool forks lets prefork children inherit the built
+    schemas instead of mapping each model on its first message.
+
+    Parameters:
+        models (object): Declarative base, mapper registry, or list of model classes
+                         and model paths.
+        serializer (Serializer): Serializer to build the schemas for, which defaults to
+                                 the initialized serializer.
+
+    Raises:
+        SerializationError: If no serializer has been initialized, or the serializer
+                            has no interface module to build schemas for.
+    """
+    serializer = serializer or __SERIALIZER__
+
+    if not serializer:
+        raise errors.SerializationError("Serializer has not been initialized")
+
+    interface = getattr(serializer, "interface", None)
+
+    if not interface:
+        raise errors.SerializationError("Serializer does not build schemas")
+
+    start = perf_counter()
+    count, built = build_schemas(
+        models, interface, compiled=getattr(serializer, "compiled", False)
+    )
+    seconds = perf_counter() - start
+
+    if __MEASUREMENT__:
+        __MEASUREMENT__(
+            Measurement(operation="warm_up", seconds=seconds, instances=built)
+        )
+
+    return WarmUp(built=built, models=count, seconds=seconds)
@@ -0,0 +1,200 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from .types import BlobStore
+from .types import Message
+
+from . import errors
+
+# system imports
+from hashlib import blake2b
+
+from time import time
+
+from typing import Any
+from typing import Optional
+
+import mmap
+import os
+import re
+import tempfile
+
+CLAIM_CHECK_HEADER = b"\x00csc"
+
+key_pattern = re.compile(r"[0-9a-f]{64}")
+
+
+class FileBlobStore(BlobStore):
+    def __init__(self, directory: str, ttl: Optional[float] = 86400.0) -> None:
+        """
+        Initialize a blob store of one file per payload in a directory, which may be
+        a volume shared by producers and workers.
+
+        Parameters:
+            directory (str): Directory the payload files are written to.
+            ttl (float): Seconds a payload is kept after it was last stored, or None
+                         to keep payloads until they are removed.
+        """
+        self.directory = directory
+        self.ttl = ttl
+
+        os.makedirs(directory, exist_ok=True)
+
+    def cleanup(self, now: Optional[float] = None) -> int:
+        """
+        Remove the payloads, and the partial files of interrupted writes, that were last
+        stored more than `ttl` seconds ago, and return the number of files removed.
+
+        Parameters:
+            now (float): Current time in seconds since the epoch.
+        """
+        if self.ttl is None:
+            return 0
+
+        expires = (time() if now is None else now) - self.ttl
+        removed = 0
+
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < expires:
+                        os.unlink(entry.path)
+                        removed += 1
+
+                except FileNotFoundError:
+                    # removed by another worker
+                    pass
+
+        return removed
+
+    def get(self, key: str) -> Any:
+        """
+        Returns a read-only memory map of the payload stored under a key, or None when
+        the key is not stored.
+
+        Parameters:
+            key (str): Content hash of the payload.
+        """
+        try:
+            with open(self.path(key), "rb") as file:
+                if not os.fstat(file.fileno()).st_size:
+                    return b""
+
+                return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+        except FileNotFoundError:
+            return None
+
+    def path(self, key: str) -> str:
+        """
+        Returns the file path of the payload stored under a key.
+
+        Parameters:
+            key (str): Content hash of the payload.
+
+        Raises:
+            errors.SerializationError: If the key is not a content hash.
+        """
+        if not key_pattern.fullmatch(key):
+            raise errors.SerializationError(f"Invalid claim check key: {key!r}")
+
+        return os.path.join(self.directory, key)
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store a payload under a key unless it is already stored, in which case its ttl
+        restarts. New payloads are replaced into place atomically so that concurrent
+        readers never read a partial payload.
+
+        Parameters:
+            key (str): Content hash of the payload.
+            data (bytes): Payload.
+        """
+        path = self.path(key)
+
+        try:
+            os.utime(path)
+
+            return
+
+        except FileNotFoundError:
+            pass
+
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+
+            os.replace(temporary, path)
+
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+def check_in(message: Message, blob_store: BlobStore, threshold: int) -> Message:
+    """
+    Returns a claim check referring to the message stored in the blob store when the
+    message is at least `threshold` bytes long, otherwise the message unchanged.
+
+    The message is stored under its content hash, so the same message is stored once.
+
+    Parameters:
+        message (Message): Message.
+        blob_store (BlobStore): Blob store.
+        threshold (int): Minimum size in bytes of stored messages.
+    """
+    if len(message) < threshold:
+        return message
+
+    data = message.encode() if isinstance(message, str) else message
+    key = blake2b(data, digest_size=32).hexdigest()
+
+    blob_store.put(key, data)
+
+    return CLAIM_CHECK_HEADER + key.encode()
+
+
+def check_out(message: Message, blob_store: BlobStore) -> Any:
+    """
+    Returns the message a claim check refers to from the blob store, otherwise the
+    message unchanged.
+
+    Parameters:
+        message (Message): Message.
+        blob_store (BlobStore): Blob store.
+
+    Raises:
+        errors.SerializationError: If the message a claim check refers to is not
+                                   stored.
+    """
+    if not is_claim_check(message):
+        return message
+
+    key = message[len(CLAIM_CHECK_HEADER) :]
+
+    if isinstance(key, bytes):
+        key = key.decode()
+
+    data = blob_store.get(key)
+
+    if data is None:
+        raise errors.SerializationError(f"Claim check payload not found: {key}")
+
+    return data
+
+
+def is_claim_check(message: Message) -> bool:
+    """
+    Returns whether or not a message is a claim check.
+
+    Parameters:
+        message (Message): Message.
+    """
+    if isinstance(message, str):
+        return message.startswith(CLAIM_CHECK_HEADER.decode())
+
+    return message.startswith(CLAIM_CHECK_HEADER)
@@ -0,0 +1,216 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from .schema import Field
+from .schema import is_identity
+
+# system imports
+from keyword import iskeyword
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+
+
+def compile_attribute(field: Field) -> str:
+    """
+    Returns the source expression that reads a field from a model instance.
+
+    Parameters:
+        field (Field): Schema field.
+    """
+    if field.name.isidentifier() and not iskeyword(field.name):
+        return f"instance.{field.name}"
+
+    return f"getattr(instance, {field.name!r})"
+
+
+def compile_conversion(
+    n: int, field: Field, function: Callable, value: str, namespace: Dict[str, Any]
+) -> str:
+    """
+    Returns the source expression that converts a value, or the value itself when the
+    serialization function returns its value unchanged.
+
+    Parameters:
+        n (int): Field index.
+        field (Field): Schema field.
+        function (Callable): Serialization function.
+        value (str): Source expression of the value.
+        namespace (dict): Globals available to the compiled function.
+    """
+    if is_identity(function, field):
+        return value
+
+    namespace[f"field_{n}"] = field
+    namespace[f"convert_{n}"] = function
+
+    return f"convert_{n}(field_{n}, {value})"
+
+
+def compile_from_json(fields: List[Field], name: str = "from_json") -> Callable:
+    """
+    Returns a function that deserializes a JSON dict into model keyword arguments.
+
+    Values are indexed directly, falling back to `dict.get()` when any key is missing.
+    Only transforming fields call their serialization function.
+
+    Parameters:
+        fields (list): Schema fields.
+        name (str): Name used for the compiled function.
+    """
+    namespace: Dict[str, Any] = {}
+    present = []
+    missing = []
+
+    for n, field in enumerate(fields):
+        present_value = compile_conversion(
+            n, field, field.from_json, f"json[{field.name!r}]", namespace
+        )
+        missing_value = compile_conversion(
+            n, field, field.from_json, f"json.get({field.name!r})", namespace
+        )
+
+        present.append(f"            {field.name!r}: {present_value},")
+        missing.append(f"            {field.name!r}: {missing_value},")
+
+    lines = [
+        f"def {name}(json):",
+        "    try:",
+        "        return {",
+        *present,
+        "        }",
+        "    except KeyError:",
+        "        return {",
+        *missing,
+        "        }",
+    ]
+
+    return compile_function(name, lines, namespace)
+
+
+def compile_from_row(fields: List[Field], name: str = "from_row") -> Callable:
+    """
+    Returns a function that deserializes a JSON row, whose values are in schema field
+    order, into model keyword arguments.
+
+    Parameters:
+        fields (list): Schema fields.
+        name (str): Name used for the compiled function.
+    """
+    namespace: Dict[str, Any] = {}
+    lines = [f"def {name}(row):", "    return {"]
+
+    for n, field in enumerate(fields):
+        value = compile_conversion(n, field, field.from_json, f"row[{n}]", namespace)
+
+        lines.append(f"        {field.name!r}: {value},")
+
+    lines.append("    }")
+
+    return compile_function(name, lines, namespace)
+
+
+def compile_function(
+    name: str, lines: List[str], namespace: Dict[str, Any]
+) -> Callable:
+    """
+    Returns a function compiled from generated source lines.
+
+    Parameters:
+        name (str): Function name.
+        lines (list): Source lines.
+        namespace (dict): Globals available to the function.
+    """
+    exec(compile("\n".join(lines), f"<celery_sqlalchemy {name}>", "exec"), namespace)
+
+    return namespace[name]
+
+
+def compile_to_json(fields: List[Field], name: str = "to_json") -> Callable:
+    """
+    Returns a function that serializes a model instance into a JSON dict.
+
+    Loaded values are read straight from the instance dict, falling back to attribute
+    access when any value is missing so that expired or deferred columns still load.
+    Only transforming fields call their serialization function.
+
+    Parameters:
+        fields (list): Schema fields.
+        name (str): Name used for the compiled function.
+    """
+    namespace: Dict[str, Any] = {}
+    loaded = []
+    unloaded = []
+
+    for n, field in enumerate(fields):
+        loaded_value = compile_conversion(
+            n, field, field.to_json, f"values[{field.name!r}]", namespace
+        )
+        unloaded_value = compile_conversion(
+            n, field, field.to_json, compile_attribute(field), namespace
+        )
+
+        loaded.append(f"            {field.name!r}: {loaded_value},")
+        unloaded.append(f"            {field.name!r}: {unloaded_value},")
+
+    lines = [
+        f"def {name}(instance):",
+        "    values = instance.__dict__",
+        "    try:",
+        "        return {",
+        *loaded,
+        "        }",
+        "    except KeyError:",
+        "        return {",
+        *unloaded,
+        "        }",
+    ]
+
+    return compile_function(name, lines, namespace)
+
+
+def compile_to_row(fields: List[Field], name: str = "to_row") -> Callable:
+    """
+    Returns a function that serializes a model instance into a JSON row whose values
+    are in schema field order.
+
+    Loaded values are read straight from the instance dict, falling back to attribute
+    access when any value is missing.
+
+    Parameters:
+        fields (list): Schema fields.
+        name (str): Name used for the compiled function.
+    """
+    namespace: Dict[str, Any] = {}
+    loaded = []
+    unloaded = []
+
+    for n, field in enumerate(fields):
+        loaded_value = compile_conversion(
+            n, field, field.to_json, f"values[{field.name!r}]", namespace
+        )
+        unloaded_value = compile_conversion(
+            n, field, field.to_json, compile_attribute(field), namespace
+        )
+
+        loaded.append(f"            {loaded_value},")
+        unloaded.append(f"            {unloaded_value},")
+
+    lines = [
+        f"def {name}(instance):",
+        "    values = instance.__dict__",
+        "    try:",
+        "        return [",
+        *loaded,
+        "        ]",
+        "    except KeyError:",
+        "        return [",
+        *unloaded,
+        "        ]",
+    ]
+
+    return compile_function(name, lines, namespace)
@@ -0,0 +1,117 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from .types import Message
+
+from . import errors
+
+# system imports
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+
+import lzma
+import zlib
+
+COMPRESSION_HEADER = b"\x00csa"
+
+
+class Compressor(NamedTuple):
+    code: bytes
+    compress: Callable[[bytes, Optional[int]], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+def lzma_compress(data: bytes, level: Optional[int]) -> bytes:
+    return lzma.compress(data, preset=level)
+
+
+def zlib_compress(data: bytes, level: Optional[int]) -> bytes:
+    return zlib.compress(data, -1 if level is None else level)
+
+
+compressors: Dict[str, Compressor] = {
+    "lzma": Compressor(code=b"x", compress=lzma_compress, decompress=lzma.decompress),
+    "zlib": Compressor(code=b"z", compress=zlib_compress, decompress=zlib.decompress),
+}
+decompressors: Dict[int, Callable[[bytes], bytes]] = {
+    compressor.code[0]: compressor.decompress for compressor in compressors.values()
+}
+
+
+def compress(
+    message: Message, compression: str, threshold: int, level: Optional[int] = None
+) -> Message:
+    """
+    Returns the message compressed and prefixed with the compression header when it is
+    at least `threshold` bytes long and compressing makes it smaller, otherwise the
+    message unchanged.
+
+    Parameters:
+        message (Message): Message.
+        compression (str): Either "zlib" or "lzma".
+        threshold (int): Minimum size in bytes of compressed messages.
+        level (int): Compression level, or None for the default level.
+
+    Raises:
+        SerializationError: If the compression is unsupported.
+    """
+    if len(message) < threshold:
+        return message
+
+    compressor = compressors.get(compression)
+
+    if not compressor:
+        raise errors.SerializationError(f"Unsupported compression: {compression}")
+
+    data = message.encode() if isinstance(message, str) else message
+    compressed = compressor.compress(data, level)
+
+    if len(compressed) + len(COMPRESSION_HEADER) + 1 >= len(data):
+        return message
+
+    return COMPRESSION_HEADER + compressor.code + compressed
+
+
+def decompress(message: Any) -> Any:
+    """
+    Returns the message decompressed when it starts with the compression header,
+    otherwise the message unchanged.
+
+    Parameters:
+        message (Message): Message, or a memory view such as of a memory map.
+
+    Raises:
+        SerializationError: If the message was compressed with an unsupported
+                            compression.
+    """
+    if not is_compressed(message):
+        return message
+
+    code = len(COMPRESSION_HEADER)
+    decompressor = decompressors.get(message[code]) if len(message) > code else None
+
+    if not decompressor:
+        raise errors.SerializationError("Unsupported message compression")
+
+    return decompressor(message[code + 1 :])
+
+
+def is_compressed(message: Any) -> bool:
+    """
+    Returns whether or not a message starts with the compression header.
+
+    Parameters:
+        message (Message): Message, or a memory view such as of a memory map.
+    """
+    if isinstance(message, bytes):
+        return message.startswith(COMPRESSION_HEADER)
+
+    return (
+        isinstance(message, memoryview)
+        and message[: len(COMPRESSION_HEADER)] == COMPRESSION_HEADER
+    )
@@ -0,0 +1,121 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from .types import Measurement
+
+# system imports
+from collections import deque
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from math import ceil
+
+from threading import Lock
+
+from typing import Any
+from typing import Deque
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+@dataclass
+class Samples:
+    count: int = 0
+    instances: int = 0
+    seconds: float = 0.0
+    size: int = 0
+    timings: Deque[float] = field(default_factory=deque)
+
+
+class Aggregator:
+    def __init__(self, max_samples: int = 10_000) -> None:
+        """
+        Initialize an in-memory aggregator of measurements, which is passed as the
+        `on_measurement` callback of a serializer and `celery.initialize()`.
+
+        Parameters:
+            max_samples (int): Number of most recent timings kept per operation and
+                               model path for percentiles.
+        """
+        self.lock = Lock()
+        self.max_samples = max_samples
+        self.samples: Dict[Tuple[str, Optional[str]], Samples] = {}
+
+    def __call__(self, measurement: Measurement) -> None:
+        """
+        Record a measurement.
+
+        Parameters:
+            measurement (Measurement): Measurement.
+        """
+        key = (measurement.operation, measurement.model_path)
+
+        with self.lock:
+            samples = self.samples.get(key)
+
+            if samples is None:
+                samples = self.samples[key] = Samples(
+                    timings=deque(maxlen=self.max_samples)
+                )
+
+            samples.count += 1
+            samples.instances += measurement.instances
+            samples.seconds += measurement.seconds
+            samples.size += measurement.size or 0
+            samples.timings.append(measurement.seconds)
+
+    def reset(self) -> None:
+        """
+        Discard all recorded measurements.
+        """
+        with self.lock:
+            self.samples.clear()
+
+    def summary(
+        self, percentiles: Iterable[int] = (50, 90, 99)
+    ) -> Dict[str, Dict[Optional[str], Dict[str, Any]]]:
+        """
+        Returns the totals and timing percentiles of the recorded measurements by
+        operation and model path. Message measurements have no model path.
+
+        Parameters:
+            percentiles (list): Timing percentiles to include.
+        """
+        summary: Dict[str, Dict[Optional[str], Dict[str, Any]]] = {}
+
+        with self.lock:
+            items = [
+                (key, samples, sorted(samples.timings))
+                for key, samples in self.samples.items()
+            ]
+
+        for (operation, model_path), samples, timings in items:
+            summary.setdefault(operation, {})[model_path] = {
+                "count": samples.count,
+                "instances": samples.instances,
+                "seconds": samples.seconds,
+                "size": samples.size,
+                **{f"p{p}": percentile(timings, p) for p in percentiles},
+            }
+
+        return summary
+
+
+def percentile(values: List[float], p: float) -> float:
+    """
+    Returns the nearest-rank percentile of sorted values.
+
+    Parameters:
+        values (list): Sorted values.
+        p (float): Percentile between 0 and 100.
+    """
+    if not values:
+        return 0.0
+
+    return values[max(0, min(len(values), ceil(p / 100 * len(values))) - 1)]
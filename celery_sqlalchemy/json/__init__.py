@@ -3,11 +3,30 @@
 # --------------------------------------------------------------------------------------
 
 # celery-sqlalchemy imports
+from ..compression import compress
+from ..compression import compressors
+from ..compression import decompress
+
+from ..lazy import LazyModel
+from ..lazy import is_lazy
+from ..lazy import materialize
+
+from ..model import model_class
+from ..model import rehydrate_model
 from ..model import schema_for_model
 from ..model import schema_for_model_path
 from ..model import schema_map_key
+from ..model import values_from_json
+from ..model import values_from_row
+from ..model import values_to_json
+from ..model import values_to_row
+
+from ..schema import Schema
+
+from ..temporal import message_memo
 
 from ..types import Args
+from ..types import Measurement
 from ..types import Message
 from ..types import Serializer
 
@@ -16,45 +35,129 @@ from .. import errors
 # system imports
 from collections import namedtuple
 
+from contextvars import ContextVar
+
+from functools import partial
+
+from time import perf_counter
+
 from typing import Any
 from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 
 import sys
 
 # dependency imports
 from sqlalchemy.exc import NoInspectionAvailable
 
+from sqlalchemy.orm.attributes import set_committed_value
+
 from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy import tuple_
 
 import orjson
 
+BACKREF_KEY = "$ref$"
+FIELDS_KEY = "$fields$"
+IDENTITY_KEY = "$id$"
+INDEX_KEY = "$index$"
+OBJECT_KEY = "$object$"
+REFERENCE_KEY = "$pk$"
+RELATIONSHIPS_KEY = "$related$"
+ROWS_KEY = "$rows$"
+
+# seconds of the measured operations so far, which nested measurements are offset by
+measured_seconds: ContextVar[float] = ContextVar("measured_seconds", default=0.0)
+
+# values that are never models or hold models
+scalar_types = frozenset([bool, float, int, str, type(None)])
+
 
 class JsonSerializer(Serializer):
     def __init__(
         self,
+        batches: bool = False,
+        bypass_init: bool = False,
+        compiled: bool = False,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        compression_threshold: int = 65536,
+        deduplicate: bool = False,
         json_key: str = "$model_path$",
+        lazy: bool = False,
+        measure_size: bool = False,
         naive_utc: bool = True,
         passthrough_dataclass: bool = False,
+        references: bool = False,
+        relationship_depth: int = 0,
+        session_factory: Optional[Callable] = None,
         utc_z: bool = False,
         on_deserialize_arg: Optional[Callable] = None,
+        on_measurement: Optional[Callable[[Measurement], None]] = None,
         on_serialize_arg: Optional[Callable] = None,
     ) -> None:
         """
         Initialize the JSON module.
 
         Parameters:
+            batches (bool): Serialize lists of same-model instances as one header and
+                            one row of values per instance.
+            bypass_init (bool): Create models as if loaded from the database instead of
+                                calling their constructor.
+            compiled (bool): Compile a specialized encoder and decoder per schema.
+            compression (str): Compress messages with either "zlib" or "lzma".
+            compression_level (int): Compression level, or None for the default level.
+            compression_threshold (int): Minimum size in bytes of compressed messages.
+            deduplicate (bool): Serialize each model instance once per message and
+                                repeats of it as back-references.
             json_key (str): The key used to store the model path during serialization.
+            lazy (bool): Deserialize models as `LazyModel` proxies that deserialize
+                         each field when it is first read.
+            measure_size (bool): Measure the encoded size of each model encode, which
+                                 encodes each measured model a second time.
             naive_utc (bool): Enable orjson OPT_NAIVE_UTC.
             passthrough_dataclass (bool): Enable orjson OPT_PASSTHROUGH_DATACLASS.
+            references (bool): Serialize persistent models as model path and primary
+                               key references.
+            relationship_depth (int): Number of levels of already loaded
+                                      relationships serialized with each model.
+            session_factory (Callable): Returns the session used to load references.
             utc_z (bool): Enable orjson OPT_UTC_Z.
             on_deserialize_arg (Callback): Deserialization callback.
+            on_measurement (Callback): Receives the timing and size of each model
+                                       encode, decode and reference load.
             on_serialize_arg (Callback): Serialization callback.
+
+        Raises:
+            errors.SerializationError: If the compression is unsupported.
         """
+        if compression and compression not in compressors:
+            raise errors.SerializationError(f"Unsupported compression: {compression}")
+
+        self.batches = batches
+        self.bypass_init = bypass_init
+        self.compiled = compiled
+        self.compression = compression
+        self.compression_level = compression_level
+        self.compression_threshold = compression_threshold
+        self.deduplicate = deduplicate
         self.deserialize_arg = on_deserialize_arg
+        self.interface = sys.modules[__name__]
         self.json_key = json_key
+        self.lazy = lazy
+        self.measure_size = measure_size
+        self.measurement = on_measurement
         self.orjson_opts = 0
+        self.references = references
+        self.relationship_depth = relationship_depth
         self.serialize_arg = on_serialize_arg
+        self.session_factory = session_factory
 
         if naive_utc:
             self.orjson_opts |= orjson.OPT_NAIVE_UTC
@@ -65,30 +168,90 @@ class JsonSerializer(Serializer):
         if utc_z:
             self.orjson_opts |= orjson.OPT_UTC_Z
 
-    def arg_from_json(self, arg: Any) -> Any:
+    def arg_from_json(
+        self,
+        arg: Any,
+        references: Optional[Dict[Tuple, Any]] = None,
+        identities: Optional[Dict[int, Any]] = None,
+    ) -> Any:
         """
         Deserialize a JSON argument into its python equivalent.
 
         Parameters:
             arg (object): Any object type.
+            references (dict): Models loaded by `load_references()`.
+            identities (dict): Models deserialized so far in the message by identity.
+
+        Raises:
+            errors.SerializationError: If a back-reference refers to a model that has
+                                       not been deserialized in the message.
         """
         if isinstance(arg, dict) and self.json_key in arg:
-            schema = schema_for_model_path(arg[self.json_key], sys.modules[__name__])
+            if BACKREF_KEY in arg:
+                if not identities or arg[BACKREF_KEY] not in identities:
+                    raise errors.SerializationError(
+                        f"Unknown model back-reference: {arg[BACKREF_KEY]}"
+                    )
+
+                return identities[arg[BACKREF_KEY]]
+
+            if REFERENCE_KEY in arg:
+                if references is None:
+                    references = self.load_references(
+                        {arg[self.json_key]: [arg[REFERENCE_KEY]]}
+                    )
+
+                return references.get((arg[self.json_key], tuple(arg[REFERENCE_KEY])))
+
+            start = self.measure_start() if self.measurement else 0.0
+            schema = schema_for_model_path(
+                arg[self.json_key], self.interface, compiled=self.compiled
+            )
             model = (
                 schema.model
                 if isinstance(schema.model, type)
                 else schema.model.__class__
             )
 
-            return model(
-                **{
-                    field.name: field.from_json(field, arg.get(field.name))
-                    for field in schema.fields
-                }
-            )
+            if ROWS_KEY in arg:
+                models = self.batch_from_json(schema, model, arg)
+
+                if self.measurement:
+                    self.measure("decode", start, arg[self.json_key], len(models))
+
+                return models
+
+            if self.lazy and RELATIONSHIPS_KEY not in arg:
+                instance = LazyModel(self, schema, model, arg)
+
+            else:
+                if schema.from_json:
+                    values = schema.from_json(arg)
+
+                else:
+                    values = values_from_json(schema, arg)
+
+                if self.bypass_init:
+                    instance = rehydrate_model(model, values)
+
+                else:
+                    instance = model(**values)
+
+            if IDENTITY_KEY in arg and identities is not None:
+                identities[arg[IDENTITY_KEY]] = instance
+
+            if RELATIONSHIPS_KEY in arg:
+                self.relationships_from_json(
+                    instance, arg[RELATIONSHIPS_KEY], references, identities
+                )
+
+            if self.measurement:
+                self.measure("decode", start, arg[self.json_key], 1)
+
+            return instance
 
         elif isinstance(arg, list):
-            return [self.arg_from_json(item) for item in arg]
+            return [self.arg_from_json(item, references, identities) for item in arg]
 
         elif self.deserialize_arg:
             return self.deserialize_arg(arg)
@@ -96,28 +259,92 @@ class JsonSerializer(Serializer):
         else:
             return arg
 
-    def arg_to_json(self, arg: Any) -> Any:
+    def arg_to_json(self, arg: Any, identities: Optional[Dict[Any, int]] = None) -> Any:
         """
         Serialize a python argument into its JSON equivalent.
 
         Parameters:
             arg (object): Any object type.
+            identities (dict): Identities of the models serialized so far in the
+                               message, when deduplicating.
 
         Raises:
             errors.SerializationError: If the argument cannot be serialized.
         """
+        if is_lazy(arg):
+            if (
+                arg._lazy_instance is None
+                and identities is None
+                and arg._lazy_serializer.interface is self.interface
+                and arg._lazy_serializer.json_key == self.json_key
+            ):
+                # unchanged proxies are sent as they were received
+                return {
+                    key: value
+                    for key, value in arg._lazy_json.items()
+                    if key != IDENTITY_KEY
+                }
+
+            arg = materialize(arg)
+
         if hasattr(arg, "__table__"):
             try:
+                start = self.measure_start() if self.measurement else 0.0
                 instance_state = inspect(arg)
                 mapper = instance_state.mapper
-                schema = schema_for_model(arg, mapper, sys.modules[__name__])
+                schema = schema_for_model(
+                    arg, mapper, self.interface, compiled=self.compiled
+                )
 
-                json = {
-                    field.name: field.to_json(field, getattr(arg, field.name))
-                    for field in schema.fields
-                }
+                # only instances with an identity can be loaded again by the worker
+                if (
+                    self.references
+                    and schema.primary_key
+                    and instance_state.key is not None
+                ):
+                    primary_key = [
+                        field.to_json(field, getattr(arg, field.name))
+                        for field in schema.primary_key
+                    ]
 
-                json[self.json_key] = schema_map_key(arg)
+                    if None not in primary_key:
+                        json: Dict[str, Any] = {
+                            self.json_key: schema_map_key(arg),
+                            REFERENCE_KEY: primary_key,
+                        }
+
+                        if self.measurement:
+                            self.measure("encode", start, schema_map_key(arg), 1, json)
+
+                        return json
+
+                if identities is not None:
+                    identity, serialized = self.model_identity(
+                        arg, instance_state, identities
+                    )
+
+                    if serialized:
+                        return {
+                            self.json_key: schema_map_key(arg),
+                            BACKREF_KEY: identity,
+                        }
+
+                json = self.model_to_json(arg, schema)
+
+                if identities is not None:
+                    json[IDENTITY_KEY] = identity
+
+                if self.relationship_depth:
+                    self.relationships_to_json(
+                        instance_state,
+                        json,
+                        self.relationship_depth,
+                        {id(arg)},
+                        identities,
+                    )
+
+                if self.measurement:
+                    self.measure("encode", start, schema_map_key(arg), 1, json)
 
                 return json
 
@@ -134,6 +361,532 @@ class JsonSerializer(Serializer):
             f"Cannot serialize type '{arg.__class__.__name__}'"
         )
 
+    def batch_from_json(self, schema: Schema, model: Any, batch: Dict[str, Any]) -> Any:
+        """
+        Deserialize a JSON batch into a list of model instances.
+
+        Parameters:
+            schema (Schema): Model schema.
+            model (type): Model class.
+            batch (dict): JSON batch.
+        """
+        names = batch[FIELDS_KEY]
+        rows: Iterable[Dict[str, Any]]
+
+        if schema.from_row and names == list(schema.names):
+            rows = map(schema.from_row, batch[ROWS_KEY])
+
+        elif names == list(schema.names):
+            rows = (values_from_row(schema, row) for row in batch[ROWS_KEY])
+
+        else:
+            fields = schema.fields_by_name
+            header = [
+                (n, fields[name]) for n, name in enumerate(names) if name in fields
+            ]
+            rows = (
+                {field.name: field.from_json(field, row[n]) for n, field in header}
+                for row in batch[ROWS_KEY]
+            )
+
+        if self.bypass_init:
+            return [rehydrate_model(model, values) for values in rows]
+
+        return [model(**values) for values in rows]
+
+    def batch_to_json(self, arg: Any) -> Any:
+        """
+        Serialize lists of same-model instances into JSON batches, leaving other
+        arguments to be serialized by `arg_to_json()`.
+
+        Parameters:
+            arg (object): Any object type.
+        """
+        if not isinstance(arg, list) or not arg:
+            return arg
+
+        model = arg[0].__class__
+
+        if not hasattr(model, "__table__") or any(
+            item.__class__ is not model for item in arg
+        ):
+            if any(isinstance(item, list) for item in arg):
+                return [self.batch_to_json(item) for item in arg]
+
+            return arg
+
+        try:
+            start = self.measure_start() if self.measurement else 0.0
+            schema = schema_for_model(
+                model, inspect(model), self.interface, compiled=self.compiled
+            )
+
+        except NoInspectionAvailable:
+            return arg
+
+        if schema.to_row:
+            rows = [schema.to_row(item) for item in arg]
+
+        else:
+            rows = [values_to_row(schema, item) for item in arg]
+
+        batch = {
+            self.json_key: schema_map_key(model),
+            FIELDS_KEY: list(schema.names),
+            ROWS_KEY: rows,
+        }
+
+        if self.measurement:
+            self.measure("encode", start, schema_map_key(model), len(rows), batch)
+
+        return batch
+
+    def collect_references(self, arg: Any, references: Dict[str, List[Any]]) -> None:
+        """
+        Collect the model references in a JSON argument, grouped by model path.
+
+        Parameters:
+            arg (object): Any object type.
+            references (dict): Primary keys by model path.
+        """
+        if isinstance(arg, dict) and REFERENCE_KEY in arg:
+            references.setdefault(arg[self.json_key], []).append(arg[REFERENCE_KEY])
+
+        elif isinstance(arg, list):
+            for item in arg:
+                self.collect_references(item, references)
+
+    def index_arg(self, arg: Any, path: List[Any], index: List[List[Any]]) -> Any:
+        """
+        Returns an argument ready to be encoded, appending the paths of its models to
+        the index.
+
+        Arguments without models are returned as encoded by `plain_arg()`, without
+        looking through them for models.
+
+        Parameters:
+            arg (object): Any object type.
+            path (list): Keys and list positions leading to the argument.
+            index (list): Paths of the models found so far.
+        """
+        if type(arg) in scalar_types:
+            return arg
+
+        plain = self.plain_arg(arg)
+
+        if plain is not None:
+            return plain
+
+        # batch rows cannot hold back-references, references or relationships
+        if (
+            self.batches
+            and not self.deduplicate
+            and not self.references
+            and not self.relationship_depth
+        ):
+            arg = self.batch_to_json(arg)
+
+        self.index_models(arg, path, index)
+
+        return arg
+
+    def index_from_json(self, json: Dict[str, Any], index: List[List[Any]]) -> None:
+        """
+        Deserialize the values at the indexed paths of a parsed message in place.
+
+        Parameters:
+            json (dict): Parsed message.
+            index (list): Paths of the models in the message.
+        """
+        identities: Dict[int, Any] = {}
+        references = None
+
+        if self.references:
+            collected: Dict[str, List[Any]] = {}
+
+            for path in index:
+                value = json
+
+                for key in path:
+                    value = value[key]
+
+                self.collect_references(value, collected)
+
+            if collected:
+                references = self.load_references(collected)
+
+        for path in index:
+            parent = json
+
+            for key in path[:-1]:
+                parent = parent[key]
+
+            parent[path[-1]] = self.arg_from_json(
+                parent[path[-1]], references, identities
+            )
+
+    def index_models(self, value: Any, path: List[Any], index: List[List[Any]]) -> None:
+        """
+        Append the path of each model and batch in a value to the index, in the order
+        they are encoded, so that decoding replaces only the values at those paths.
+
+        Parameters:
+            value (object): Any object type.
+            path (list): Keys and list positions leading to the value.
+            index (list): Paths of the models found so far.
+        """
+        if isinstance(value, dict):
+            if self.json_key in value:
+                # batch
+                index.append(path.copy())
+                return
+
+            items: Iterable[Tuple[Any, Any]] = value.items()
+
+        elif isinstance(value, list) or type(value) is tuple or isinstance(value, set):
+            items = enumerate(value)
+
+        else:
+            if is_lazy(value) or hasattr(value, "__table__"):
+                index.append(path.copy())
+
+            return
+
+        for key, item in items:
+            item_type = type(item)
+
+            if item_type in scalar_types:
+                continue
+
+            elif hasattr(item_type, "__table__"):
+                index.append([*path, key])
+
+            else:
+                path.append(key)
+                self.index_models(item, path, index)
+                path.pop()
+
+    def load_references(self, references: Dict[str, List[Any]]) -> Dict[Tuple, Any]:
+        """
+        Load referenced models with one query per model.
+
+        Returns the loaded models keyed by model path and JSON primary key. Models that
+        no longer exist are left out.
+
+        Parameters:
+            references (dict): Primary keys by model path.
+
+        Raises:
+            errors.SerializationError: If no session factory has been set.
+        """
+        if not self.session_factory:
+            raise errors.SerializationError(
+                "Cannot load model references without a session factory"
+            )
+
+        session = self.session_factory()
+        models: Dict[Tuple, Any] = {}
+
+        for model_path, primary_keys in references.items():
+            start = self.measure_start() if self.measurement else 0.0
+            loaded = len(models)
+            schema = schema_for_model_path(
+                model_path, self.interface, compiled=self.compiled
+            )
+            model = model_class(schema.model)
+            keys = {
+                tuple(
+                    field.from_json(field, value)
+                    for field, value in zip(schema.primary_key, primary_key)
+                ): tuple(primary_key)
+                for primary_key in primary_keys
+            }
+            columns = [getattr(model, field.name) for field in schema.primary_key]
+
+            if len(columns) == 1:
+                clause = columns[0].in_([key[0] for key in keys])
+
+            else:
+                clause = tuple_(*columns).in_(list(keys))
+
+            for instance in session.execute(select(model).where(clause)).scalars():
+                key = tuple(
+                    getattr(instance, field.name) for field in schema.primary_key
+                )
+                models[(model_path, keys[key])] = instance
+
+            if self.measurement:
+                self.measure("load", start, model_path, len(models) - loaded)
+
+        return models
+
+    def measure(
+        self,
+        operation: str,
+        start: float,
+        model_path: str,
+        instances: int,
+        json: Optional[Any] = None,
+        size: Optional[int] = None,
+    ) -> None:
+        """
+        Send a measurement to the measurement callback.
+
+        The measured time excludes the time of the operations measured while this one
+        ran, such as the decode of related models, so nested time is recorded once.
+
+        The size is the given size, or else the length of the encoded JSON value, when
+        `measure_size` is set, which is only available when encoding and is not
+        included in the measured time.
+
+        Parameters:
+            operation (str): Either "encode", "decode" or "load".
+            start (float): `measure_start()` value when the operation started.
+            model_path (str): Full module and class name path.
+            instances (int): Number of model instances.
+            json (object): Encoded JSON value.
+            size (int): Size in bytes of the already encoded value.
+        """
+        measured = measured_seconds.get()
+        seconds = perf_counter() - measured - start
+
+        measured_seconds.set(measured + seconds)
+
+        if self.measurement:
+            if not self.measure_size:
+                size = None
+
+            elif size is None and json is not None:
+                size = len(self.dumps(json))
+
+            self.measurement(
+                Measurement(
+                    operation=operation,
+                    seconds=seconds,
+                    instances=instances,
+                    model_path=model_path,
+                    size=size,
+                )
+            )
+
+    def measure_start(self) -> float:
+        """
+        Returns the start of a measured operation, which is offset by the seconds
+        measured so far so that `measure()` can leave out the time of nested operations.
+        """
+        return perf_counter() - measured_seconds.get()
+
+    def model_identity(
+        self, arg: Any, instance_state: Any, identities: Dict[Any, int]
+    ) -> Tuple[int, bool]:
+        """
+        Returns the message identity of a model instance and whether it has already
+        been serialized in the message.
+
+        Instances are identified by object id and, once persistent, by identity key,
+        so separately loaded copies of the same row are serialized once.
+
+        Parameters:
+            arg (object): Model instance.
+            instance_state (InstanceState): State of the model instance.
+            identities (dict): Identities of the models serialized so far.
+        """
+        identity = identities.get(id(arg))
+
+        if identity is None and instance_state.key is not None:
+            identity = identities.get(instance_state.key)
+
+        if identity is not None:
+            return identity, True
+
+        identity = identities[id(arg)] = len(identities)
+
+        if instance_state.key is not None:
+            identities[instance_state.key] = identity
+
+        return identity, False
+
+    def model_to_json(self, arg: Any, schema: Schema) -> Dict[str, Any]:
+        """
+        Serialize the fields of a model instance into a JSON object.
+
+        Parameters:
+            arg (object): Model instance.
+            schema (Schema): Model schema.
+        """
+        if schema.to_json:
+            json = schema.to_json(arg)
+
+        else:
+            json = values_to_json(schema, arg)
+
+        json[self.json_key] = schema_map_key(arg)
+
+        return json
+
+    def plain_arg(self, arg: Any) -> Optional[Any]:
+        """
+        Returns an argument as an encoded fragment when orjson encodes it without
+        `arg_to_json()`, which means it holds no models, otherwise None.
+
+        Parameters:
+            arg (object): Any object type.
+        """
+        try:
+            return orjson.Fragment(self.dumps_plain(arg))
+
+        except TypeError:
+            return None
+
+    def plain_message(self, value: Any) -> Message:
+        """
+        Encode a value that holds no models into a whole message.
+
+        Parameters:
+            value (object): Any object type.
+
+        Raises:
+            TypeError: If the value holds a type that is not encoded without
+                       `arg_to_json()`.
+        """
+        return self.dumps_plain(value)
+
+    def relationships_from_json(
+        self,
+        instance: Any,
+        related: Dict[str, Any],
+        references: Optional[Dict[Tuple, Any]] = None,
+        identities: Optional[Dict[int, Any]] = None,
+    ) -> None:
+        """
+        Deserialize the relationships serialized by `relationships_to_json()` onto a
+        model instance.
+
+        Relationships are set as loaded values when bypassing the model constructor,
+        otherwise they are assigned like any other attribute. Relationships that no
+        longer exist on the model are ignored.
+
+        Parameters:
+            instance (object): Model instance.
+            related (dict): JSON relationship values by relationship name.
+            references (dict): Models loaded by `load_references()`.
+            identities (dict): Models deserialized so far in the message by identity.
+        """
+        relationships = inspect(instance).mapper.relationships
+
+        for key, json in related.items():
+            if key not in relationships:
+                continue
+
+            relationship = relationships[key]
+            value = self.arg_from_json(json, references, identities)
+
+            if (
+                relationship.uselist
+                and isinstance(relationship.collection_class, type)
+                and issubclass(relationship.collection_class, set)
+            ):
+                value = set(value)
+
+            if self.bypass_init:
+                set_committed_value(instance, key, value)
+
+            else:
+                setattr(instance, key, value)
+
+    def relationships_to_json(
+        self,
+        instance_state: Any,
+        json: Dict[str, Any],
+        depth: int,
+        ancestors: Set[int],
+        identities: Optional[Dict[Any, int]] = None,
+    ) -> None:
+        """
+        Serialize the already loaded relationships of a model instance into its JSON
+        object, without triggering a lazy load.
+
+        Related models are serialized with their own relationships until `depth`
+        levels have been serialized. Relationships leading back to a model on the
+        current path are left out unless deduplicating, in which case they are
+        serialized as back-references. Dictionary collections are left out.
+
+        Parameters:
+            instance_state (InstanceState): State of the model instance.
+            json (dict): JSON object of the model instance.
+            depth (int): Number of relationship levels left to serialize.
+            ancestors (set): Object ids of the models on the current path.
+            identities (dict): Identities of the models serialized so far in the
+                               message, when deduplicating.
+        """
+        related: Dict[str, Any] = {}
+
+        for relationship in instance_state.mapper.relationships:
+            key = relationship.key
+
+            if key not in instance_state.dict:
+                continue
+
+            value = instance_state.dict[key]
+
+            if value is None:
+                related[key] = None
+                continue
+
+            if isinstance(value, dict):
+                continue
+
+            items = list(value) if relationship.uselist else [value]
+
+            if identities is None and any(id(item) in ancestors for item in items):
+                continue
+
+            values = []
+
+            for item in items:
+                item_state = inspect(item)
+
+                if identities is not None:
+                    identity, serialized = self.model_identity(
+                        item, item_state, identities
+                    )
+
+                    if serialized:
+                        values.append(
+                            {
+                                self.json_key: schema_map_key(item),
+                                BACKREF_KEY: identity,
+                            }
+                        )
+                        continue
+
+                item_json = self.model_to_json(
+                    item,
+                    schema_for_model(
+                        item,
+                        item_state.mapper,
+                        self.interface,
+                        compiled=self.compiled,
+                    ),
+                )
+
+                if identities is not None:
+                    item_json[IDENTITY_KEY] = identity
+
+                if depth > 1:
+                    ancestors.add(id(item))
+                    self.relationships_to_json(
+                        item_state, item_json, depth - 1, ancestors, identities
+                    )
+                    ancestors.discard(id(item))
+
+                values.append(item_json)
+
+            related[key] = values if relationship.uselist else values[0]
+
+        if related:
+            json[RELATIONSHIPS_KEY] = related
+
     def message_from_args(self, args: Args) -> Message:
         """
         Serialize python arguments into their message equivalent.
@@ -141,49 +894,222 @@ class JsonSerializer(Serializer):
         Parameters:
             args (dict): Arguments.
         """
-        return orjson.dumps(
-            {
-                "$arg$": args.arg,
-                "$args$": args.args,
-                "$kwargs$": args.kwargs,
-            },
-            default=self.arg_to_json,
-            option=self.orjson_opts,
-        )
+        index: List[List[Any]] = []
+        json = {
+            "$arg$": self.index_arg(args.arg, ["$arg$"], index),
+            "$args$": (
+                [
+                    self.index_arg(arg_v, ["$args$", arg_n], index)
+                    for arg_n, arg_v in enumerate(args.args)
+                ]
+                if args.args
+                else args.args
+            ),
+            "$kwargs$": (
+                {
+                    arg_k: self.index_arg(arg_v, ["$kwargs$", arg_k], index)
+                    for arg_k, arg_v in args.kwargs.items()
+                }
+                if args.kwargs
+                else args.kwargs
+            ),
+        }
 
-    def message_to_args(self, message: Message) -> Args:
+        if index:
+            json[INDEX_KEY] = index
+
+        return self.compress_message(self.dumps(json))
+
+    def compress_message(self, message: Message) -> Message:
         """
-        Deserialize a message into its python equivalent.
+        Returns the message compressed when compression is enabled and the message is
+        at least the compression threshold, otherwise the message unchanged.
 
         Parameters:
             message (Message): Message.
         """
-        json = orjson.loads(message)
+        if not self.compression:
+            return message
+
+        return compress(
+            message,
+            self.compression,
+            self.compression_threshold,
+            self.compression_level,
+        )
+
+    def dumps(self, json: Any) -> Message:
+        """
+        Encode a JSON value into a message, serializing unsupported types with
+        `arg_to_json()`.
+
+        Parameters:
+            json (object): JSON value.
+        """
+        default = (
+            partial(self.arg_to_json, identities={})
+            if self.deduplicate
+            else self.arg_to_json
+        )
+
+        return orjson.dumps(json, default=default, option=self.orjson_opts)
+
+    def dumps_plain(self, json: Any) -> Message:
+        """
+        Encode a JSON value into a message without `arg_to_json()`.
+
+        Parameters:
+            json (object): JSON value.
+
+        Raises:
+            TypeError: If the value holds a type that orjson does not encode.
+        """
+        return orjson.dumps(json, option=self.orjson_opts)
+
+    def json_to_args(self, json: Dict[str, Any]) -> Args:
+        """
+        Deserialize a parsed task message into its python equivalent.
+
+        Task messages with an index of their models only have the values at the indexed
+        paths deserialized, which includes models nested in dicts. Other task messages,
+        and every task message when a deserialization callback is set, have their
+        arguments and the items of list arguments deserialized.
+
+        Parameters:
+            json (dict): Parsed task message.
+        """
+        # the deserialization callback is passed every argument that is not a model
+        index = None if self.deserialize_arg else json.get(INDEX_KEY)
+
+        if index is not None:
+            self.index_from_json(json, index)
+
+            return Args(arg=json["$arg$"], args=json["$args$"], kwargs=json["$kwargs$"])
+
+        identities: Dict[int, Any] = {}
+        references = None
+
+        if self.references:
+            collected: Dict[str, List[Any]] = {}
+
+            self.collect_references(json["$arg$"], collected)
+            self.collect_references(json["$args$"], collected)
+
+            for arg_v in (json["$kwargs$"] or {}).values():
+                self.collect_references(arg_v, collected)
+
+            if collected:
+                references = self.load_references(collected)
+
         args = Args(
-            arg=self.arg_from_json(json["$arg$"]),
+            arg=self.arg_from_json(json["$arg$"], references, identities),
             args=json["$args$"],
             kwargs=json["$kwargs$"],
         )
 
         if args.args:
             for arg_n, arg_v in enumerate(args.args):
-                args.args[arg_n] = self.arg_from_json(arg_v)
+                args.args[arg_n] = self.arg_from_json(arg_v, references, identities)
 
         if args.kwargs:
             for arg_k, arg_v in args.kwargs.items():
-                args.kwargs[arg_k] = self.arg_from_json(arg_v)
+                args.kwargs[arg_k] = self.arg_from_json(arg_v, references, identities)
 
         return args
 
+    def loads(self, message: Message) -> Any:
+        """
+        Decode a message into its JSON value.
+
+        Parameters:
+            message (Message): Message.
+        """
+        return orjson.loads(message)
+
+    def message_from_object(self, value: Any) -> Message:
+        """
+        Serialize a python value that is not a task message, such as a task result,
+        into its message equivalent.
+
+        Values holding models are serialized along with an index of their models, the
+        same as task arguments, with the items of dict values serialized as arguments
+        so that lists of same-model instances become batches.
+
+        Parameters:
+            value (object): Any object type.
+        """
+        try:
+            return self.compress_message(self.plain_message(value))
+
+        except TypeError:
+            pass
+
+        index: List[List[Any]] = []
+
+        if isinstance(value, dict):
+            json = {
+                value_k: self.index_arg(value_v, [OBJECT_KEY, value_k], index)
+                for value_k, value_v in value.items()
+            }
+
+        else:
+            json = self.index_arg(value, [OBJECT_KEY], index)
+
+        if not index:
+            return self.compress_message(self.dumps(value))
+
+        return self.compress_message(self.dumps({OBJECT_KEY: json, INDEX_KEY: index}))
+
+    def message_to_args(self, message: Message) -> Args:
+        """
+        Deserialize a message into its python equivalent.
+
+        Parameters:
+            message (Message): Message.
+        """
+        with message_memo():
+            return self.json_to_args(self.loads(decompress(message)))
+
+    def message_to_object(self, message: Message) -> Any:
+        """
+        Deserialize a message into its arguments when it is a task message, otherwise
+        into its python equivalent, with the models of the value deserialized.
+
+        Parameters:
+            message (Message): Message.
+        """
+        json = self.loads(decompress(message))
+
+        if (
+            isinstance(json, dict)
+            and "$args$" in json
+            and "$kwargs$" in json
+            and "$arg$" in json
+        ):
+            with message_memo():
+                return self.json_to_args(json)
+
+        if isinstance(json, dict) and OBJECT_KEY in json and INDEX_KEY in json:
+            with message_memo():
+                self.index_from_json(json, json[INDEX_KEY])
+
+            return json[OBJECT_KEY]
+
+        return json
+
 
 # --------------------------------------------------------------------------------------
 # Params helpers
 # --------------------------------------------------------------------------------------
 
 NumericParams = namedtuple(
-    "NumericParams", "precision scale decimal_return_scale asdecimal"
+    "NumericParams",
+    "precision scale decimal_return_scale asdecimal exponent factor",
+    defaults=(None, None),
 )
 
+TemporalParams = namedtuple("TemporalParams", "epoch memoize timezone")
+
 # --------------------------------------------------------------------------------------
 # Standard serialization functions
 # --------------------------------------------------------------------------------------
@@ -4,6 +4,10 @@
 
 # celery-sqlalchemy imports
 from ..schema import Field
+from ..schema import identity
+from ..schema import identity_when
+
+from ..temporal import is_text_temporal
 
 from . import sqlalchemy
 
@@ -16,6 +20,7 @@ from typing import Optional
 from sqlalchemy import Column
 
 
+@identity
 def postgresql_array_from_json(
     field: Field, value: Optional[List[Any]]
 ) -> Optional[List[Any]]:
@@ -26,12 +31,14 @@ def postgresql_array_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_array_to_json(
     field: Field, value: Optional[List[Any]]
 ) -> Optional[List[Any]]:
     return value
 
 
+@identity
 def postgresql_bit_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -40,10 +47,12 @@ def postgresql_bit_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_bit_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_bytea_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -52,10 +61,12 @@ def postgresql_bytea_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_bytea_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_cidr_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -64,10 +75,12 @@ def postgresql_cidr_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_cidr_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_citext_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -76,10 +89,12 @@ def postgresql_citext_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_citext_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_daterange_from_json(
     field: Field, value: Optional[List[Any]]
 ) -> Optional[List[Any]]:
@@ -90,12 +105,14 @@ def postgresql_daterange_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_daterange_to_json(
     field: Field, value: Optional[List[Any]]
 ) -> Optional[List[Any]]:
     return value
 
 
+@identity
 def postgresql_datemultirange_from_json(
     field: Field, value: Optional[List[Any]]
 ) -> Optional[List[Any]]:
@@ -106,12 +123,14 @@ def postgresql_datemultirange_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_datemultirange_to_json(
     field: Field, value: Optional[List[Any]]
 ) -> Optional[List[Any]]:
     return value
 
 
+@identity
 def postgresql_domain_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -120,10 +139,12 @@ def postgresql_domain_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_domain_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_double_precision_from_json(
     field: Field, value: Optional[Any]
 ) -> Optional[Any]:
@@ -134,12 +155,14 @@ def postgresql_double_precision_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_double_precision_to_json(
     field: Field, value: Optional[Any]
 ) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_enum_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -148,10 +171,12 @@ def postgresql_enum_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_enum_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_hstore_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -160,10 +185,12 @@ def postgresql_hstore_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_hstore_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_int4range_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -172,10 +199,12 @@ def postgresql_int4range_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_int4range_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_int4multirange_from_json(
     field: Field, value: Optional[Any]
 ) -> Optional[Any]:
@@ -186,12 +215,14 @@ def postgresql_int4multirange_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_int4multirange_to_json(
     field: Field, value: Optional[Any]
 ) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_int8range_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -200,10 +231,12 @@ def postgresql_int8range_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_int8range_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_int8multirange_from_json(
     field: Field, value: Optional[Any]
 ) -> Optional[Any]:
@@ -214,12 +247,14 @@ def postgresql_int8multirange_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_int8multirange_to_json(
     field: Field, value: Optional[Any]
 ) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_inet_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -228,10 +263,12 @@ def postgresql_inet_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_inet_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_interval_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -240,6 +277,7 @@ def postgresql_interval_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_interval_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -268,6 +306,7 @@ def postgresql_jsonb_to_json(field: Field, value: Optional[Any]) -> Optional[Any
     return sqlalchemy.json_to_json(field, value)
 
 
+@identity
 def postgresql_jsonpath_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -276,10 +315,12 @@ def postgresql_jsonpath_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_jsonpath_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_macaddr_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -288,10 +329,12 @@ def postgresql_macaddr_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_macaddr_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_macaddr8_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -300,10 +343,12 @@ def postgresql_macaddr8_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_macaddr8_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_money_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -312,10 +357,12 @@ def postgresql_money_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_money_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_numrange_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -324,10 +371,12 @@ def postgresql_numrange_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_numrange_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_nummultirange_from_json(
     field: Field, value: Optional[Any]
 ) -> Optional[Any]:
@@ -338,12 +387,14 @@ def postgresql_nummultirange_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_nummultirange_to_json(
     field: Field, value: Optional[Any]
 ) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_oid_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -352,10 +403,12 @@ def postgresql_oid_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_oid_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_real_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -364,10 +417,12 @@ def postgresql_real_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_real_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_regclass_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -376,10 +431,12 @@ def postgresql_regclass_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_regclass_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_regconfig_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -388,34 +445,38 @@ def postgresql_regconfig_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_regconfig_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
 def postgresql_time_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
-    return value
+    return sqlalchemy.time_from_json(field, value)
 
 
 def postgresql_time_params(column: Column) -> Any:
-    return
+    return sqlalchemy.time_params(column)
 
 
+@identity_when(is_text_temporal)
 def postgresql_time_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
-    return value
+    return sqlalchemy.time_to_json(field, value)
 
 
 def postgresql_timestamp_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
-    return value
+    return sqlalchemy.datetime_from_json(field, value)
 
 
 def postgresql_timestamp_params(column: Column) -> Any:
-    return
+    return sqlalchemy.datetime_params(column)
 
 
+@identity_when(is_text_temporal)
 def postgresql_timestamp_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
-    return value
+    return sqlalchemy.datetime_to_json(field, value)
 
 
+@identity
 def postgresql_tsquery_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -424,10 +485,12 @@ def postgresql_tsquery_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_tsquery_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_tsrange_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -436,10 +499,12 @@ def postgresql_tsrange_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_tsrange_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_tsmultirange_from_json(
     field: Field, value: Optional[Any]
 ) -> Optional[Any]:
@@ -450,12 +515,14 @@ def postgresql_tsmultirange_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_tsmultirange_to_json(
     field: Field, value: Optional[Any]
 ) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_tstzrange_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -464,10 +531,12 @@ def postgresql_tstzrange_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_tstzrange_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_tstzmultirange_from_json(
     field: Field, value: Optional[Any]
 ) -> Optional[Any]:
@@ -478,12 +547,14 @@ def postgresql_tstzmultirange_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_tstzmultirange_to_json(
     field: Field, value: Optional[Any]
 ) -> Optional[Any]:
     return value
 
 
+@identity
 def postgresql_tsvector_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -492,5 +563,6 @@ def postgresql_tsvector_params(column: Column) -> Any:
     return
 
 
+@identity
 def postgresql_tsvector_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
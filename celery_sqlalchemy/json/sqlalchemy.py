@@ -3,9 +3,29 @@
 # --------------------------------------------------------------------------------------
 
 # celery-sqlalchemy imports
+from ..raw_json import RawJson
+from ..raw_json import escape_raw_json
+from ..raw_json import load_raw_json
+
+from ..schema import EPOCH_TEMPORAL
+from ..schema import MEMOIZE_TEMPORAL
+from ..schema import SCALED_NUMERIC
 from ..schema import Field
+from ..schema import identity
+from ..schema import identity_when
+
+from ..temporal import date_from_epoch
+from ..temporal import date_to_epoch
+from ..temporal import datetime_from_epoch
+from ..temporal import datetime_from_epoch_utc
+from ..temporal import datetime_to_epoch
+from ..temporal import is_text_temporal
+from ..temporal import memoized
+from ..temporal import time_from_epoch
+from ..temporal import time_to_epoch
 
 from . import NumericParams
+from . import TemporalParams
 
 # system imports
 from datetime import date
@@ -14,8 +34,10 @@ from datetime import time
 from datetime import timedelta
 
 from decimal import Decimal
+from decimal import DefaultContext
 
 from typing import Any
+from typing import Callable
 from typing import List
 from typing import Optional
 from typing import Union
@@ -27,6 +49,7 @@ from uuid import UUID
 from sqlalchemy import Column
 
 
+@identity
 def array_from_json(field: Field, value: Optional[List[Any]]) -> Optional[List[Any]]:
     return value
 
@@ -35,10 +58,12 @@ def array_params(column: Column) -> Any:
     return
 
 
+@identity
 def array_to_json(field: Field, value: Optional[List[Any]]) -> Optional[List[Any]]:
     return value
 
 
+@identity
 def biginteger_from_json(field: Field, value: Optional[int]) -> Optional[int]:
     return value
 
@@ -47,10 +72,12 @@ def biginteger_params(column: Column) -> Any:
     return
 
 
+@identity
 def biginteger_to_json(field: Field, value: Optional[int]) -> Optional[int]:
     return value
 
 
+@identity
 def boolean_from_json(field: Field, value: Optional[bool]) -> Optional[bool]:
     return value
 
@@ -59,38 +86,80 @@ def boolean_params(column: Column) -> Any:
     return
 
 
+@identity
 def boolean_to_json(field: Field, value: Optional[bool]) -> Optional[bool]:
     return value
 
 
-def date_from_json(field: Field, value: Optional[str]) -> Optional[date]:
+def date_from_json(
+    field: Field[Optional[TemporalParams]], value: Optional[Any]
+) -> Optional[date]:
     if value is None:
         return None
 
-    return date.fromisoformat(value)
+    elif field.params is None:
+        # epoch integers of producers that encode the column as such
+        return (
+            date_from_epoch(value) if type(value) is int else date.fromisoformat(value)
+        )
 
+    decode: Callable[[Any], date] = (
+        date_from_epoch if type(value) is int else date.fromisoformat
+    )
 
-def date_params(column: Column) -> Any:
-    return
+    return memoized(decode, value) if field.params.memoize else decode(value)
 
 
-def date_to_json(field: Field, value: Optional[date]) -> Optional[date]:
-    return value
+def date_params(column: Column) -> Optional[TemporalParams]:
+    return temporal_params(column, False)
+
 
+@identity_when(is_text_temporal)
+def date_to_json(
+    field: Field[Optional[TemporalParams]], value: Optional[date]
+) -> Optional[Union[date, int]]:
+    if value is None or field.params is None or not field.params.epoch:
+        return value
 
-def datetime_from_json(field: Field, value: Optional[str]) -> Optional[datetime]:
+    return date_to_epoch(value)
+
+
+def datetime_from_json(
+    field: Field[Optional[TemporalParams]], value: Optional[Any]
+) -> Optional[datetime]:
     if value is None:
         return None
 
-    return datetime.fromisoformat(value)
+    elif field.params is None:
+        # epoch integers of producers that encode the column as such, taken as UTC
+        # the same as the ISO strings of naive datetimes
+        return (
+            datetime_from_epoch_utc(value)
+            if type(value) is int
+            else datetime.fromisoformat(value)
+        )
+
+    decode: Callable[[Any], datetime] = (
+        datetime.fromisoformat
+        if type(value) is not int
+        else (datetime_from_epoch_utc if field.params.timezone else datetime_from_epoch)
+    )
 
+    return memoized(decode, value) if field.params.memoize else decode(value)
 
-def datetime_params(column: Column) -> Any:
-    return
 
+def datetime_params(column: Column) -> Optional[TemporalParams]:
+    return temporal_params(column, bool(cast(Any, column.type).timezone))
 
-def datetime_to_json(field: Field, value: Optional[datetime]) -> Optional[datetime]:
-    return value
+
+@identity_when(is_text_temporal)
+def datetime_to_json(
+    field: Field[Optional[TemporalParams]], value: Optional[datetime]
+) -> Optional[Union[datetime, int]]:
+    if value is None or field.params is None or not field.params.epoch:
+        return value
+
+    return datetime_to_epoch(value)
 
 
 def double_from_json(
@@ -114,6 +183,7 @@ def double_to_json(
     return numeric_to_json(field, value)
 
 
+@identity
 def enum_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -122,6 +192,7 @@ def enum_params(column: Column) -> Any:
     return
 
 
+@identity
 def enum_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -147,6 +218,7 @@ def float_to_json(
     return numeric_to_json(field, value)
 
 
+@identity
 def integer_from_json(field: Field, value: Optional[int]) -> Optional[int]:
     return value
 
@@ -155,6 +227,7 @@ def integer_params(column: Column) -> Any:
     return
 
 
+@identity
 def integer_to_json(field: Field, value: Optional[int]) -> Optional[int]:
     return value
 
@@ -177,6 +250,7 @@ def interval_to_json(field: Field, value: Optional[timedelta]) -> Optional[List[
     return [value.days, value.seconds, value.microseconds]
 
 
+@identity
 def largebinary_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
@@ -185,12 +259,13 @@ def largebinary_params(column: Column) -> Any:
     return
 
 
+@identity
 def largebinary_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
     return value
 
 
 def json_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
-    return value
+    return load_raw_json(value)
 
 
 def json_params(column: Column) -> Any:
@@ -198,15 +273,21 @@ def json_params(column: Column) -> Any:
 
 
 def json_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
-    return value
+    if isinstance(value, RawJson):
+        return value.fragment()
+
+    return escape_raw_json(value)
 
 
 def numeric_from_json(
-    field: Field[NumericParams], value: Optional[Union[float, str]]
+    field: Field[NumericParams], value: Optional[Union[float, int, str]]
 ) -> Optional[Union[Decimal, float]]:
     if value is None:
         return None
 
+    elif field.params.exponent is not None and type(value) is int:
+        return field.params.exponent * value
+
     elif field.params.asdecimal:
         return Decimal(value)
 
@@ -215,20 +296,45 @@ def numeric_from_json(
 
 
 def numeric_params(column: Column) -> NumericParams:
+    precision = cast(Any, column.type).precision
+    scale = cast(Any, column.type).scale
+    # values of up to the default decimal precision are scaled without rounding
+    scalable = (
+        cast(Any, column.type).asdecimal
+        and isinstance(precision, int)
+        and isinstance(scale, int)
+        and precision <= DefaultContext.prec
+    )
+
+    # integers are decoded as scaled whether or not the column is scaled, since only
+    # producers that scale the column send its values as integers
     return NumericParams(
-        cast(Any, column.type).precision,
-        cast(Any, column.type).scale,
+        precision,
+        scale,
         cast(Any, column.type).decimal_return_scale,
         cast(Any, column.type).asdecimal,
+        Decimal(1).scaleb(-scale) if scalable else None,
+        (
+            Decimal(1).scaleb(scale)
+            if scalable and column.info.get(SCALED_NUMERIC)
+            else None
+        ),
     )
 
 
 def numeric_to_json(
     field: Field[NumericParams], value: Optional[Union[Decimal, float]]
-) -> Optional[Union[float, str]]:
+) -> Optional[Union[float, int, str]]:
     if value is None:
         return None
 
+    elif field.params.factor is not None:
+        try:
+            return round(field.params.factor * value)
+
+        except TypeError:
+            return round(field.params.factor * Decimal(str(value)))
+
     elif field.params.asdecimal:
         return str(round(value, field.params.scale))
 
@@ -236,6 +342,7 @@ def numeric_to_json(
         return cast(float, value)
 
 
+@identity
 def smallinteger_from_json(field: Field, value: Optional[int]) -> Optional[int]:
     return value
 
@@ -244,10 +351,12 @@ def smallinteger_params(column: Column) -> Any:
     return
 
 
+@identity
 def smallinteger_to_json(field: Field, value: Optional[int]) -> Optional[int]:
     return value
 
 
+@identity
 def string_from_json(field: Field, value: Optional[str]) -> Optional[str]:
     return value
 
@@ -256,10 +365,23 @@ def string_params(column: Column) -> Any:
     return
 
 
+@identity
 def string_to_json(field: Field, value: Optional[str]) -> Optional[str]:
     return value
 
 
+def temporal_params(column: Column, timezone: bool) -> Optional[TemporalParams]:
+    epoch = bool(column.info.get(EPOCH_TEMPORAL))
+    memoize = bool(column.info.get(MEMOIZE_TEMPORAL))
+
+    if not epoch and not memoize:
+        # ISO strings decoded as is
+        return None
+
+    return TemporalParams(epoch, memoize, timezone)
+
+
+@identity
 def text_from_json(field: Field, value: Optional[str]) -> Optional[str]:
     return value
 
@@ -268,25 +390,45 @@ def text_params(column: Column) -> Any:
     return
 
 
+@identity
 def text_to_json(field: Field, value: Optional[str]) -> Optional[str]:
     return value
 
 
-def time_from_json(field: Field, value: Optional[str]) -> Optional[time]:
+def time_from_json(
+    field: Field[Optional[TemporalParams]], value: Optional[Any]
+) -> Optional[time]:
     if value is None:
         return None
 
-    return time.fromisoformat(value)
+    elif field.params is None:
+        # epoch integers of producers that encode the column as such
+        return (
+            time_from_epoch(value) if type(value) is int else time.fromisoformat(value)
+        )
 
+    decode: Callable[[Any], time] = (
+        time_from_epoch if type(value) is int else time.fromisoformat
+    )
 
-def time_params(column: Column) -> Any:
-    return
+    return memoized(decode, value) if field.params.memoize else decode(value)
 
 
-def time_to_json(field: Field, value: Optional[time]) -> Optional[time]:
-    return value
+def time_params(column: Column) -> Optional[TemporalParams]:
+    return temporal_params(column, bool(cast(Any, column.type).timezone))
+
+
+@identity_when(is_text_temporal)
+def time_to_json(
+    field: Field[Optional[TemporalParams]], value: Optional[time]
+) -> Optional[Union[int, str, time]]:
+    if value is None or field.params is None or not field.params.epoch:
+        return value
+
+    return time_to_epoch(value)
 
 
+@identity
 def unicode_from_json(field: Field, value: Optional[str]) -> Optional[str]:
     return value
 
@@ -295,10 +437,12 @@ def unicode_params(column: Column) -> Any:
     return
 
 
+@identity
 def unicode_to_json(field: Field, value: Optional[str]) -> Optional[str]:
     return value
 
 
+@identity
 def unicodetext_from_json(field: Field, value: Optional[str]) -> Optional[str]:
     return value
 
@@ -307,6 +451,7 @@ def unicodetext_params(column: Column) -> Any:
     return
 
 
+@identity
 def unicodetext_to_json(field: Field, value: Optional[str]) -> Optional[str]:
     return value
 
@@ -322,5 +467,6 @@ def uuid_params(column: Column) -> Any:
     return
 
 
+@identity
 def uuid_to_json(field: Field, value: Optional[UUID]) -> Optional[UUID]:
     return value
@@ -0,0 +1,134 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from .model import rehydrate_model
+from .model import values_from_json
+
+from .schema import Schema
+
+# system imports
+from typing import Any
+from typing import Dict
+
+
+class LazyModel:
+    """
+    Proxy of a deserialized model instance that keeps the JSON object of the model and
+    deserializes each field the first time it is read.
+
+    The model instance is created on first use of any other attribute, such as when
+    the proxy is added to a session, when a relationship or method is used, or when an
+    attribute is set. From then on the proxy forwards every attribute to the instance.
+    """
+
+    __slots__ = (
+        "_lazy_instance",
+        "_lazy_json",
+        "_lazy_model",
+        "_lazy_schema",
+        "_lazy_serializer",
+        "_lazy_values",
+    )
+
+    def __init__(
+        self, serializer: Any, schema: Schema, model: Any, json: Dict[str, Any]
+    ) -> None:
+        """
+        Initialize the proxy.
+
+        Parameters:
+            serializer (JsonSerializer): Serializer that deserialized the model.
+            schema (Schema): Model schema.
+            model (type): Model class.
+            json (dict): JSON object of the model.
+        """
+        object.__setattr__(self, "_lazy_instance", None)
+        object.__setattr__(self, "_lazy_json", json)
+        object.__setattr__(self, "_lazy_model", model)
+        object.__setattr__(self, "_lazy_schema", schema)
+        object.__setattr__(self, "_lazy_serializer", serializer)
+        object.__setattr__(self, "_lazy_values", {})
+
+    @property  # type: ignore
+    def __class__(self) -> Any:
+        return self._lazy_model
+
+    def __delattr__(self, name: str) -> None:
+        delattr(materialize(self), name)
+
+    def __getattr__(self, name: str) -> Any:
+        if self._lazy_instance is None:
+            values = self._lazy_values
+
+            if name in values:
+                return values[name]
+
+            field = self._lazy_schema.fields_by_name.get(name)
+
+            if field is not None:
+                values[name] = value = field.from_json(field, self._lazy_json.get(name))
+
+                return value
+
+        return getattr(materialize(self), name)
+
+    def __repr__(self) -> str:
+        if self._lazy_instance is None:
+            return f"<LazyModel {self._lazy_model.__name__}>"
+
+        return repr(self._lazy_instance)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(materialize(self), name, value)
+
+
+def is_lazy(arg: Any) -> bool:
+    """
+    Returns whether or not an argument is a lazy model proxy.
+
+    Parameters:
+        arg (object): Any object type.
+    """
+    return type(arg) is LazyModel
+
+
+def materialize(arg: Any) -> Any:
+    """
+    Returns the model instance of a lazy model proxy, creating it if needed. Other
+    arguments are returned unchanged.
+
+    Fields already read through the proxy keep their deserialized values.
+
+    Parameters:
+        arg (object): Any object type.
+    """
+    if type(arg) is not LazyModel:
+        return arg
+
+    instance = object.__getattribute__(arg, "_lazy_instance")
+
+    if instance is None:
+        json = object.__getattribute__(arg, "_lazy_json")
+        model = object.__getattribute__(arg, "_lazy_model")
+        schema = object.__getattribute__(arg, "_lazy_schema")
+        serializer = object.__getattribute__(arg, "_lazy_serializer")
+
+        if schema.from_json:
+            values = schema.from_json(json)
+
+        else:
+            values = values_from_json(schema, json)
+
+        values.update(object.__getattribute__(arg, "_lazy_values"))
+
+        if serializer.bypass_init:
+            instance = rehydrate_model(model, values)
+
+        else:
+            instance = model(**values)
+
+        object.__setattr__(arg, "_lazy_instance", instance)
+
+    return instance
@@ -8,16 +8,34 @@ from . import postgresql_2_0
 from . import sqlalchemy_1_4
 from . import sqlalchemy_2_0
 
+from ..compiler import compile_from_json
+from ..compiler import compile_from_row
+from ..compiler import compile_to_json
+from ..compiler import compile_to_row
+
 from ..schema import Field
 from ..schema import Schema
+from ..schema import is_identity
 
 # system imports
+from hashlib import blake2b
+
 from importlib import import_module
 
+from operator import attrgetter
+
+from threading import Lock
+from threading import RLock
+
 from types import ModuleType
 
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Type
+from typing import Union
 from typing import cast
 
 # dependency imports
@@ -27,11 +45,51 @@ try:
 except Exception:
     DeclarativeBase = Any  # type: ignore
 
+from sqlalchemy.orm.attributes import instance_state
+from sqlalchemy.orm.instrumentation import manager_of_class
+
 from sqlalchemy.orm import Mapper
+from sqlalchemy.orm import configure_mappers
 
 from sqlalchemy import inspect
 
-schema_maps: Dict[str, Schema] = {}
+
+class SchemaRegistry:
+    def __init__(self) -> None:
+        """
+        Initialize a registry of schemas by interface module and model path, and by
+        interface module and model class.
+
+        Reads are plain dict lookups that never lock. Building a schema holds a lock
+        per interface module and model, so a model first used by several threads at
+        once is built by one of them while the others wait for its schema.
+        """
+        self.lock = Lock()
+        self.locks: Dict[Tuple[ModuleType, Any], RLock] = {}
+        self.maps: Dict[Tuple[ModuleType, str], Schema] = {}
+        self.models: Dict[Tuple[ModuleType, Any], Schema] = {}
+
+    def build_lock(self, interface: ModuleType, model: Any) -> RLock:
+        """
+        Returns the lock held while building the schema of a model.
+
+        Parameters:
+            interface (ModuleType): Serialization interface module.
+            model (type): Model class.
+        """
+        key = (interface, model)
+        lock = self.locks.get(key)
+
+        if lock is None:
+            with self.lock:
+                lock = self.locks.setdefault(key, RLock())
+
+        return lock
+
+
+registry = SchemaRegistry()
+schema_maps = registry.maps
+schema_models = registry.models
 type_maps = {
     **sqlalchemy_1_4.type_maps,
     **sqlalchemy_2_0.type_maps,
@@ -40,22 +98,82 @@ type_maps = {
 }
 
 
-def add_schema(model: DeclarativeBase, mapper: Mapper, interface: ModuleType) -> Schema:
+def add_schema(
+    model: Union[Type[DeclarativeBase], DeclarativeBase],
+    mapper: Mapper,
+    interface: ModuleType,
+    compiled: bool = False,
+) -> Schema:
     """
-    Returns a newly added schema.
+    Returns a newly added schema registered under both its model path and class.
+
+    Schemas are registered per interface module, since each interface maps the same
+    column types to different serialization functions.
 
     Parameters:
-        model (DeclarativeBase): Model class.
+        model (DeclarativeBase): Model class or instance.
         mapper (Mapper): Model mapper.
         interface (ModuleType): Serialization interface module.
+        compiled (bool): Compile the schema serialization functions.
     """
-    schema = map_model(model, mapper, interface)
+    model = model_class(model)
+    schema = map_model(model, mapper, interface, compiled=compiled)
 
-    schema_maps[schema_map_key(model)] = schema
+    schema_maps[(interface, schema_map_key(model))] = schema
+    schema_models[(interface, model)] = schema
 
     return schema
 
 
+def build_schemas(
+    models: Any, interface: ModuleType, compiled: bool = False
+) -> Tuple[int, int]:
+    """
+    Build the schemas of models that have not been built yet, and return the number
+    of models and the number of schemas built.
+
+    Parameters:
+        models (object): Declarative base, mapper registry, or list of model classes
+                         and model paths.
+        interface (ModuleType): Serialization interface module.
+        compiled (bool): Compile the schema serialization functions.
+    """
+    classes = model_classes(models)
+    built = 0
+
+    for model in classes:
+        schema = schema_models.get((interface, model))
+
+        if not schema or (compiled and not schema.to_json):
+            with registry.build_lock(interface, model):
+                schema = schema_models.get((interface, model))
+
+                if not schema or (compiled and not schema.to_json):
+                    add_schema(model, inspect(model), interface, compiled=compiled)
+                    built += 1
+
+    return len(classes), built
+
+
+def fields_getter(names: Tuple[str, ...]) -> Callable[[Any], Tuple]:
+    """
+    Returns a function that reads the named attributes of a model instance as a tuple
+    with one attribute access per name.
+
+    Parameters:
+        names (tuple): Field names.
+    """
+    if not names:
+        return lambda instance: ()
+
+    if len(names) == 1:
+        name = names[0]
+
+        return lambda instance: (getattr(instance, name),)
+
+    return cast(Callable[[Any], Tuple], attrgetter(*names))
+
+
 def load_model(model_path: str) -> DeclarativeBase:
     """
     Load a model from full its path name.
@@ -69,7 +187,44 @@ def load_model(model_path: str) -> DeclarativeBase:
     return cast(DeclarativeBase, getattr(module, model))
 
 
-def map_model(model: DeclarativeBase, mapper: Mapper, interface: ModuleType) -> Schema:
+def model_class(model: Union[Type[DeclarativeBase], DeclarativeBase]) -> Any:
+    """
+    Returns the class of a model class or instance.
+
+    Parameters:
+        model (DeclarativeBase): Model class or instance.
+    """
+    return model if isinstance(model, type) else model.__class__
+
+
+def model_classes(models: Any) -> List[Any]:
+    """
+    Returns the model classes of a declarative base or mapper registry, ordered by
+    model path, or of a list of model classes, instances and model paths.
+
+    Parameters:
+        models (object): Declarative base, mapper registry, or list of model classes
+                         and model paths.
+    """
+    registry = getattr(models, "registry", models)
+
+    if hasattr(registry, "mappers"):
+        return sorted(
+            (mapper.class_ for mapper in registry.mappers), key=schema_map_key
+        )
+
+    return [
+        load_model(model) if isinstance(model, str) else model_class(model)
+        for model in models
+    ]
+
+
+def map_model(
+    model: Union[Type[DeclarativeBase], DeclarativeBase],
+    mapper: Mapper,
+    interface: ModuleType,
+    compiled: bool = False,
+) -> Schema:
     """
     Map a model into its serialization and deserialization structure.
 
@@ -77,6 +232,7 @@ def map_model(model: DeclarativeBase, mapper: Mapper, interface: ModuleType) ->
         model (DeclarativeBase): Model class.
         mapper (Mapper): Model mapper.
         interface (ModuleType): Serialization interface module.
+        compiled (bool): Compile the schema serialization functions.
     """
     fields = []
 
@@ -95,51 +251,255 @@ def map_model(model: DeclarativeBase, mapper: Mapper, interface: ModuleType) ->
             )
         )
 
-    return Schema(fields=fields, model=model)
+    names = {field.name: field for field in fields}
+    primary_key = tuple(
+        names[column.name] for column in mapper.primary_key if column.name in names
+    )
+
+    return schema_from_fields(model, fields, primary_key, compiled=compiled)
+
+
+def rehydrate_model(model: Any, values: Dict[str, Any]) -> Any:
+    """
+    Returns a model instance populated as if it had been loaded from the database.
+
+    The mapped class constructor and its init events are bypassed and the values are
+    written straight into the instance dict without attribute history. Instances with
+    a complete primary key are given their identity key, which makes them detached
+    rather than transient.
+
+    Parameters:
+        model (type): Model class.
+        values (dict): Column values.
+    """
+    manager: Any = manager_of_class(model)
+    mapper = manager.mapper
+
+    if not mapper.configured:
+        configure_mappers()
+
+    instance = manager.new_instance()
+    instance.__dict__.update(values)
+    primary_key = tuple(values.get(column.name) for column in mapper.primary_key)
+
+    if None not in primary_key:
+        instance_state(instance).key = mapper.identity_key_from_primary_key(primary_key)
+
+    return instance
 
 
 def schema_for_model(
-    model: DeclarativeBase, mapper: Mapper, interface: ModuleType
+    model: Union[Type[DeclarativeBase], DeclarativeBase],
+    mapper: Mapper,
+    interface: ModuleType,
+    compiled: bool = False,
 ) -> Schema:
     """
     Returns the schema for a model.
 
     Parameters:
-        model (DeclarativeBase): Model class.
+        model (DeclarativeBase): Model class or instance.
         mapper (Mapper): Model mapper.
         interface (ModuleType): Serialization interface module.
+        compiled (bool): Compile the schema serialization functions.
     """
-    schema = schema_maps.get(schema_map_key(model))
+    schema = schema_models.get((interface, model_class(model)))
 
-    if not schema:
-        schema = add_schema(model, mapper, interface)
+    if not schema or (compiled and not schema.to_json):
+        with registry.build_lock(interface, model_class(model)):
+            schema = schema_models.get((interface, model_class(model)))
+
+            if not schema or (compiled and not schema.to_json):
+                schema = add_schema(model, mapper, interface, compiled=compiled)
 
     return schema
 
 
-def schema_for_model_path(model_path: str, interface: ModuleType) -> Schema:
+def schema_for_model_path(
+    model_path: str, interface: ModuleType, compiled: bool = False
+) -> Schema:
     """
     Returns the schema for a model path.
 
     Parameters:
         model_path (str): Full module and class name path.
         interface (ModuleType): Serialization interface module.
+        compiled (bool): Compile the schema serialization functions.
     """
-    schema = schema_maps.get(model_path)
+    schema = schema_maps.get((interface, model_path))
 
-    if not schema:
+    if not schema or (compiled and not schema.from_json):
         model = load_model(model_path)
-        mapper = cast(Mapper, inspect(model))
-        schema = add_schema(model, mapper, interface)
+        schema = schema_models.get((interface, model))
+
+        if not schema or (compiled and not schema.from_json):
+            with registry.build_lock(interface, model):
+                schema = schema_models.get((interface, model))
+
+                if not schema or (compiled and not schema.from_json):
+                    mapper = cast(Mapper, inspect(model))
+                    schema = add_schema(model, mapper, interface, compiled=compiled)
+
+        # model paths that alias the canonical path resolve without a reload
+        schema_maps[(interface, model_path)] = schema
 
     return schema
 
 
-def schema_map_key(model: DeclarativeBase) -> str:
+def schema_fingerprint(fields: List[Field]) -> str:
+    """
+    Returns a fingerprint of the field names, order, types and params of a schema, which
+    changes whenever the positional layout of its values does.
+
+    Parameters:
+        fields (list): Schema fields.
+    """
+    layout = "\n".join(
+        f"{field.name}:{field.type.__name__}:{field.params!r}" for field in fields
+    )
+
+    return blake2b(layout.encode(), digest_size=8).hexdigest()
+
+
+def schema_from_fields(
+    model: Union[Type[DeclarativeBase], DeclarativeBase],
+    fields: List[Field],
+    primary_key: Tuple[Field, ...],
+    compiled: bool = False,
+) -> Schema:
     """
-    Returns the schema map key for a model.
+    Returns the schema of mapped fields, splitting them into identity and transforming
+    fields.
 
     Parameters:
         model (DeclarativeBase): Model class.
+        fields (list): Schema fields.
+        primary_key (tuple): Primary key fields.
+        compiled (bool): Compile the schema serialization functions.
+    """
+    fingerprint = schema_fingerprint(fields)
+    from_json_transforms = tuple(
+        (n, field)
+        for n, field in enumerate(fields)
+        if not is_identity(field.from_json, field)
+    )
+    field_names = tuple(field.name for field in fields)
+    fields_by_name = {field.name: field for field in fields}
+    to_json_transforms = tuple(
+        (n, field)
+        for n, field in enumerate(fields)
+        if not is_identity(field.to_json, field)
+    )
+
+    if compiled:
+        return Schema(
+            fields=fields,
+            model=model,
+            fields_by_name=fields_by_name,
+            fingerprint=fingerprint,
+            from_json=compile_from_json(fields),
+            from_json_transforms=from_json_transforms,
+            from_row=compile_from_row(fields),
+            getter=fields_getter(field_names),
+            names=field_names,
+            primary_key=primary_key,
+            to_json=compile_to_json(fields),
+            to_json_transforms=to_json_transforms,
+            to_row=compile_to_row(fields),
+        )
+
+    return Schema(
+        fields=fields,
+        model=model,
+        fields_by_name=fields_by_name,
+        fingerprint=fingerprint,
+        from_json_transforms=from_json_transforms,
+        getter=fields_getter(field_names),
+        names=field_names,
+        primary_key=primary_key,
+        to_json_transforms=to_json_transforms,
+    )
+
+
+def schema_map_key(model: Union[Type[DeclarativeBase], DeclarativeBase]) -> str:
+    """
+    Returns the schema map key for a model, which is its canonical model path.
+
+    Parameters:
+        model (DeclarativeBase): Model class or instance.
+    """
+    model = model_class(model)
+
+    return f"{model.__module__}.{model.__name__}"
+
+
+def values_from_json(schema: Schema, json: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the model keyword arguments of a JSON dict.
+
+    Identity fields are copied as they are and only transforming fields call their
+    serialization function.
+
+    Parameters:
+        schema (Schema): Model schema.
+        json (dict): JSON dict.
+    """
+    values = dict(zip(schema.names, map(json.get, schema.names)))
+
+    for _, field in schema.from_json_transforms:
+        values[field.name] = field.from_json(field, values[field.name])
+
+    return values
+
+
+def values_from_row(schema: Schema, row: List[Any]) -> Dict[str, Any]:
+    """
+    Returns the model keyword arguments of a JSON row whose values are in schema field
+    order.
+
+    Parameters:
+        schema (Schema): Model schema.
+        row (list): JSON row.
+    """
+    values = dict(zip(schema.names, row))
+
+    for n, field in schema.from_json_transforms:
+        values[field.name] = field.from_json(field, row[n])
+
+    return values
+
+
+def values_to_json(schema: Schema, instance: Any) -> Dict[str, Any]:
+    """
+    Returns the JSON dict of a model instance.
+
+    All field values are read in bulk and only transforming fields call their
+    serialization function.
+
+    Parameters:
+        schema (Schema): Model schema.
+        instance (object): Model instance.
     """
-    return f"{model.__module__}.{model.__class__.__name__}"
+    row = schema.getter(instance) if schema.getter else ()
+    json = dict(zip(schema.names, row))
+
+    for n, field in schema.to_json_transforms:
+        json[field.name] = field.to_json(field, row[n])
+
+    return json
+
+
+def values_to_row(schema: Schema, instance: Any) -> List[Any]:
+    """
+    Returns the JSON row of a model instance whose values are in schema field order.
+
+    Parameters:
+        schema (Schema): Model schema.
+        instance (object): Model instance.
+    """
+    row = list(schema.getter(instance)) if schema.getter else []
+
+    for n, field in schema.to_json_transforms:
+        row[n] = field.to_json(field, row[n])
+
+    return row
@@ -0,0 +1,411 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from ..json import JsonSerializer
+
+from ..types import Measurement
+from ..types import Message
+
+# system imports
+from datetime import date
+from datetime import time
+
+from functools import partial
+
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+from uuid import UUID
+
+import sys
+
+# dependency imports
+import msgpack
+
+
+class MsgpackSerializer(JsonSerializer):
+    def __init__(
+        self,
+        batches: bool = False,
+        bypass_init: bool = False,
+        compiled: bool = False,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        compression_threshold: int = 65536,
+        deduplicate: bool = False,
+        json_key: str = "$model_path$",
+        lazy: bool = False,
+        measure_size: bool = False,
+        references: bool = False,
+        relationship_depth: int = 0,
+        session_factory: Optional[Callable] = None,
+        on_deserialize_arg: Optional[Callable] = None,
+        on_measurement: Optional[Callable[[Measurement], None]] = None,
+        on_serialize_arg: Optional[Callable] = None,
+    ) -> None:
+        """
+        Initialize the MessagePack module.
+
+        Models are mapped with binary-native serialization functions, so binary columns
+        are sent as raw bytes, UUIDs as 16 bytes and temporal values as integers.
+
+        Parameters:
+            batches (bool): Serialize lists of same-model instances as one header and
+                            one row of values per instance.
+            bypass_init (bool): Create models as if loaded from the database instead of
+                                calling their constructor.
+            compiled (bool): Compile a specialized encoder and decoder per schema.
+            compression (str): Compress messages with either "zlib" or "lzma".
+            compression_level (int): Compression level, or None for the default level.
+            compression_threshold (int): Minimum size in bytes of compressed messages.
+            deduplicate (bool): Serialize each model instance once per message and
+                                repeats of it as back-references.
+            json_key (str): The key used to store the model path during serialization.
+            lazy (bool): Deserialize models as `LazyModel` proxies that deserialize
+                         each field when it is first read.
+            measure_size (bool): Measure the encoded size of each model encode, which
+                                 encodes each measured model a second time.
+            references (bool): Serialize persistent models as model path and primary
+                               key references.
+            relationship_depth (int): Number of levels of already loaded
+                                      relationships serialized with each model.
+            session_factory (Callable): Returns the session used to load references.
+            on_deserialize_arg (Callback): Deserialization callback.
+            on_measurement (Callback): Receives the timing and size of each model
+                                       encode, decode and reference load.
+            on_serialize_arg (Callback): Serialization callback.
+
+        Raises:
+            errors.SerializationError: If the compression is unsupported.
+        """
+        super().__init__(
+            batches=batches,
+            bypass_init=bypass_init,
+            compiled=compiled,
+            compression=compression,
+            compression_level=compression_level,
+            compression_threshold=compression_threshold,
+            deduplicate=deduplicate,
+            json_key=json_key,
+            lazy=lazy,
+            measure_size=measure_size,
+            references=references,
+            relationship_depth=relationship_depth,
+            session_factory=session_factory,
+            on_deserialize_arg=on_deserialize_arg,
+            on_measurement=on_measurement,
+            on_serialize_arg=on_serialize_arg,
+        )
+
+        self.interface = sys.modules[__name__]
+
+    def arg_to_json(self, arg: Any, identities: Optional[Dict[Any, int]] = None) -> Any:
+        """
+        Serialize a python argument into its MessagePack equivalent.
+
+        Temporal values and UUIDs that are not model columns are serialized as ISO
+        8601 and hex strings.
+
+        Parameters:
+            arg (object): Any object type.
+            identities (dict): Identities of the models serialized so far in the
+                               message, when deduplicating.
+
+        Raises:
+            errors.SerializationError: If the argument cannot be serialized.
+        """
+        if isinstance(arg, (date, time)):
+            return arg.isoformat()
+
+        elif isinstance(arg, UUID):
+            return str(arg)
+
+        return super().arg_to_json(arg, identities)
+
+    def dumps(self, json: Any) -> Message:
+        """
+        Encode a value into a MessagePack message, serializing unsupported types with
+        `arg_to_json()`.
+
+        Parameters:
+            json (object): Value.
+        """
+        default = (
+            partial(self.arg_to_json, identities={})
+            if self.deduplicate
+            else self.arg_to_json
+        )
+
+        return self.pack(json, default)
+
+    def dumps_plain(self, json: Any) -> bytes:
+        """
+        Encode a value into a MessagePack message without `arg_to_json()`.
+
+        Parameters:
+            json (object): Value.
+
+        Raises:
+            TypeError: If the value holds a type that MessagePack does not encode.
+        """
+        return msgpack.packb(json, use_bin_type=True)
+
+    def loads(self, message: Message) -> Any:
+        """
+        Decode a MessagePack message into its value.
+
+        Parameters:
+            message (Message): Message.
+        """
+        return msgpack.unpackb(message, raw=False, strict_map_key=False)
+
+    def pack(self, json: Any, default: Callable[[Any], Any]) -> bytes:
+        """
+        Encode a value into MessagePack, embedding the arguments encoded by
+        `plain_arg()` as they are instead of encoding them again.
+
+        Encoded arguments are only looked for in dicts and in the lists that hold them
+        directly, down to the argument lists of a message.
+
+        Parameters:
+            json (object): Value.
+            default (Callable): Serializes the types MessagePack does not encode.
+        """
+        packer = msgpack.Packer(default=default, use_bin_type=True)
+
+        def pack(value: Any, depth: int) -> bytes:
+            if type(value) is PackedArg:
+                return value.message
+
+            if depth and type(value) is dict:
+                return packer.pack_map_header(len(value)) + b"".join(
+                    packer.pack(key) + pack(item, depth - 1)
+                    for key, item in value.items()
+                )
+
+            if depth and type(value) is list and PackedArg in map(type, value):
+                return packer.pack_array_header(len(value)) + b"".join(
+                    pack(item, 0) for item in value
+                )
+
+            return packer.pack(value)
+
+        return pack(json, 2)
+
+    def plain_arg(self, arg: Any) -> Optional[Any]:
+        """
+        Returns an argument as its encoded MessagePack when MessagePack encodes it
+        without `arg_to_json()`, which means it holds no models, otherwise None.
+
+        Parameters:
+            arg (object): Any object type.
+        """
+        try:
+            return PackedArg(self.dumps_plain(arg))
+
+        except TypeError:
+            return None
+
+
+class PackedArg:
+    """
+    Argument encoded by `MsgpackSerializer.plain_arg()`, which is embedded in the
+    message as is.
+    """
+
+    __slots__ = ("message",)
+
+    def __init__(self, message: bytes) -> None:
+        """
+        Initialize the argument.
+
+        Parameters:
+            message (bytes): Encoded argument.
+        """
+        self.message = message
+
+
+# --------------------------------------------------------------------------------------
+# Standard serialization functions
+# --------------------------------------------------------------------------------------
+
+from ..json.sqlalchemy import array_from_json  # noqa
+from ..json.sqlalchemy import array_params  # noqa
+from ..json.sqlalchemy import array_to_json  # noqa
+from ..json.sqlalchemy import biginteger_from_json  # noqa
+from ..json.sqlalchemy import biginteger_params  # noqa
+from ..json.sqlalchemy import biginteger_to_json  # noqa
+from ..json.sqlalchemy import boolean_from_json  # noqa
+from ..json.sqlalchemy import boolean_params  # noqa
+from ..json.sqlalchemy import boolean_to_json  # noqa
+from .sqlalchemy import date_from_json  # noqa
+from .sqlalchemy import date_params  # noqa
+from .sqlalchemy import date_to_json  # noqa
+from .sqlalchemy import datetime_from_json  # noqa
+from .sqlalchemy import datetime_params  # noqa
+from .sqlalchemy import datetime_to_json  # noqa
+from ..json.sqlalchemy import double_from_json  # noqa
+from ..json.sqlalchemy import double_params  # noqa
+from ..json.sqlalchemy import double_to_json  # noqa
+from ..json.sqlalchemy import enum_from_json  # noqa
+from ..json.sqlalchemy import enum_params  # noqa
+from ..json.sqlalchemy import enum_to_json  # noqa
+from ..json.sqlalchemy import float_from_json  # noqa
+from ..json.sqlalchemy import float_params  # noqa
+from ..json.sqlalchemy import float_to_json  # noqa
+from ..json.sqlalchemy import integer_from_json  # noqa
+from ..json.sqlalchemy import integer_params  # noqa
+from ..json.sqlalchemy import integer_to_json  # noqa
+from .sqlalchemy import interval_from_json  # noqa
+from .sqlalchemy import interval_params  # noqa
+from .sqlalchemy import interval_to_json  # noqa
+from ..json.sqlalchemy import largebinary_from_json  # noqa
+from ..json.sqlalchemy import largebinary_params  # noqa
+from ..json.sqlalchemy import largebinary_to_json  # noqa
+from .sqlalchemy import json_from_json  # noqa
+from .sqlalchemy import json_params  # noqa
+from .sqlalchemy import json_to_json  # noqa
+from ..json.sqlalchemy import numeric_from_json  # noqa
+from ..json.sqlalchemy import numeric_params  # noqa
+from ..json.sqlalchemy import numeric_to_json  # noqa
+from ..json.sqlalchemy import smallinteger_from_json  # noqa
+from ..json.sqlalchemy import smallinteger_params  # noqa
+from ..json.sqlalchemy import smallinteger_to_json  # noqa
+from ..json.sqlalchemy import string_from_json  # noqa
+from ..json.sqlalchemy import string_params  # noqa
+from ..json.sqlalchemy import string_to_json  # noqa
+from ..json.sqlalchemy import text_from_json  # noqa
+from ..json.sqlalchemy import text_params  # noqa
+from ..json.sqlalchemy import text_to_json  # noqa
+from .sqlalchemy import time_from_json  # noqa
+from .sqlalchemy import time_params  # noqa
+from .sqlalchemy import time_to_json  # noqa
+from ..json.sqlalchemy import unicode_from_json  # noqa
+from ..json.sqlalchemy import unicode_params  # noqa
+from ..json.sqlalchemy import unicode_to_json  # noqa
+from ..json.sqlalchemy import unicodetext_from_json  # noqa
+from ..json.sqlalchemy import unicodetext_params  # noqa
+from ..json.sqlalchemy import unicodetext_to_json  # noqa
+from .sqlalchemy import uuid_from_json  # noqa
+from .sqlalchemy import uuid_params  # noqa
+from .sqlalchemy import uuid_to_json  # noqa
+
+# --------------------------------------------------------------------------------------
+# PostgreSQL serialization functions
+# --------------------------------------------------------------------------------------
+
+from ..json.postgresql import postgresql_array_from_json  # noqa
+from ..json.postgresql import postgresql_array_params  # noqa
+from ..json.postgresql import postgresql_array_to_json  # noqa
+from ..json.postgresql import postgresql_bit_from_json  # noqa
+from ..json.postgresql import postgresql_bit_params  # noqa
+from ..json.postgresql import postgresql_bit_to_json  # noqa
+from ..json.postgresql import postgresql_bytea_from_json  # noqa
+from ..json.postgresql import postgresql_bytea_params  # noqa
+from ..json.postgresql import postgresql_bytea_to_json  # noqa
+from ..json.postgresql import postgresql_cidr_from_json  # noqa
+from ..json.postgresql import postgresql_cidr_params  # noqa
+from ..json.postgresql import postgresql_cidr_to_json  # noqa
+from ..json.postgresql import postgresql_citext_from_json  # noqa
+from ..json.postgresql import postgresql_citext_params  # noqa
+from ..json.postgresql import postgresql_citext_to_json  # noqa
+from ..json.postgresql import postgresql_daterange_from_json  # noqa
+from ..json.postgresql import postgresql_daterange_params  # noqa
+from ..json.postgresql import postgresql_daterange_to_json  # noqa
+from ..json.postgresql import postgresql_datemultirange_from_json  # noqa
+from ..json.postgresql import postgresql_datemultirange_params  # noqa
+from ..json.postgresql import postgresql_datemultirange_to_json  # noqa
+from ..json.postgresql import postgresql_domain_from_json  # noqa
+from ..json.postgresql import postgresql_domain_params  # noqa
+from ..json.postgresql import postgresql_domain_to_json  # noqa
+from ..json.postgresql import postgresql_double_precision_from_json  # noqa
+from ..json.postgresql import postgresql_double_precision_params  # noqa
+from ..json.postgresql import postgresql_double_precision_to_json  # noqa
+from ..json.postgresql import postgresql_enum_from_json  # noqa
+from ..json.postgresql import postgresql_enum_params  # noqa
+from ..json.postgresql import postgresql_enum_to_json  # noqa
+from ..json.postgresql import postgresql_hstore_from_json  # noqa
+from ..json.postgresql import postgresql_hstore_params  # noqa
+from ..json.postgresql import postgresql_hstore_to_json  # noqa
+from ..json.postgresql import postgresql_int4range_from_json  # noqa
+from ..json.postgresql import postgresql_int4range_params  # noqa
+from ..json.postgresql import postgresql_int4range_to_json  # noqa
+from ..json.postgresql import postgresql_int4multirange_from_json  # noqa
+from ..json.postgresql import postgresql_int4multirange_params  # noqa
+from ..json.postgresql import postgresql_int4multirange_to_json  # noqa
+from ..json.postgresql import postgresql_int8range_from_json  # noqa
+from ..json.postgresql import postgresql_int8range_params  # noqa
+from ..json.postgresql import postgresql_int8range_to_json  # noqa
+from ..json.postgresql import postgresql_int8multirange_from_json  # noqa
+from ..json.postgresql import postgresql_int8multirange_params  # noqa
+from ..json.postgresql import postgresql_int8multirange_to_json  # noqa
+from ..json.postgresql import postgresql_inet_from_json  # noqa
+from ..json.postgresql import postgresql_inet_params  # noqa
+from ..json.postgresql import postgresql_inet_to_json  # noqa
+from .postgresql import postgresql_interval_from_json  # noqa
+from .postgresql import postgresql_interval_params  # noqa
+from .postgresql import postgresql_interval_to_json  # noqa
+from .postgresql import postgresql_json_from_json  # noqa
+from .postgresql import postgresql_json_params  # noqa
+from .postgresql import postgresql_json_to_json  # noqa
+from .postgresql import postgresql_jsonb_from_json  # noqa
+from .postgresql import postgresql_jsonb_params  # noqa
+from .postgresql import postgresql_jsonb_to_json  # noqa
+from ..json.postgresql import postgresql_jsonpath_from_json  # noqa
+from ..json.postgresql import postgresql_jsonpath_params  # noqa
+from ..json.postgresql import postgresql_jsonpath_to_json  # noqa
+from ..json.postgresql import postgresql_macaddr_from_json  # noqa
+from ..json.postgresql import postgresql_macaddr_params  # noqa
+from ..json.postgresql import postgresql_macaddr_to_json  # noqa
+from ..json.postgresql import postgresql_macaddr8_from_json  # noqa
+from ..json.postgresql import postgresql_macaddr8_params  # noqa
+from ..json.postgresql import postgresql_macaddr8_to_json  # noqa
+from ..json.postgresql import postgresql_money_from_json  # noqa
+from ..json.postgresql import postgresql_money_params  # noqa
+from ..json.postgresql import postgresql_money_to_json  # noqa
+from ..json.postgresql import postgresql_numrange_from_json  # noqa
+from ..json.postgresql import postgresql_numrange_params  # noqa
+from ..json.postgresql import postgresql_numrange_to_json  # noqa
+from ..json.postgresql import postgresql_nummultirange_from_json  # noqa
+from ..json.postgresql import postgresql_nummultirange_params  # noqa
+from ..json.postgresql import postgresql_nummultirange_to_json  # noqa
+from ..json.postgresql import postgresql_oid_from_json  # noqa
+from ..json.postgresql import postgresql_oid_params  # noqa
+from ..json.postgresql import postgresql_oid_to_json  # noqa
+from ..json.postgresql import postgresql_real_from_json  # noqa
+from ..json.postgresql import postgresql_real_params  # noqa
+from ..json.postgresql import postgresql_real_to_json  # noqa
+from ..json.postgresql import postgresql_regclass_from_json  # noqa
+from ..json.postgresql import postgresql_regclass_params  # noqa
+from ..json.postgresql import postgresql_regclass_to_json  # noqa
+from ..json.postgresql import postgresql_regconfig_from_json  # noqa
+from ..json.postgresql import postgresql_regconfig_params  # noqa
+from ..json.postgresql import postgresql_regconfig_to_json  # noqa
+from .postgresql import postgresql_time_from_json  # noqa
+from .postgresql import postgresql_time_params  # noqa
+from .postgresql import postgresql_time_to_json  # noqa
+from .postgresql import postgresql_timestamp_from_json  # noqa
+from .postgresql import postgresql_timestamp_params  # noqa
+from .postgresql import postgresql_timestamp_to_json  # noqa
+from ..json.postgresql import postgresql_tsquery_from_json  # noqa
+from ..json.postgresql import postgresql_tsquery_params  # noqa
+from ..json.postgresql import postgresql_tsquery_to_json  # noqa
+from ..json.postgresql import postgresql_tsrange_from_json  # noqa
+from ..json.postgresql import postgresql_tsrange_params  # noqa
+from ..json.postgresql import postgresql_tsrange_to_json  # noqa
+from ..json.postgresql import postgresql_tsmultirange_from_json  # noqa
+from ..json.postgresql import postgresql_tsmultirange_params  # noqa
+from ..json.postgresql import postgresql_tsmultirange_to_json  # noqa
+from ..json.postgresql import postgresql_tstzrange_from_json  # noqa
+from ..json.postgresql import postgresql_tstzrange_params  # noqa
+from ..json.postgresql import postgresql_tstzrange_to_json  # noqa
+from ..json.postgresql import postgresql_tstzmultirange_from_json  # noqa
+from ..json.postgresql import postgresql_tstzmultirange_params  # noqa
+from ..json.postgresql import postgresql_tstzmultirange_to_json  # noqa
+from ..json.postgresql import postgresql_tsvector_from_json  # noqa
+from ..json.postgresql import postgresql_tsvector_params  # noqa
+from ..json.postgresql import postgresql_tsvector_to_json  # noqa
@@ -0,0 +1,92 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from ..schema import Field
+
+from . import sqlalchemy
+
+# system imports
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+
+from typing import Any
+from typing import Optional
+from typing import Union
+
+# dependency imports
+from sqlalchemy import Column
+
+
+def postgresql_interval_from_json(
+    field: Field, value: Optional[int]
+) -> Optional[timedelta]:
+    return sqlalchemy.interval_from_json(field, value)
+
+
+def postgresql_interval_params(column: Column) -> Any:
+    return sqlalchemy.interval_params(column)
+
+
+def postgresql_interval_to_json(
+    field: Field, value: Optional[timedelta]
+) -> Optional[int]:
+    return sqlalchemy.interval_to_json(field, value)
+
+
+def postgresql_json_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
+    return sqlalchemy.json_from_json(field, value)
+
+
+def postgresql_json_params(column: Column) -> Any:
+    return sqlalchemy.json_params(column)
+
+
+def postgresql_json_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
+    return sqlalchemy.json_to_json(field, value)
+
+
+def postgresql_jsonb_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
+    return sqlalchemy.json_from_json(field, value)
+
+
+def postgresql_jsonb_params(column: Column) -> Any:
+    return sqlalchemy.json_params(column)
+
+
+def postgresql_jsonb_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
+    return sqlalchemy.json_to_json(field, value)
+
+
+def postgresql_time_from_json(
+    field: Field, value: Optional[Union[int, str]]
+) -> Optional[time]:
+    return sqlalchemy.time_from_json(field, value)
+
+
+def postgresql_time_params(column: Column) -> Any:
+    return sqlalchemy.time_params(column)
+
+
+def postgresql_time_to_json(
+    field: Field, value: Optional[time]
+) -> Optional[Union[int, str]]:
+    return sqlalchemy.time_to_json(field, value)
+
+
+def postgresql_timestamp_from_json(
+    field: Field[bool], value: Optional[int]
+) -> Optional[datetime]:
+    return sqlalchemy.datetime_from_json(field, value)
+
+
+def postgresql_timestamp_params(column: Column) -> bool:
+    return sqlalchemy.datetime_params(column)
+
+
+def postgresql_timestamp_to_json(
+    field: Field[bool], value: Optional[datetime]
+) -> Optional[int]:
+    return sqlalchemy.datetime_to_json(field, value)
@@ -0,0 +1,151 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from ..raw_json import RAW_JSON_KEY
+from ..raw_json import RawJson
+from ..raw_json import escape_raw_json
+from ..raw_json import load_raw_json
+
+from ..schema import Field
+
+from ..temporal import MICROSECOND
+from ..temporal import date_from_epoch
+from ..temporal import date_to_epoch
+from ..temporal import datetime_from_epoch
+from ..temporal import datetime_from_epoch_utc
+from ..temporal import datetime_to_epoch
+from ..temporal import time_from_epoch
+from ..temporal import time_to_epoch
+
+# system imports
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+
+from typing import Any
+from typing import Optional
+from typing import Union
+from typing import cast
+
+from uuid import UUID
+
+# dependency imports
+from sqlalchemy import Column
+
+
+def date_from_json(field: Field, value: Optional[int]) -> Optional[date]:
+    if value is None:
+        return None
+
+    return date_from_epoch(value)
+
+
+def date_params(column: Column) -> Any:
+    return
+
+
+def date_to_json(field: Field, value: Optional[date]) -> Optional[int]:
+    if value is None:
+        return None
+
+    return date_to_epoch(value)
+
+
+def datetime_from_json(field: Field[bool], value: Optional[int]) -> Optional[datetime]:
+    if value is None:
+        return None
+
+    elif field.params:
+        return datetime_from_epoch_utc(value)
+
+    else:
+        return datetime_from_epoch(value)
+
+
+def datetime_params(column: Column) -> bool:
+    return bool(cast(Any, column.type).timezone)
+
+
+def datetime_to_json(field: Field[bool], value: Optional[datetime]) -> Optional[int]:
+    if value is None:
+        return None
+
+    return datetime_to_epoch(value)
+
+
+def interval_from_json(field: Field, value: Optional[int]) -> Optional[timedelta]:
+    if value is None:
+        return None
+
+    return timedelta(microseconds=value)
+
+
+def interval_params(column: Column) -> Any:
+    return
+
+
+def interval_to_json(field: Field, value: Optional[timedelta]) -> Optional[int]:
+    if value is None:
+        return None
+
+    return value // MICROSECOND
+
+
+def json_from_json(field: Field, value: Optional[Any]) -> Optional[Any]:
+    return load_raw_json(value)
+
+
+def json_params(column: Column) -> Any:
+    return
+
+
+def json_to_json(field: Field, value: Optional[Any]) -> Optional[Any]:
+    if isinstance(value, RawJson):
+        return {RAW_JSON_KEY: value.text}
+
+    return escape_raw_json(value)
+
+
+def time_from_json(field: Field, value: Optional[Union[int, str]]) -> Optional[time]:
+    if value is None:
+        return None
+
+    elif isinstance(value, str):
+        return time.fromisoformat(value)
+
+    return time_from_epoch(value)
+
+
+def time_params(column: Column) -> Any:
+    return
+
+
+def time_to_json(field: Field, value: Optional[time]) -> Optional[Union[int, str]]:
+    if value is None:
+        return None
+
+    return time_to_epoch(value)
+
+
+def uuid_from_json(field: Field, value: Optional[bytes]) -> Optional[UUID]:
+    if value is None:
+        return None
+
+    return UUID(bytes=value)
+
+
+def uuid_params(column: Column) -> Any:
+    return
+
+
+def uuid_to_json(field: Field, value: Optional[Union[UUID, str]]) -> Optional[bytes]:
+    if value is None:
+        return None
+
+    elif isinstance(value, str):
+        return UUID(value).bytes
+
+    return value.bytes
@@ -0,0 +1,253 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from .lazy import is_lazy
+
+from .model import model_class
+from .model import rehydrate_model
+from .model import schema_for_model
+from .model import schema_for_model_path
+from .model import schema_map_key
+from .model import values_from_row
+from .model import values_to_row
+
+from .msgpack import MsgpackSerializer
+
+from .schema import Field
+from .schema import Schema
+
+from .types import Message
+
+# system imports
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+# dependency imports
+from sqlalchemy.exc import NoInspectionAvailable
+
+from sqlalchemy import inspect
+
+import msgpack
+
+MODEL_EXT = 1
+
+Header = Optional[List[Tuple[int, Field]]]
+
+
+class PositionalSerializer(MsgpackSerializer):
+    """
+    MessagePack serializer that writes models as positional rows.
+
+    Each model is written as an extension value holding a small schema id and its values
+    in schema field order. The message starts with a table of the model path, schema
+    fingerprint and field names for each schema id, so field names are sent once per
+    message instead of once per model. Rows whose fingerprint differs from the worker
+    schema are matched to fields by name instead of position.
+
+    Models sent as references, with their relationships or deduplicated are written as
+    in the MessagePack format.
+    """
+
+    def arg_from_json(
+        self,
+        arg: Any,
+        references: Optional[Dict[Tuple, Any]] = None,
+        identities: Optional[Dict[int, Any]] = None,
+    ) -> Any:
+        """
+        Deserialize a MessagePack argument into its python equivalent.
+
+        Parameters:
+            arg (object): Any object type.
+            references (dict): Models loaded by `load_references()`.
+            identities (dict): Models deserialized so far in the message by identity.
+        """
+        if hasattr(arg, "__table__"):
+            # decoded from a positional row
+            return arg
+
+        return super().arg_from_json(arg, references, identities)
+
+    def dumps(self, json: Any) -> Message:
+        """
+        Encode a value into a positional message.
+
+        Parameters:
+            json (object): Value.
+        """
+        identities: Optional[Dict[Any, int]] = {} if self.deduplicate else None
+        models: Dict[Any, int] = {}
+        schemas: List[List[Any]] = []
+
+        def default(arg: Any) -> Any:
+            ext = self.model_to_ext(arg, models, schemas)
+
+            return self.arg_to_json(arg, identities) if ext is None else ext
+
+        body = self.pack(json, default)
+
+        return msgpack.packb([schemas, body], use_bin_type=True)
+
+    def loads(self, message: Message) -> Any:
+        """
+        Decode a positional message into its value.
+
+        Parameters:
+            message (Message): Message.
+        """
+        schemas, body = msgpack.unpackb(message, raw=False)
+        layouts = [
+            self.schema_from_header(model_path, fingerprint, names)
+            for model_path, fingerprint, names in schemas
+        ]
+
+        def ext_hook(code: int, data: bytes) -> Any:
+            if code != MODEL_EXT:
+                return msgpack.ExtType(code, data)
+
+            schema_id, row = msgpack.unpackb(data, raw=False, strict_map_key=False)
+            schema, header = layouts[schema_id]
+
+            return self.model_from_row(schema, header, row)
+
+        return msgpack.unpackb(body, ext_hook=ext_hook, raw=False, strict_map_key=False)
+
+    def model_from_row(self, schema: Schema, header: Header, row: List[Any]) -> Any:
+        """
+        Deserialize a positional row into a model instance.
+
+        Parameters:
+            schema (Schema): Model schema.
+            header (list): Row positions and fields when the row layout differs from the
+                           schema, otherwise None.
+            row (list): Row values.
+        """
+        start = self.measure_start() if self.measurement else 0.0
+
+        if header is not None:
+            values = {field.name: field.from_json(field, row[n]) for n, field in header}
+
+        elif schema.from_row:
+            values = schema.from_row(row)
+
+        else:
+            values = values_from_row(schema, row)
+
+        model = model_class(schema.model)
+
+        if self.bypass_init:
+            instance = rehydrate_model(model, values)
+
+        else:
+            instance = model(**values)
+
+        if self.measurement:
+            self.measure("decode", start, schema_map_key(model), 1)
+
+        return instance
+
+    def model_to_ext(
+        self, arg: Any, models: Dict[Any, int], schemas: List[List[Any]]
+    ) -> Optional[msgpack.ExtType]:
+        """
+        Serialize a model instance into a positional row extension value, adding its
+        schema to the message schemas the first time its model is seen.
+
+        Returns None when the argument is not written as a positional row.
+
+        Parameters:
+            arg (object): Any object type.
+            models (dict): Schema ids by model class.
+            schemas (list): Message schemas.
+        """
+        if (
+            self.references
+            or self.deduplicate
+            or self.relationship_depth
+            or is_lazy(arg)
+            or not hasattr(arg, "__table__")
+        ):
+            return None
+
+        try:
+            start = self.measure_start() if self.measurement else 0.0
+            mapper = inspect(arg).mapper
+
+        except NoInspectionAvailable:
+            return None
+
+        schema = schema_for_model(arg, mapper, self.interface, compiled=self.compiled)
+        model = model_class(arg)
+        schema_id = models.get(model)
+
+        if schema_id is None:
+            schema_id = models[model] = len(schemas)
+
+            schemas.append(
+                [
+                    schema_map_key(model),
+                    schema.fingerprint,
+                    list(schema.names),
+                ]
+            )
+
+        if schema.to_row:
+            row = schema.to_row(arg)
+
+        else:
+            row = values_to_row(schema, arg)
+
+        ext = msgpack.ExtType(
+            MODEL_EXT,
+            msgpack.packb(
+                [schema_id, row], default=self.arg_to_json, use_bin_type=True
+            ),
+        )
+
+        if self.measurement:
+            self.measure("encode", start, schema_map_key(model), 1, size=len(ext.data))
+
+        return ext
+
+    def plain_message(self, value: Any) -> Message:
+        """
+        Encode a value that holds no models into a positional message with an empty
+        schema table.
+
+        Parameters:
+            value (object): Any object type.
+
+        Raises:
+            TypeError: If the value holds a type that MessagePack does not encode.
+        """
+        return msgpack.packb([[], self.dumps_plain(value)], use_bin_type=True)
+
+    def schema_from_header(
+        self, model_path: str, fingerprint: str, names: List[str]
+    ) -> Tuple[Schema, Header]:
+        """
+        Returns the worker schema for a message schema, along with the row positions of
+        its fields when the fingerprints differ.
+
+        Parameters:
+            model_path (str): Full module and class name path.
+            fingerprint (str): Producer schema fingerprint.
+            names (list): Producer schema field names.
+        """
+        schema = schema_for_model_path(
+            model_path, self.interface, compiled=self.compiled
+        )
+
+        if schema.fingerprint == fingerprint:
+            return schema, None
+
+        fields = schema.fields_by_name
+
+        return schema, [
+            (n, fields[name]) for n, name in enumerate(names) if name in fields
+        ]
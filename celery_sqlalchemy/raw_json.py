@@ -0,0 +1,116 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# system imports
+from typing import Any
+from typing import Optional
+from typing import Union
+
+# dependency imports
+import orjson
+
+RAW_JSON_KEY = "$json$"
+
+# sentinel of a document that has not been decoded
+UNDECODED = object()
+
+
+class RawJson:
+    """
+    JSON document held as its encoded text, such as the value of a JSON or JSONB column
+    loaded by an engine created with `json_deserializer=RawJson`.
+
+    Messages carry the text of the document as is, so the document is not encoded again
+    on each message, and a worker only decodes it when its value is first read.
+    """
+
+    __slots__ = ("_fragment", "_value", "text")
+
+    def __init__(self, text: Union[bytes, str]) -> None:
+        """
+        Initialize the document.
+
+        Parameters:
+            text (bytes | str): Encoded JSON document.
+        """
+        self._fragment: Optional[orjson.Fragment] = None
+        self._value: Any = UNDECODED
+        self.text = text.decode() if isinstance(text, bytes) else text
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, RawJson) and other.text == self.text
+
+    def __hash__(self) -> int:
+        return hash(self.text)
+
+    def __repr__(self) -> str:
+        return f"RawJson({self.text[:40]!r}{'...' if len(self.text) > 40 else ''})"
+
+    def fragment(self) -> orjson.Fragment:
+        """
+        Returns the message JSON of the document as an orjson fragment, which is
+        encoded the first time it is requested and reused from then on.
+        """
+        if self._fragment is None:
+            self._fragment = orjson.Fragment(
+                b'{"' + RAW_JSON_KEY.encode() + b'":' + orjson.dumps(self.text) + b"}"
+            )
+
+        return self._fragment
+
+    @property
+    def value(self) -> Any:
+        """
+        Returns the decoded document, which is decoded the first time it is read.
+        """
+        if self._value is UNDECODED:
+            self._value = orjson.loads(self.text)
+
+        return self._value
+
+
+def dumps(value: Any) -> str:
+    """
+    Encode the value of a JSON column for the database, writing raw documents as their
+    text. Pass it as the `json_serializer` of an engine that loads raw documents.
+
+    Parameters:
+        value (object): Column value.
+    """
+    if isinstance(value, RawJson):
+        return value.text
+
+    return orjson.dumps(value).decode()
+
+
+def escape_raw_json(value: Any) -> Any:
+    """
+    Returns the message JSON of a column value that is not a raw document, which is the
+    value unchanged unless it would read as a raw document, a dict whose only key is
+    the raw document key, in which case it is wrapped in a list under that key.
+
+    Parameters:
+        value (object): Column value.
+    """
+    if type(value) is dict and len(value) == 1 and RAW_JSON_KEY in value:
+        return {RAW_JSON_KEY: [value]}
+
+    return value
+
+
+def load_raw_json(value: Any) -> Any:
+    """
+    Returns a raw document when the message JSON of a column value is a raw document,
+    the escaped value when it was escaped by `escape_raw_json()`, otherwise the value
+    unchanged.
+
+    Parameters:
+        value (object): Message JSON of a column value.
+    """
+    if type(value) is dict and len(value) == 1 and RAW_JSON_KEY in value:
+        raw = value[RAW_JSON_KEY]
+
+        return raw[0] if type(raw) is list else RawJson(raw)
+
+    return value
@@ -6,15 +6,29 @@
 from abc import ABC
 
 from dataclasses import dataclass
+from dataclasses import field
 
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import Generic
 from typing import List
+from typing import Optional
+from typing import Tuple
 from typing import TypeVar
 
+F = TypeVar("F", bound=Callable)
 T = TypeVar("T")
 
+# column info key that serializes the values of a temporal column as epoch integers
+EPOCH_TEMPORAL = "epoch_temporal"
+
+# column info key that decodes each repeated value of a temporal column once per message
+MEMOIZE_TEMPORAL = "memoize_temporal"
+
+# column info key that serializes the values of a scaled numeric column as integers
+SCALED_NUMERIC = "scaled_numeric"
+
 
 @dataclass(frozen=True)
 class Field(Generic[T]):
@@ -29,6 +43,17 @@ class Field(Generic[T]):
 class Schema(ABC):
     fields: List[Field]
     model: Any
+    fields_by_name: Dict[str, Field] = field(default_factory=dict)
+    fingerprint: str = ""
+    from_json: Optional[Callable] = None
+    from_json_transforms: Tuple[Tuple[int, Field], ...] = ()
+    from_row: Optional[Callable] = None
+    getter: Optional[Callable] = None
+    names: Tuple[str, ...] = ()
+    primary_key: Tuple[Field, ...] = ()
+    to_json: Optional[Callable] = None
+    to_json_transforms: Tuple[Tuple[int, Field], ...] = ()
+    to_row: Optional[Callable] = None
 
 
 @dataclass(frozen=True)
@@ -36,3 +61,50 @@ class TypeMap:
     from_json: str
     params: Any
     to_json: str
+
+
+def identity(function: F) -> F:
+    """
+    Mark a serialization function as returning its value unchanged.
+
+    Parameters:
+        function (Callable): Serialization function.
+    """
+    setattr(function, "__identity__", True)
+
+    return function
+
+
+def identity_when(predicate: Callable[[Any], bool]) -> Callable[[F], F]:
+    """
+    Mark a serialization function as returning its value unchanged for the fields whose
+    params satisfy a predicate.
+
+    Parameters:
+        predicate (Callable): Returns whether or not the function returns its value
+                              unchanged for the params of a field.
+    """
+
+    def decorator(function: F) -> F:
+        setattr(function, "__identity__", predicate)
+
+        return function
+
+    return decorator
+
+
+def is_identity(function: Callable, field: Optional[Field] = None) -> bool:
+    """
+    Returns whether or not a serialization function returns its value unchanged, for
+    the field when the function is only marked as such for some fields.
+
+    Parameters:
+        function (Callable): Serialization function.
+        field (Field): Schema field the function serializes.
+    """
+    marker = getattr(function, "__identity__", False)
+
+    if marker is True:
+        return True
+
+    return field is not None and callable(marker) and bool(marker(field.params))
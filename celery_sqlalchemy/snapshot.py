@@ -0,0 +1,306 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from .model import model_classes
+from .model import schema_for_model
+from .model import schema_from_fields
+from .model import schema_map_key
+from .model import schema_maps
+from .model import schema_models
+from .model import type_maps
+
+from .schema import EPOCH_TEMPORAL
+from .schema import MEMOIZE_TEMPORAL
+from .schema import SCALED_NUMERIC
+from .schema import Field
+
+# system imports
+from hashlib import blake2b
+
+from importlib import import_module
+
+from types import ModuleType
+
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+
+from uuid import uuid4
+
+import os
+import pickle
+import sys
+import tempfile
+
+# dependency imports
+from sqlalchemy import inspect
+
+SNAPSHOT_VERSION = 4
+
+type_keys = {
+    f"{column_type.__module__}.{column_type.__qualname__}": column_type
+    for column_type in type_maps
+}
+
+
+def build_snapshot(
+    models: Any, interfaces: Iterable[ModuleType], compiled: bool = False
+) -> Dict[str, Any]:
+    """
+    Returns a snapshot of the schemas of models for each interface, adding any schema
+    that has not been built yet.
+
+    Parameters:
+        models (object): Declarative base, mapper registry, or list of model classes
+                         and model paths.
+        interfaces (list): Serialization interface modules.
+        compiled (bool): Compile the schema serialization functions.
+    """
+    models = model_classes(models)
+    schemas = []
+
+    for interface in interfaces:
+        for model in models:
+            schema = schema_for_model(
+                model, inspect(model), interface, compiled=compiled
+            )
+
+            schemas.append(
+                [
+                    interface.__name__,
+                    schema_map_key(model),
+                    [
+                        [
+                            field.name,
+                            f"{field.type.__module__}.{field.type.__qualname__}",
+                            field.params,
+                        ]
+                        for field in schema.fields
+                    ],
+                    [field.name for field in schema.primary_key],
+                ]
+            )
+
+    return {
+        "hash": models_hash(models),
+        "schemas": schemas,
+        "version": SNAPSHOT_VERSION,
+    }
+
+
+def column_stamp(column: Any) -> str:
+    """
+    Returns the facts of a column that its snapshot field depends on: its name, type
+    class, the type attributes that shape its params, whether it is part of the primary
+    key and its encoding info flags.
+
+    Parameters:
+        column (Column): Table column.
+    """
+    column_type = column.type
+    info = column.info
+
+    return (
+        f"{column.name}:{column_type.__class__.__qualname__}"
+        f":{getattr(column_type, 'precision', None)!r}"
+        f":{getattr(column_type, 'scale', None)!r}"
+        f":{getattr(column_type, 'timezone', None)!r}"
+        f":{getattr(column_type, 'asdecimal', None)!r}"
+        f":{column.primary_key}"
+        f":{bool(info.get(SCALED_NUMERIC))}"
+        f":{bool(info.get(EPOCH_TEMPORAL))}"
+        f":{bool(info.get(MEMOIZE_TEMPORAL))}"
+    )
+
+
+def load_snapshot(snapshot: Dict[str, Any], models: Any, compiled: bool = False) -> int:
+    """
+    Register the schemas of a snapshot without inspecting the models, and return the
+    number of schemas registered.
+
+    Parameters:
+        snapshot (dict): Snapshot returned by `build_snapshot()`.
+        models (object): Declarative base, mapper registry, or list of model classes
+                         and model paths.
+        compiled (bool): Compile the schema serialization functions.
+
+    Raises:
+        KeyError: If the snapshot refers to an unknown model or column type.
+    """
+    classes = {schema_map_key(model): model for model in model_classes(models)}
+    registered = []
+
+    for interface_name, model_path, fields, primary_key in snapshot["schemas"]:
+        interface = import_module(interface_name)
+        model = classes[model_path]
+        schema_fields = [
+            Field(
+                from_json=getattr(interface, type_maps[type_keys[type_key]].from_json),
+                name=name,
+                params=params,
+                to_json=getattr(interface, type_maps[type_keys[type_key]].to_json),
+                type=type_keys[type_key],
+            )
+            for name, type_key, params in fields
+        ]
+        names = {field.name: field for field in schema_fields}
+        schema = schema_from_fields(
+            model,
+            schema_fields,
+            tuple(names[name] for name in primary_key),
+            compiled=compiled,
+        )
+
+        registered.append((interface, model_path, model, schema))
+
+    for interface, model_path, model, schema in registered:
+        schema_maps[(interface, model_path)] = schema
+        schema_models[(interface, model)] = schema
+
+    return len(registered)
+
+
+def models_hash(models: Any) -> str:
+    """
+    Returns a hash of the tables and columns of models, the source files of the
+    modules that define them and the snapshot version, which changes whenever the
+    models are mapped or defined differently.
+
+    Columns are hashed by `column_stamp()` rather than by inspecting each model, which
+    keeps checking a snapshot cheap.
+
+    Parameters:
+        models (object): Declarative base, mapper registry, or list of model classes
+                         and model paths.
+    """
+    lines = [f"version:{SNAPSHOT_VERSION}"]
+    modules = set()
+    tables: Dict[Any, str] = {}
+
+    for model in sorted(model_classes(models), key=schema_map_key):
+        lines.append(schema_map_key(model))
+        modules.add(model.__module__)
+
+        for table in model.__mapper__.tables:
+            if table not in tables:
+                tables[table] = "\n".join(map(column_stamp, table.columns))
+
+            lines.append(f"{table.name}\n{tables[table]}")
+
+    lines.extend(module_stamp(module) for module in sorted(modules))
+
+    return blake2b("\n".join(lines).encode(), digest_size=16).hexdigest()
+
+
+def module_stamp(name: str) -> str:
+    """
+    Returns the path, size and modification time of the source file of a module, or a
+    unique stamp when the module has no source file, so that its models are always
+    snapshotted again.
+
+    Parameters:
+        name (str): Module name.
+    """
+    path = getattr(sys.modules.get(name), "__file__", None)
+
+    if path:
+        try:
+            stat = os.stat(path)
+
+            return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+        except OSError:
+            pass
+
+    return f"{name}:{uuid4().hex}"
+
+
+def read_snapshot(path: str) -> Optional[Dict[str, Any]]:
+    """
+    Returns the snapshot stored in a file, or None when the file is missing, cannot be
+    read or holds a snapshot of another version.
+
+    Snapshots are pickled, so only read snapshot files written by your own workers.
+
+    Parameters:
+        path (str): Snapshot file path.
+    """
+    try:
+        with open(path, "rb") as file:
+            snapshot = pickle.load(file)
+
+    except Exception:
+        return None
+
+    if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+
+    return snapshot
+
+
+def use_snapshot(
+    path: str,
+    models: Any,
+    interfaces: Iterable[ModuleType],
+    compiled: bool = False,
+) -> bool:
+    """
+    Register the schemas of models from a snapshot file, rebuilding and rewriting the
+    snapshot when it is missing or its hash does not match the models.
+
+    Returns whether or not the schemas were loaded from the snapshot file.
+
+    Parameters:
+        path (str): Snapshot file path.
+        models (object): Declarative base, mapper registry, or list of model classes
+                         and model paths.
+        interfaces (list): Serialization interface modules.
+        compiled (bool): Compile the schema serialization functions.
+    """
+    models = model_classes(models)
+    interfaces = list(interfaces)
+    snapshot = read_snapshot(path)
+
+    if (
+        snapshot
+        and snapshot.get("hash") == models_hash(models)
+        and {name for name, *_ in snapshot["schemas"]}
+        == {interface.__name__ for interface in interfaces}
+    ):
+        try:
+            load_snapshot(snapshot, models, compiled=compiled)
+
+            return True
+
+        except (AttributeError, ImportError, KeyError, TypeError, ValueError):
+            pass
+
+    write_snapshot(path, build_snapshot(models, interfaces, compiled=compiled))
+
+    return False
+
+
+def write_snapshot(path: str, snapshot: Dict[str, Any]) -> None:
+    """
+    Write a snapshot to a file, replacing the file atomically so that concurrently
+    starting workers never read a partial snapshot.
+
+    Parameters:
+        path (str): Snapshot file path.
+        snapshot (dict): Snapshot returned by `build_snapshot()`.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(temporary, path)
+
+    except BaseException:
+        os.unlink(temporary)
+        raise
@@ -0,0 +1,165 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# system imports
+from collections import defaultdict
+
+from contextlib import contextmanager
+
+from contextvars import ContextVar
+
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from datetime import timezone
+
+from typing import Any
+from typing import Callable
+from typing import DefaultDict
+from typing import Dict
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+EPOCH_UTC = EPOCH.replace(tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+# decoded temporal values of the message being deserialized, by decoder and value
+memo: ContextVar[Optional[DefaultDict[Callable, Dict[Any, Any]]]] = ContextVar(
+    "memo", default=None
+)
+
+
+def date_from_epoch(value: int) -> date:
+    """
+    Returns the date of a number of days since the epoch.
+
+    Parameters:
+        value (int): Days since the epoch.
+    """
+    return date.fromordinal(value + EPOCH_ORDINAL)
+
+
+def date_to_epoch(value: date) -> int:
+    """
+    Returns the number of days since the epoch of a date.
+
+    Parameters:
+        value (date): Date.
+    """
+    return value.toordinal() - EPOCH_ORDINAL
+
+
+def datetime_from_epoch(value: int) -> datetime:
+    """
+    Returns the naive datetime of a number of microseconds since the epoch.
+
+    Parameters:
+        value (int): Microseconds since the epoch.
+    """
+    return EPOCH + timedelta(0, 0, value)
+
+
+def datetime_from_epoch_utc(value: int) -> datetime:
+    """
+    Returns the UTC datetime of a number of microseconds since the epoch.
+
+    Parameters:
+        value (int): Microseconds since the epoch.
+    """
+    return EPOCH_UTC + timedelta(0, 0, value)
+
+
+def datetime_to_epoch(value: datetime) -> int:
+    """
+    Returns the number of microseconds since the epoch of a datetime, which for naive
+    datetimes is counted from the naive epoch, the same as naive datetimes taken as UTC.
+
+    Parameters:
+        value (datetime): Datetime.
+    """
+    return (value - (EPOCH if value.tzinfo is None else EPOCH_UTC)) // MICROSECOND
+
+
+def is_text_temporal(params: Any) -> bool:
+    """
+    Returns whether or not the params of a temporal field serialize its values as is,
+    to be encoded as ISO strings, rather than as epoch integers.
+
+    Parameters:
+        params (object): Field params.
+    """
+    return params is None or not params.epoch
+
+
+def memoized(decode: Callable[[Any], Any], value: Any) -> Any:
+    """
+    Returns the decoded value, which is decoded once per message when a message memo is
+    set and reused for each repeat of the value in the message.
+
+    Parameters:
+        decode (Callable): Decoder of the value.
+        value (object): Encoded value.
+    """
+    values = memo.get()
+
+    if values is None:
+        return decode(value)
+
+    decoded = values[decode]
+
+    try:
+        return decoded[value]
+
+    except KeyError:
+        decoded[value] = result = decode(value)
+
+        return result
+
+
+@contextmanager
+def message_memo() -> Iterator[None]:
+    """
+    Set a new memo of decoded temporal values while a message is deserialized.
+    """
+    token = memo.set(defaultdict(dict))
+
+    try:
+        yield
+
+    finally:
+        memo.reset(token)
+
+
+def time_from_epoch(value: int) -> time:
+    """
+    Returns the time of a number of microseconds since midnight.
+
+    Parameters:
+        value (int): Microseconds since midnight.
+    """
+    seconds, microsecond = divmod(value, 1_000_000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+
+    return time(hour, minute, second, microsecond)
+
+
+def time_to_epoch(value: time) -> Union[int, str]:
+    """
+    Returns the number of microseconds since midnight of a naive time, otherwise the
+    ISO string of the time since offsets cannot be carried by an integer.
+
+    Parameters:
+        value (time): Time.
+    """
+    if value.tzinfo is not None:
+        return value.isoformat()
+
+    return (
+        (value.hour * 60 + value.minute) * 60 + value.second
+    ) * 1_000_000 + value.microsecond
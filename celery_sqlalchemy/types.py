@@ -24,7 +24,51 @@ class Args:
     kwargs: Optional[Dict[str, Any]] = None
 
 
+@dataclass(frozen=True)
+class Measurement:
+    operation: str
+    seconds: float
+    instances: int = 0
+    model_path: Optional[str] = None
+    size: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class WarmUp:
+    built: int
+    models: int
+    seconds: float
+
+
+class BlobStore(Protocol):
+    def get(self, key: str) -> Any:
+        """
+        Returns the payload stored under a key as a bytes-like object, or None when
+        the key is not stored.
+
+        Parameters:
+            key (str): Content hash of the payload.
+        """
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store a payload under a key, which is the content hash of the payload, so a
+        key that is already stored holds the same payload.
+
+        Parameters:
+            key (str): Content hash of the payload.
+            data (bytes): Payload.
+        """
+
+
 class Serializer(Protocol):
+    """
+    Serializer of task messages. A serializer may also define
+    `message_from_object(value)` and `message_to_object(message)` to serialize values
+    that are not task messages, such as task results, which are otherwise encoded with
+    orjson.
+    """
+
     def arg_from_json(self, arg: Any) -> Any:
         """
         Deserialize a JSON argument into its python equivalent.
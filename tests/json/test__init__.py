@@ -3,24 +3,188 @@
 # --------------------------------------------------------------------------------------
 
 # celery-sqlalchemy types
+from celery_sqlalchemy.compression import is_compressed
+
+from celery_sqlalchemy.instrumentation import Aggregator
+
 from celery_sqlalchemy.json import JsonSerializer
 
+from celery_sqlalchemy.raw_json import RawJson
+from celery_sqlalchemy.raw_json import dumps
+
+from celery_sqlalchemy.schema import EPOCH_TEMPORAL
+from celery_sqlalchemy.schema import MEMOIZE_TEMPORAL
+from celery_sqlalchemy.schema import SCALED_NUMERIC
+
+from celery_sqlalchemy.types import Args
+
 from celery_sqlalchemy import errors
 
 # system imports
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timezone
+
+from decimal import Decimal
+
+from time import perf_counter
+
 from typing import Any
+from typing import Dict
+from typing import List
 
 from unittest.mock import Mock
 from unittest.mock import call
 from unittest.mock import patch
 
 # dependency imports
+from pytest import approx
+from pytest import mark
 from pytest import raises
 
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+
+from sqlalchemy import Column
+from sqlalchemy import Date
+from sqlalchemy import DateTime
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import JSON
+from sqlalchemy import Numeric
+from sqlalchemy import String
+from sqlalchemy import Time
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy import inspect
+from sqlalchemy import select
+
 import orjson
 
 PATH = "celery_sqlalchemy.json"
 
+Base = declarative_base()
+
+
+class Model(Base):  # type: ignore
+    __tablename__ = "model"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+class Other(Base):  # type: ignore
+    __tablename__ = "other"
+
+    id = Column(Integer, primary_key=True)
+    key = Column(String, primary_key=True)
+
+
+class Customer(Base):  # type: ignore
+    __tablename__ = "customer"
+
+    id = Column(Integer, primary_key=True)
+
+
+class Order(Base):  # type: ignore
+    __tablename__ = "order"
+
+    id = Column(Integer, primary_key=True)
+    customer_id = Column(Integer, ForeignKey("customer.id"))
+
+    customer = relationship(Customer)
+    lines = relationship("Line", back_populates="order")
+    tags = relationship("Tag", collection_class=set)
+
+
+class Line(Base):  # type: ignore
+    __tablename__ = "line"
+
+    id = Column(Integer, primary_key=True)
+    order_id = Column(Integer, ForeignKey("order.id"))
+    sku = Column(String)
+
+    order = relationship(Order, back_populates="lines")
+
+
+class Tag(Base):  # type: ignore
+    __tablename__ = "tag"
+
+    id = Column(Integer, primary_key=True)
+    order_id = Column(Integer, ForeignKey("order.id"))
+
+
+class Event(Base):  # type: ignore
+    __tablename__ = "event"
+
+    id = Column(Integer, primary_key=True)
+    payload = Column(JSON)
+
+
+class Price(Base):  # type: ignore
+    __tablename__ = "price"
+
+    id = Column(Integer, primary_key=True)
+    amount = Column(Numeric(12, 2), info={SCALED_NUMERIC: True})
+    rate = Column(Numeric(8, 4))
+
+
+class Visit(Base):  # type: ignore
+    __tablename__ = "visit"
+
+    id = Column(Integer, primary_key=True)
+    created_at = Column(DateTime, info={MEMOIZE_TEMPORAL: True})
+    day = Column(Date, info={EPOCH_TEMPORAL: True})
+    opened = Column(Time, info={EPOCH_TEMPORAL: True})
+    seen_at = Column(
+        DateTime(timezone=True), info={EPOCH_TEMPORAL: True, MEMOIZE_TEMPORAL: True}
+    )
+
+
+def test___init___set_batches() -> None:
+    serializer = JsonSerializer(batches=True)
+
+    assert serializer.batches
+
+
+def test___init___set_bypass_init() -> None:
+    serializer = JsonSerializer(bypass_init=True)
+
+    assert serializer.bypass_init
+
+
+def test___init___set_compiled() -> None:
+    serializer = JsonSerializer(compiled=True)
+
+    assert serializer.compiled
+
+
+def test___init___set_compression() -> None:
+    serializer = JsonSerializer(
+        compression="lzma", compression_level=1, compression_threshold=10
+    )
+
+    assert serializer.compression == "lzma"
+    assert serializer.compression_level == 1
+    assert serializer.compression_threshold == 10
+
+
+def test___init___set_compression__raises_serialization_error() -> None:
+    with raises(errors.SerializationError) as ex:
+        JsonSerializer(compression="brotli")
+
+    assert str(ex.value) == "Unsupported compression: brotli"
+
+
+def test___init___set_deduplicate() -> None:
+    serializer = JsonSerializer(deduplicate=True)
+
+    assert serializer.deduplicate
+
 
 def test___init___set_json_key() -> None:
     serializer = JsonSerializer(json_key="test")
@@ -28,6 +192,12 @@ def test___init___set_json_key() -> None:
     assert serializer.json_key == "test"
 
 
+def test___init___set_lazy() -> None:
+    serializer = JsonSerializer(lazy=True)
+
+    assert serializer.lazy
+
+
 def test___init___set_naive_utc_false() -> None:
     serializer = JsonSerializer(naive_utc=False)
 
@@ -55,6 +225,25 @@ def test___init___set_passthrough_dataclass_true() -> None:
     )
 
 
+def test___init___set_references() -> None:
+    serializer = JsonSerializer(references=True)
+
+    assert serializer.references
+
+
+def test___init___set_relationship_depth() -> None:
+    serializer = JsonSerializer(relationship_depth=2)
+
+    assert serializer.relationship_depth == 2
+
+
+def test___init___set_session_factory() -> None:
+    session_factory = Mock()
+    serializer = JsonSerializer(session_factory=session_factory)
+
+    assert serializer.session_factory == session_factory
+
+
 def test___init___set_on_deserialize_arg() -> None:
     deserialize_arg = Mock()
     serializer = JsonSerializer(on_deserialize_arg=deserialize_arg)
@@ -115,7 +304,13 @@ def test_arg_from_json__model_class(
 
     field = Mock()
     field.name = "name"
-    schema = Mock(fields=[field], model=Model)
+    schema = Mock(
+        fields=[field],
+        from_json=None,
+        from_json_transforms=((0, field),),
+        model=Model,
+        names=("name",),
+    )
     schema_for_model_path.return_value = schema
     model_path = Mock()
     name = Mock()
@@ -127,7 +322,9 @@ def test_arg_from_json__model_class(
 
     result = serializer.arg_from_json(arg)
 
-    schema_for_model_path.assert_called_with(model_path, sys.modules[__name__])
+    schema_for_model_path.assert_called_with(
+        model_path, sys.modules[__name__], compiled=False
+    )
     field.from_json.assert_called_with(field, name)
 
     assert result.name == field.from_json()
@@ -146,7 +343,13 @@ def test_arg_from_json__model_instance(
     field = Mock()
     field.name = "name"
     model = Model(name="test")
-    schema = Mock(fields=[field], model=model)
+    schema = Mock(
+        fields=[field],
+        from_json=None,
+        from_json_transforms=((0, field),),
+        model=model,
+        names=("name",),
+    )
     schema_for_model_path.return_value = schema
     model_path = Mock()
     name = Mock()
@@ -158,7 +361,9 @@ def test_arg_from_json__model_instance(
 
     result = serializer.arg_from_json(arg)
 
-    schema_for_model_path.assert_called_with(model_path, sys.modules[__name__])
+    schema_for_model_path.assert_called_with(
+        model_path, sys.modules[__name__], compiled=False
+    )
     field.from_json.assert_called_with(field, name)
 
     assert isinstance(result, Model)
@@ -166,6 +371,129 @@ def test_arg_from_json__model_instance(
     assert result.name == field.from_json()
 
 
+@patch(f"{PATH}.__name__")
+@patch(f"{PATH}.sys")
+@patch(f"{PATH}.schema_for_model_path")
+def test_arg_from_json__model_compiled(
+    schema_for_model_path: Mock, sys: Mock, __name__: Mock
+) -> None:
+    class Model:
+        def __init__(self, name: str):
+            self.name = name
+
+    field = Mock()
+    schema = Mock(fields=[field], model=Model)
+    schema.from_json.return_value = {"name": "test"}
+    schema_for_model_path.return_value = schema
+    model_path = Mock()
+    arg = {"$model_path$": model_path, "name": "test"}
+    serializer = JsonSerializer(compiled=True)
+
+    result = serializer.arg_from_json(arg)
+
+    schema_for_model_path.assert_called_with(
+        model_path, sys.modules[__name__], compiled=True
+    )
+    schema.from_json.assert_called_with(arg)
+    field.from_json.assert_not_called()
+
+    assert isinstance(result, Model)
+    assert result.name == "test"
+
+
+@patch(f"{PATH}.rehydrate_model")
+@patch(f"{PATH}.schema_for_model_path")
+def test_arg_from_json__model_bypass_init(
+    schema_for_model_path: Mock, rehydrate_model: Mock
+) -> None:
+    Model = type("Model", (object,), {})
+    field = Mock()
+    field.name = "name"
+    schema = Mock(
+        fields=[field],
+        from_json=None,
+        from_json_transforms=((0, field),),
+        model=Model,
+        names=("name",),
+    )
+    schema_for_model_path.return_value = schema
+    name = Mock()
+    arg = {"$model_path$": Mock(), "name": name}
+    serializer = JsonSerializer(bypass_init=True)
+
+    assert serializer.arg_from_json(arg) == rehydrate_model.return_value
+
+    field.from_json.assert_called_with(field, name)
+    rehydrate_model.assert_called_with(Model, {"name": field.from_json()})
+
+
+def test_arg_from_json__backref_without_identities() -> None:
+    serializer = JsonSerializer()
+
+    with raises(errors.SerializationError) as ex:
+        serializer.arg_from_json({"$model_path$": "path.Model", "$ref$": 0})
+
+    assert str(ex.value) == "Unknown model back-reference: 0"
+
+
+def test_arg_from_json__backref_unknown() -> None:
+    serializer = JsonSerializer()
+
+    with raises(errors.SerializationError):
+        serializer.arg_from_json(
+            {"$model_path$": "path.Model", "$ref$": 1}, identities={0: Mock()}
+        )
+
+
+def test_message__backref_truncated() -> None:
+    model = Model(id=1, name="model")
+    serializer = JsonSerializer(deduplicate=True)
+    message = orjson.loads(
+        serializer.message_from_args(Args(arg=model, args=[model], kwargs={}))
+    )
+
+    message["$arg$"] = None
+    message["$index$"].remove(["$arg$"])
+
+    with raises(errors.SerializationError):
+        serializer.message_to_args(orjson.dumps(message))
+
+
+def test_arg_from_json__reference() -> None:
+    model = Mock()
+    arg = {"$model_path$": "path.Model", "$pk$": [1]}
+    serializer = JsonSerializer()
+
+    assert serializer.arg_from_json(arg, {("path.Model", (1,)): model}) == model
+
+
+def test_arg_from_json__reference_list() -> None:
+    model = Mock()
+    arg = [{"$model_path$": "path.Model", "$pk$": [1]}]
+    serializer = JsonSerializer()
+
+    assert serializer.arg_from_json(arg, {("path.Model", (1,)): model}) == [model]
+
+
+@patch(f"{PATH}.JsonSerializer.load_references")
+def test_arg_from_json__reference_loads_references(load_references: Mock) -> None:
+    model = Mock()
+    load_references.return_value = {("path.Model", (1,)): model}
+    arg = {"$model_path$": "path.Model", "$pk$": [1]}
+    serializer = JsonSerializer()
+
+    assert serializer.arg_from_json(arg) == model
+
+    load_references.assert_called_with({"path.Model": [[1]]})
+
+
+def test_arg_from_json__reference_missing() -> None:
+    arg = {"$model_path$": "path.Model", "$pk$": [1]}
+    serializer = JsonSerializer()
+
+    assert serializer.arg_from_json(arg, {}) is None
+
+
 def test_arg_from_json__other_than_model() -> None:
     arg = Mock()
     serializer = JsonSerializer()
@@ -189,7 +517,13 @@ def test_arg_to_json__model(
     inspect.return_value = instance_state
     field = Mock()
     field.name = "name"
-    schema = Mock(fields=[field])
+    schema = Mock(
+        fields=[field],
+        getter=lambda instance: (instance.name,),
+        names=("name",),
+        to_json=None,
+        to_json_transforms=((0, field),),
+    )
     schema_for_model.return_value = schema
     arg = Mock(__table__=Mock())
     serializer = JsonSerializer()
@@ -200,11 +534,110 @@ def test_arg_to_json__model(
     }
 
     inspect.assert_called_with(arg)
-    schema_for_model.assert_called_with(arg, inspect().mapper, sys.modules[__name__])
+    schema_for_model.assert_called_with(
+        arg, inspect().mapper, sys.modules[__name__], compiled=False
+    )
     field.to_json.assert_called_with(field, arg.name)
     schema_map_key.assert_called_with(arg)
 
 
+@patch(f"{PATH}.schema_map_key")
+@patch(f"{PATH}.__name__")
+@patch(f"{PATH}.sys")
+@patch(f"{PATH}.inspect")
+@patch(f"{PATH}.schema_for_model")
+def test_arg_to_json__model_compiled(
+    schema_for_model: Mock,
+    inspect: Mock,
+    sys: Mock,
+    __name__: Mock,
+    schema_map_key: Mock,
+) -> None:
+    field = Mock()
+    schema = Mock(fields=[field])
+    schema.to_json.return_value = {"name": "test"}
+    schema_for_model.return_value = schema
+    arg = Mock(__table__=Mock())
+    serializer = JsonSerializer(compiled=True)
+
+    assert serializer.arg_to_json(arg) == {
+        "$model_path$": schema_map_key.return_value,
+        "name": "test",
+    }
+
+    schema_for_model.assert_called_with(
+        arg, inspect().mapper, sys.modules[__name__], compiled=True
+    )
+    schema.to_json.assert_called_with(arg)
+    field.to_json.assert_not_called()
+
+
+@patch(f"{PATH}.schema_map_key")
+@patch(f"{PATH}.inspect")
+@patch(f"{PATH}.schema_for_model")
+def test_arg_to_json__model_reference(
+    schema_for_model: Mock, inspect: Mock, schema_map_key: Mock
+) -> None:
+    field = Mock()
+    field.name = "id"
+    schema = Mock(primary_key=(field,))
+    schema_for_model.return_value = schema
+    arg = Mock(__table__=Mock())
+    serializer = JsonSerializer(references=True)
+
+    assert serializer.arg_to_json(arg) == {
+        "$model_path$": schema_map_key.return_value,
+        "$pk$": [field.to_json.return_value],
+    }
+
+    field.to_json.assert_called_with(field, arg.id)
+    schema.to_json.assert_not_called()
+
+
+@patch(f"{PATH}.schema_map_key")
+@patch(f"{PATH}.inspect")
+@patch(f"{PATH}.schema_for_model")
+def test_arg_to_json__model_reference_without_primary_key(
+    schema_for_model: Mock, inspect: Mock, schema_map_key: Mock
+) -> None:
+    field = Mock()
+    field.name = "id"
+    field.to_json.return_value = None
+    schema = Mock(primary_key=(field,))
+    schema.to_json.return_value = {"id": None}
+    schema_for_model.return_value = schema
+    arg = Mock(__table__=Mock())
+    serializer = JsonSerializer(references=True)
+
+    assert serializer.arg_to_json(arg) == {
+        "$model_path$": schema_map_key.return_value,
+        "id": None,
+    }
+
+
+@patch(f"{PATH}.schema_map_key")
+@patch(f"{PATH}.inspect")
+@patch(f"{PATH}.schema_for_model")
+def test_arg_to_json__model_reference_without_identity(
+    schema_for_model: Mock, inspect: Mock, schema_map_key: Mock
+) -> None:
+    field = Mock()
+    field.name = "id"
+    schema = Mock(primary_key=(field,))
+    schema.to_json.return_value = {"id": 5}
+    schema_for_model.return_value = schema
+    inspect.return_value.key = None
+    arg = Mock(__table__=Mock())
+    serializer = JsonSerializer(references=True)
+
+    assert serializer.arg_to_json(arg) == {
+        "$model_path$": schema_map_key.return_value,
+        "id": 5,
+    }
+
+    field.to_json.assert_not_called()
+
+
 def test_arg_to_json__serialize_arg() -> None:
     arg = type("FakeType")
     serialize_arg = Mock()
@@ -259,22 +692,1015 @@ def test_arg_to_json__unserializable_without_table__raises_serialization_error()
     assert str(ex.value) == f"Cannot serialize type '{arg.__class__.__name__}'"
 
 
-@patch(f"{PATH}.orjson")
-def test_message_from_args(orjson: Mock) -> None:
-    args = Mock()
+def test_batch_from_json() -> None:
+    field = Mock()
+    field.name = "name"
+    schema = Mock(
+        fields=[field], fields_by_name={"name": field}, from_row=None, names=("name",)
+    )
+    model = Mock()
+    serializer = JsonSerializer()
+
+    assert serializer.batch_from_json(
+        schema, model, {"$fields$": ["name", "unknown"], "$rows$": [["test", 1]]}
+    ) == [model.return_value]
+
+    field.from_json.assert_called_with(field, "test")
+    model.assert_called_with(name=field.from_json())
+
+
+@patch(f"{PATH}.rehydrate_model")
+def test_batch_from_json__bypass_init(rehydrate_model: Mock) -> None:
+    field = Mock()
+    field.name = "name"
+    schema = Mock(fields=[field], names=("name",))
+    schema.from_row.return_value = {"name": "test"}
+    model = Mock()
+    serializer = JsonSerializer(bypass_init=True)
+
+    assert serializer.batch_from_json(
+        schema, model, {"$fields$": ["name"], "$rows$": [["test"]]}
+    ) == [rehydrate_model.return_value]
+
+    rehydrate_model.assert_called_with(model, {"name": "test"})
+    model.assert_not_called()
+
+
+def test_batch_from_json__from_row() -> None:
+    field = Mock()
+    field.name = "name"
+    schema = Mock(fields=[field], names=("name",))
+    schema.from_row.return_value = {"name": "test"}
+    model = Mock()
+    serializer = JsonSerializer()
+
+    assert serializer.batch_from_json(
+        schema, model, {"$fields$": ["name"], "$rows$": [["test"]]}
+    ) == [model.return_value]
+
+    schema.from_row.assert_called_with(["test"])
+    model.assert_called_with(name="test")
+    field.from_json.assert_not_called()
+
+
+def test_batch_to_json() -> None:
+    models = [Model(id=1, name="one"), Model(id=2, name="two")]
+    serializer = JsonSerializer()
+
+    assert serializer.batch_to_json(models) == {
+        "$model_path$": f"{__name__}.Model",
+        "$fields$": ["id", "name"],
+        "$rows$": [[1, "one"], [2, "two"]],
+    }
+
+
+def test_batch_to_json__compiled() -> None:
+    models = [Model(id=1, name="one"), Model(id=2, name="two")]
+    serializer = JsonSerializer(compiled=True)
+
+    assert serializer.batch_to_json(models) == {
+        "$model_path$": f"{__name__}.Model",
+        "$fields$": ["id", "name"],
+        "$rows$": [[1, "one"], [2, "two"]],
+    }
+
+
+@mark.parametrize(
+    "arg",
+    [
+        None,
+        [],
+        [1, 2],
+        [Model(id=1), Other(id=1, key="a")],
+    ],
+)
+def test_batch_to_json__other_than_batch(arg: Any) -> None:
     serializer = JsonSerializer()
 
-    assert serializer.message_from_args(args) == orjson.dumps.return_value
+    assert serializer.batch_to_json(arg) is arg
 
-    orjson.dumps.assert_called_with(
+
+def test_batch_to_json__nested_list() -> None:
+    models = [Model(id=1, name="one")]
+    serializer = JsonSerializer()
+
+    assert serializer.batch_to_json([1, models]) == [
+        1,
         {
-            "$arg$": args.arg,
-            "$args$": args.args,
-            "$kwargs$": args.kwargs,
+            "$model_path$": f"{__name__}.Model",
+            "$fields$": ["id", "name"],
+            "$rows$": [[1, "one"]],
         },
-        default=serializer.arg_to_json,
-        option=serializer.orjson_opts,
-    )
+    ]
+
+
+def test_collect_references() -> None:
+    model = {"$model_path$": "path.Model", "$pk$": [1]}
+    other = {"$model_path$": "path.Other", "$pk$": [2]}
+    references: Dict[str, List[Any]] = {}
+    serializer = JsonSerializer()
+
+    serializer.collect_references([model, [other, model], {"id": 3}, 4], references)
+
+    assert references == {"path.Model": [[1], [1]], "path.Other": [[2]]}
+
+
+def test_load_references__raises_serialization_error() -> None:
+    serializer = JsonSerializer()
+
+    with raises(errors.SerializationError) as ex:
+        serializer.load_references({"path.Model": [[1]]})
+
+    assert str(ex.value) == "Cannot load model references without a session factory"
+
+
+def test_message__references() -> None:
+    engine = create_engine("sqlite://")
+    statements = []
+
+    Base.metadata.create_all(engine)
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+
+    with Session(engine) as session:
+        session.add_all(
+            [Model(id=n, name=f"model {n}") for n in range(3)]
+            + [Other(id=1, key="a"), Other(id=1, key="b")]
+        )
+        session.commit()
+        statements.clear()
+
+        models = session.execute(select(Model)).scalars().all()
+        others = session.execute(select(Other)).scalars().all()
+        unsaved = Model(name="unsaved")
+        measurement = Mock()
+        serializer = JsonSerializer(
+            references=True,
+            session_factory=lambda: session,
+            on_measurement=measurement,
+        )
+        message = serializer.message_from_args(
+            Args(
+                arg=None,
+                args=[models[0], models],
+                kwargs={"other": others[1], "unsaved": unsaved},
+            )
+        )
+
+        assert orjson.loads(message)["$args$"][0] == {
+            "$model_path$": f"{__name__}.Model",
+            "$pk$": [0],
+        }
+
+        session.expunge_all()
+        statements.clear()
+
+        args = serializer.message_to_args(message)
+
+        assert len(statements) == 2
+        assert args.args
+        assert args.args[0] is args.args[1][0]
+        assert [model.name for model in args.args[1]] == [
+            "model 0",
+            "model 1",
+            "model 2",
+        ]
+        assert args.kwargs
+        assert args.kwargs["other"].key == "b"
+        assert args.kwargs["unsaved"].name == "unsaved"
+
+        loads = [
+            (c.args[0].model_path, c.args[0].instances)
+            for c in measurement.call_args_list
+            if c.args[0].operation == "load"
+        ]
+
+        assert loads == [(f"{__name__}.Model", 3), (f"{__name__}.Other", 1)]
+
+
+def test_message__references_transient_and_pending() -> None:
+    engine = create_engine("sqlite://")
+
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        pending = Model(id=6, name="pending")
+        session.add(pending)
+
+        serializer = JsonSerializer(references=True, session_factory=lambda: session)
+        message = serializer.message_from_args(
+            Args(arg=Model(id=5, name="transient"), args=[pending], kwargs={})
+        )
+
+        assert b"$pk$" not in message
+
+        args = serializer.message_to_args(message)
+
+    assert args.arg.name == "transient"  # type: ignore
+    assert args.args
+    assert args.args[0].name == "pending"
+
+
+def test_message__references_nested() -> None:
+    engine = create_engine("sqlite://")
+    statements = []
+
+    Base.metadata.create_all(engine)
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+
+    with Session(engine) as session:
+        session.add_all([Model(id=n, name=f"model {n}") for n in range(2)])
+        session.commit()
+
+        models = session.execute(select(Model)).scalars().all()
+        serializer = JsonSerializer(references=True, session_factory=lambda: session)
+        message = serializer.message_from_args(
+            Args(args=[], kwargs={"meta": {"model": models[0], "others": models}})
+        )
+
+        session.expunge_all()
+        statements.clear()
+
+        args = serializer.message_to_args(message)
+
+        assert len(statements) == 1
+        assert args.kwargs
+        assert args.kwargs["meta"]["model"].name == "model 0"
+        assert [model.name for model in args.kwargs["meta"]["others"]] == [
+            "model 0",
+            "model 1",
+        ]
+
+
+@mark.parametrize("bypass_init", [False, True])
+def test_message__relationships(bypass_init: bool) -> None:
+    engine = create_engine("sqlite://")
+    statements = []
+
+    Base.metadata.create_all(engine)
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2]),
+    )
+
+    with Session(engine) as session:
+        session.add(
+            Order(
+                id=1,
+                customer=Customer(id=1),
+                lines=[Line(id=n, sku=f"sku {n}") for n in range(2)],
+                tags={Tag(id=1)},
+            )
+        )
+        session.commit()
+        session.expunge_all()
+        statements.clear()
+
+        order = session.execute(
+            select(Order).options(selectinload(Order.lines), selectinload(Order.tags))
+        ).scalar_one()
+        statements.clear()
+
+        serializer = JsonSerializer(bypass_init=bypass_init, relationship_depth=1)
+        message = serializer.message_from_args(Args(arg=order, args=[], kwargs={}))
+
+    assert statements == []
+    assert orjson.loads(message)["$arg$"]["$related$"] == {
+        "lines": [
+            {
+                "id": n,
+                "order_id": 1,
+                "sku": f"sku {n}",
+                "$model_path$": f"{__name__}.Line",
+            }
+            for n in range(2)
+        ],
+        "tags": [{"id": 1, "order_id": 1, "$model_path$": f"{__name__}.Tag"}],
+    }
+
+    args = serializer.message_to_args(message)
+
+    assert args.arg
+    assert "customer" not in inspect(args.arg).dict
+    assert [(line.id, line.sku) for line in args.arg.lines] == [
+        (0, "sku 0"),
+        (1, "sku 1"),
+    ]
+    assert [tag.id for tag in args.arg.tags] == [1]
+    assert isinstance(args.arg.tags, set)
+
+
+def test_message__relationships_cycle() -> None:
+    order = Order(id=1, lines=[Line(id=1, sku="sku")])
+    serializer = JsonSerializer(relationship_depth=3)
+    message = serializer.message_from_args(Args(arg=order, args=[], kwargs={}))
+
+    (line,) = orjson.loads(message)["$arg$"]["$related$"]["lines"]
+
+    assert "$related$" not in line
+
+    args = serializer.message_to_args(message)
+
+    assert args.arg
+    assert args.arg.lines[0].order is args.arg
+
+
+def test_message__relationships_depth() -> None:
+    customer = Customer(id=1)
+    line = Line(id=1, order=Order(id=1, customer=customer))
+    message = JsonSerializer(relationship_depth=1).message_from_args(
+        Args(arg=line, args=[], kwargs={})
+    )
+
+    assert orjson.loads(message)["$arg$"]["$related$"] == {
+        "order": {"id": 1, "customer_id": None, "$model_path$": f"{__name__}.Order"}
+    }
+
+    args = JsonSerializer(relationship_depth=2).message_to_args(
+        JsonSerializer(relationship_depth=2).message_from_args(
+            Args(arg=line, args=[], kwargs={})
+        )
+    )
+
+    assert args.arg
+    assert args.arg.order.customer.id == 1
+
+
+def test_message__deduplicate() -> None:
+    engine = create_engine("sqlite://")
+
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(Model(id=1, name="model"))
+        session.commit()
+
+    with Session(engine) as session, Session(engine) as other_session:
+        model = session.get(Model, 1)
+        copy = other_session.get(Model, 1)
+
+    unsaved = Model(name="unsaved")
+    serializer = JsonSerializer(deduplicate=True)
+    message = serializer.message_from_args(
+        Args(
+            arg=model,
+            args=[[model, unsaved, copy], unsaved],
+            kwargs={"model": model},
+        )
+    )
+    path = f"{__name__}.Model"
+
+    assert orjson.loads(message) == {
+        "$arg$": {"id": 1, "name": "model", "$model_path$": path, "$id$": 0},
+        "$args$": [
+            [
+                {"$model_path$": path, "$ref$": 0},
+                {"id": None, "name": "unsaved", "$model_path$": path, "$id$": 2},
+                {"$model_path$": path, "$ref$": 0},
+            ],
+            {"$model_path$": path, "$ref$": 2},
+        ],
+        "$kwargs$": {"model": {"$model_path$": path, "$ref$": 0}},
+        "$index$": [
+            ["$arg$"],
+            ["$args$", 0, 0],
+            ["$args$", 0, 1],
+            ["$args$", 0, 2],
+            ["$args$", 1],
+            ["$kwargs$", "model"],
+        ],
+    }
+
+    args = serializer.message_to_args(message)
+
+    assert args.arg
+    assert args.args
+    assert args.kwargs
+    assert args.args[0][0] is args.arg
+    assert args.args[0][2] is args.arg
+    assert args.args[1] is args.args[0][1]
+    assert args.kwargs["model"] is args.arg
+
+
+def test_message__deduplicate_batches() -> None:
+    model = Model(id=1, name="model")
+    serializer = JsonSerializer(batches=True, deduplicate=True)
+    message = serializer.message_from_args(
+        Args(arg=None, args=[[model, model], model], kwargs={})
+    )
+
+    assert b"$rows$" not in message
+
+    args = serializer.message_to_args(message)
+
+    assert args.args
+    assert args.args[0][0] is args.args[0][1] is args.args[1]
+
+
+@mark.parametrize("bypass_init", [False, True])
+def test_message__deduplicate_relationships(bypass_init: bool) -> None:
+    customer = Customer(id=1)
+    order = Order(id=1, customer=customer, lines=[Line(id=n) for n in range(2)])
+    serializer = JsonSerializer(
+        bypass_init=bypass_init, deduplicate=True, relationship_depth=2
+    )
+    message = serializer.message_from_args(Args(arg=order, args=[customer], kwargs={}))
+
+    json = orjson.loads(message)
+
+    assert [line["$related$"] for line in json["$arg$"]["$related$"]["lines"]] == [
+        {"order": {"$model_path$": f"{__name__}.Order", "$ref$": 0}},
+        {"order": {"$model_path$": f"{__name__}.Order", "$ref$": 0}},
+    ]
+    assert json["$args$"] == [{"$model_path$": f"{__name__}.Customer", "$ref$": 1}]
+
+    args = serializer.message_to_args(message)
+
+    assert args.arg
+    assert args.args
+    assert args.args[0] is args.arg.customer
+    assert [line.id for line in args.arg.lines] == [0, 1]
+    assert all(line.order is args.arg for line in args.arg.lines)
+
+
+def test_message__relationships_none() -> None:
+    serializer = JsonSerializer(relationship_depth=1)
+    message = serializer.message_from_args(
+        Args(arg=Line(id=1, order=None), args=[], kwargs={})
+    )
+
+    assert orjson.loads(message)["$arg$"]["$related$"] == {"order": None}
+    assert serializer.message_to_args(message).arg.order is None  # type: ignore
+
+
+def test_message__relationships_disabled() -> None:
+    message = JsonSerializer().message_from_args(
+        Args(arg=Order(id=1, lines=[Line(id=1)]), args=[], kwargs={})
+    )
+
+    assert "$related$" not in orjson.loads(message)["$arg$"]
+
+
+def test_message_from_args__batches_relationships() -> None:
+    orders = [Order(id=n, lines=[Line(id=n)]) for n in range(2)]
+    serializer = JsonSerializer(batches=True, relationship_depth=1)
+    message = serializer.message_from_args(Args(args=[orders], kwargs={}))
+
+    assert [
+        order["$related$"]["lines"][0]["id"]
+        for order in orjson.loads(message)["$args$"][0]
+    ] == [0, 1]
+
+
+def test_relationships_from_json__missing_relationship() -> None:
+    order = Order(id=1)
+
+    JsonSerializer().relationships_from_json(order, {"removed": None})
+
+    assert not hasattr(order, "removed")
+
+
+@mark.parametrize("compiled", [False, True])
+def test_message__batches(compiled: bool) -> None:
+    models = [Model(id=n, name=f"model {n}") for n in range(3)]
+    serializer = JsonSerializer(batches=True, compiled=compiled)
+    message = serializer.message_from_args(
+        Args(arg=models, args=[models, [1, 2]], kwargs={"models": models})
+    )
+
+    assert orjson.loads(message)["$args$"][0]["$rows$"] == [
+        [0, "model 0"],
+        [1, "model 1"],
+        [2, "model 2"],
+    ]
+
+    args = serializer.message_to_args(message)
+
+    for result in [args.arg, args.args[0], args.kwargs["models"]]:  # type: ignore
+        assert [(model.id, model.name) for model in result] == [
+            (0, "model 0"),
+            (1, "model 1"),
+            (2, "model 2"),
+        ]
+
+    assert args.args
+    assert args.args[1] == [1, 2]
+
+
+@mark.parametrize("compiled", [False, True])
+def test_message__measurement(compiled: bool) -> None:
+    aggregator = Aggregator()
+    serializer = JsonSerializer(
+        compiled=compiled, measure_size=True, on_measurement=aggregator
+    )
+    model = Model(id=1, name="model")
+    message = serializer.message_from_args(Args(arg=model, args=[], kwargs={}))
+
+    serializer.message_to_args(message)
+
+    summary = aggregator.summary()
+    path = f"{__name__}.Model"
+
+    assert summary["encode"][path]["count"] == 1
+    assert summary["encode"][path]["instances"] == 1
+    assert summary["encode"][path]["size"] == len(
+        orjson.dumps(orjson.loads(message)["$arg$"])
+    )
+    assert summary["decode"][path]["count"] == 1
+    assert summary["decode"][path]["size"] == 0
+
+
+def test_message__measurement_batches() -> None:
+    measurement = Mock()
+    serializer = JsonSerializer(
+        batches=True, measure_size=True, on_measurement=measurement
+    )
+    models = [Model(id=n, name=f"model {n}") for n in range(3)]
+    message = serializer.message_from_args(Args(args=[models], kwargs={}))
+
+    serializer.message_to_args(message)
+
+    encode, decode = [c.args[0] for c in measurement.call_args_list]
+
+    assert (encode.operation, encode.instances) == ("encode", 3)
+    assert encode.size == len(orjson.dumps(orjson.loads(message)["$args$"][0]))
+    assert (decode.operation, decode.instances, decode.size) == ("decode", 3, None)
+
+
+def test_message__measurement_without_size() -> None:
+    measurement = Mock()
+    serializer = JsonSerializer(on_measurement=measurement)
+
+    with patch.object(serializer, "dumps", wraps=serializer.dumps) as dumps:
+        serializer.message_from_args(Args(arg=Model(id=1), args=[], kwargs={}))
+
+    (encode,) = [c.args[0] for c in measurement.call_args_list]
+
+    assert encode.size is None
+
+    dumps.assert_called_once()
+
+
+def test_message__measurement_nested() -> None:
+    measurement = Mock()
+    order = Order(id=1, lines=[Line(id=n, sku=f"sku {n}") for n in range(2)])
+    serializer = JsonSerializer(relationship_depth=1, on_measurement=measurement)
+    message = serializer.message_from_args(Args(arg=order, args=[], kwargs={}))
+
+    measurement.reset_mock()
+
+    start = perf_counter()
+    serializer.message_to_args(message)
+    seconds = perf_counter() - start
+
+    decodes = [c.args[0] for c in measurement.call_args_list]
+
+    assert [decode.model_path for decode in decodes] == [
+        f"{__name__}.Line",
+        f"{__name__}.Line",
+        f"{__name__}.Order",
+    ]
+    assert sum(decode.seconds for decode in decodes) <= seconds
+
+
+def test_measure__nested() -> None:
+    measurement = Mock()
+    serializer = JsonSerializer(on_measurement=measurement)
+
+    with patch(f"{PATH}.perf_counter", Mock(side_effect=[0.0, 1.0, 3.0, 10.0])):
+        outer = serializer.measure_start()
+        inner = serializer.measure_start()
+
+        serializer.measure("decode", inner, "Line", 1)
+        serializer.measure("decode", outer, "Order", 1)
+
+    line, order = [c.args[0] for c in measurement.call_args_list]
+
+    assert line.seconds == approx(2.0)
+    assert order.seconds == approx(8.0)
+
+
+def test_message_from_args__batches_references() -> None:
+    models = [Model(id=n, name=f"model {n}") for n in range(2)]
+
+    for model in models:
+        make_transient_to_detached(model)
+
+    serializer = JsonSerializer(batches=True, references=True)
+    message = serializer.message_from_args(Args(args=[models], kwargs={}))
+
+    assert orjson.loads(message)["$args$"][0] == [
+        {"$model_path$": f"{__name__}.Model", "$pk$": [0]},
+        {"$model_path$": f"{__name__}.Model", "$pk$": [1]},
+    ]
+
+
+@patch.object(JsonSerializer, "dumps")
+def test_message_from_args(dumps: Mock) -> None:
+    model = Model(id=1)
+    nested = [2, model]
+    meta = {"model": model}
+    args = Args(arg=model, args=[1, nested], kwargs={"meta": meta, "plain": {"n": 1}})
+    serializer = JsonSerializer()
+
+    assert serializer.message_from_args(args) == dumps.return_value
+
+    json: Dict[str, Any] = dumps.call_args.args[0]
+
+    assert json["$arg$"] is model
+    assert json["$args$"] == [1, nested]
+    assert json["$kwargs$"]["meta"] is meta
+    assert isinstance(json["$kwargs$"]["plain"], orjson.Fragment)
+    assert json["$index$"] == [
+        ["$arg$"],
+        ["$args$", 1, 1],
+        ["$kwargs$", "meta", "model"],
+    ]
+
+
+def test_message_from_args__without_models() -> None:
+    serializer = JsonSerializer()
+    message = serializer.message_from_args(
+        Args(arg=None, args=[1, [2]], kwargs={"meta": {"n": 1}})
+    )
+
+    assert orjson.loads(message) == {
+        "$arg$": None,
+        "$args$": [1, [2]],
+        "$kwargs$": {"meta": {"n": 1}},
+    }
+    assert serializer.message_to_args(message) == Args(
+        arg=None, args=[1, [2]], kwargs={"meta": {"n": 1}}
+    )
+
+
+def test_index_models() -> None:
+    model = Model(id=1)
+    batch = {"$model_path$": "path.Model", "$rows$": []}
+    index: List[List[Any]] = []
+    value = {
+        "plain": [1, "text", None, 1.5, True, [1, [2]], {"n": 1}],
+        "nested": {"list": [0, model], "tuple": (model,), "set": {model}},
+        "batch": batch,
+        "model": model,
+    }
+
+    JsonSerializer().index_models(value, [], index)
+
+    assert index == [
+        ["nested", "list", 1],
+        ["nested", "tuple", 0],
+        ["nested", "set", 0],
+        ["batch"],
+        ["model"],
+    ]
+
+
+def test_index_models__lazy() -> None:
+    serializer = JsonSerializer(lazy=True)
+    proxy = serializer.message_to_args(
+        serializer.message_from_args(Args(arg=Model(id=1), args=[], kwargs={}))
+    ).arg
+    index: List[List[Any]] = []
+
+    serializer.index_models([proxy], [], index)
+
+    assert index == [[0]]
+    assert proxy._lazy_instance is None  # type: ignore
+
+
+@mark.parametrize("batches", [False, True])
+@mark.parametrize("deduplicate", [False, True])
+def test_message__nested_models(batches: bool, deduplicate: bool) -> None:
+    model = Model(id=1, name="model")
+    models = [Model(id=2, name="two"), Model(id=3, name="three")]
+    serializer = JsonSerializer(batches=batches, deduplicate=deduplicate)
+    message = serializer.message_from_args(
+        Args(
+            arg=None,
+            args=[{"models": models}],
+            kwargs={"order": {"model": model}, "meta": {"ids": [1, 2]}},
+        )
+    )
+
+    args = serializer.message_to_args(message)
+
+    assert args.args
+    assert args.kwargs
+    assert [model.name for model in args.args[0]["models"]] == ["two", "three"]
+    assert args.kwargs["order"]["model"].name == "model"
+    assert args.kwargs["meta"] == {"ids": [1, 2]}
+
+
+@mark.parametrize("batches", [False, True])
+@mark.parametrize("compiled", [False, True])
+@mark.parametrize("lazy", [False, True])
+def test_message__raw_json(batches: bool, compiled: bool, lazy: bool) -> None:
+    engine = create_engine(
+        "sqlite://", json_deserializer=RawJson, json_serializer=dumps
+    )
+    payload = {"items": list(range(10)), "name": "event"}
+
+    Base.metadata.create_all(engine, tables=[Event.__table__])
+
+    with Session(engine) as session:
+        session.add_all([Event(id=1, payload=payload), Event(id=2, payload=None)])
+        session.commit()
+
+        events = session.scalars(select(Event).order_by(Event.id)).all()
+
+    assert isinstance(events[0].payload, RawJson)
+
+    serializer = JsonSerializer(batches=batches, compiled=compiled, lazy=lazy)
+    message = serializer.message_from_args(Args(arg=None, args=[events], kwargs={}))
+
+    assert orjson.dumps(events[0].payload.text)[1:-1] in message
+
+    args = serializer.message_to_args(message)
+
+    assert args.args
+    assert args.args[0][0].payload == events[0].payload
+    assert args.args[0][0].payload.value == payload
+    assert args.args[0][1].payload.value is None
+
+
+def test_message__json() -> None:
+    serializer = JsonSerializer()
+    message = serializer.message_from_args(
+        Args(arg=Event(id=1, payload={"name": "event"}), args=[], kwargs={})
+    )
+
+    assert b'"payload":{"name":"event"}' in message
+    assert serializer.message_to_args(message).arg.payload == {  # type: ignore
+        "name": "event"
+    }
+
+
+@mark.parametrize("batches", [False, True])
+@mark.parametrize("compiled", [False, True])
+@mark.parametrize(
+    "payload", [{"$json$": "[1]"}, {"$json$": ["[1]"]}, {"$json$": {"n": 1}}]
+)
+def test_message__json_marker(batches: bool, compiled: bool, payload: Any) -> None:
+    serializer = JsonSerializer(batches=batches, compiled=compiled)
+    message = serializer.message_from_args(
+        Args(arg=None, args=[[Event(id=1, payload=payload)]], kwargs={})
+    )
+
+    args = serializer.message_to_args(message)
+
+    assert args.args
+    assert args.args[0][0].payload == payload
+
+
+@mark.parametrize("batches", [False, True])
+@mark.parametrize("compiled", [False, True])
+def test_message__scaled_numeric(batches: bool, compiled: bool) -> None:
+    prices = [
+        Price(id=1, amount=Decimal("12345.67"), rate=Decimal("0.1250")),
+        Price(id=2, amount=None, rate=None),
+    ]
+    serializer = JsonSerializer(batches=batches, compiled=compiled)
+    message = serializer.message_from_args(Args(arg=None, args=[prices], kwargs={}))
+
+    assert b"1234567" in message
+    assert b'"0.1250"' in message
+
+    args = serializer.message_to_args(message)
+
+    assert args.args
+    assert [(price.amount, price.rate) for price in args.args[0]] == [
+        (Decimal("12345.67"), Decimal("0.1250")),
+        (None, None),
+    ]
+
+
+@mark.parametrize("batches", [False, True])
+@mark.parametrize("compiled", [False, True])
+def test_message__temporal(batches: bool, compiled: bool) -> None:
+    created_at = datetime(2024, 1, 1, 12, 30)
+    seen_at = datetime(2024, 1, 1, 12, 30, 0, 1, tzinfo=timezone.utc)
+    visits = [
+        Visit(
+            id=n,
+            created_at=created_at,
+            day=date(2024, 1, 1),
+            opened=time(9, 0),
+            seen_at=seen_at,
+        )
+        for n in range(3)
+    ]
+    serializer = JsonSerializer(batches=batches, compiled=compiled)
+    message = serializer.message_from_args(Args(arg=None, args=[visits], kwargs={}))
+
+    assert b'"2024-01-01T12:30:00+00:00"' in message
+    assert b"1704112200000001" in message
+    assert b"19723" in message
+    assert b"32400000000" in message
+
+    args = serializer.message_to_args(message)
+
+    assert args.args
+    assert [
+        (visit.created_at, visit.day, visit.opened, visit.seen_at)
+        for visit in args.args[0]
+    ] == [
+        (created_at.replace(tzinfo=timezone.utc), date(2024, 1, 1), time(9, 0), seen_at)
+    ] * 3
+    assert args.args[0][0].created_at is args.args[0][2].created_at
+    assert args.args[0][0].seen_at is args.args[0][2].seen_at
+    assert args.args[0][0].day is not args.args[0][2].day
+
+
+def test_message__temporal_memo_per_message() -> None:
+    serializer = JsonSerializer(batches=True)
+    message = serializer.message_from_args(
+        Args(arg=None, args=[[Visit(id=1, created_at=datetime(2024, 1, 1))]], kwargs={})
+    )
+
+    first = serializer.message_to_args(message).args
+    second = serializer.message_to_object(message).args
+
+    assert first and second
+    assert first[0][0].created_at == second[0][0].created_at
+    assert first[0][0].created_at is not second[0][0].created_at
+
+
+def test_message__plain_data_untouched() -> None:
+    serializer = JsonSerializer()
+    message = serializer.message_from_args(
+        Args(arg=Model(id=1), args=[list(range(1000))], kwargs={"meta": {"n": 1}})
+    )
+
+    with patch.object(
+        serializer, "arg_from_json", wraps=serializer.arg_from_json
+    ) as arg_from_json:
+        args = serializer.message_to_args(message)
+
+    assert arg_from_json.call_count == 1
+    assert args.args == [list(range(1000))]
+
+
+def test_message_to_args__without_index() -> None:
+    serializer = JsonSerializer()
+    message = orjson.loads(
+        serializer.message_from_args(
+            Args(arg=None, args=[[Model(id=1, name="model")]], kwargs={})
+        )
+    )
+
+    del message["$index$"]
+
+    args = serializer.message_to_args(orjson.dumps(message))
+
+    assert args.args
+    assert args.args[0][0].name == "model"
+
+
+def test_message_to_args__deserialize_arg_without_index() -> None:
+    on_deserialize_arg = Mock(side_effect=lambda arg: arg * 2)
+    serializer = JsonSerializer(on_deserialize_arg=on_deserialize_arg)
+    message = serializer.message_from_args(
+        Args(arg=Model(id=1), args=[1, [2]], kwargs={})
+    )
+
+    args = serializer.message_to_args(message)
+
+    assert args.arg
+    assert args.args == [2, [4]]
+
+
+@patch.object(JsonSerializer, "dumps_plain")
+def test_message_from_object(dumps_plain: Mock) -> None:
+    value = Mock()
+    serializer = JsonSerializer()
+
+    assert serializer.message_from_object(value) == dumps_plain.return_value
+
+    dumps_plain.assert_called_once_with(value)
+
+
+@mark.parametrize("batches", [False, True])
+def test_message_from_object__models(batches: bool) -> None:
+    models = [Model(id=n, name=f"model{n}") for n in range(3)]
+    value = {"status": "SUCCESS", "result": models, "task_id": "id"}
+    serializer = JsonSerializer(batches=batches)
+    message = serializer.message_from_object(value)
+
+    json = orjson.loads(message)
+
+    if batches:
+        assert json["$index$"] == [["$object$", "result"]]
+        assert "$rows$" in json["$object$"]["result"]
+
+    else:
+        assert json["$index$"] == [["$object$", "result", n] for n in range(3)]
+
+    result = serializer.message_to_object(message)
+
+    assert result["status"] == "SUCCESS"
+    assert result["task_id"] == "id"
+    assert [model.name for model in result["result"]] == ["model0", "model1", "model2"]
+
+
+def test_message_from_object__model() -> None:
+    serializer = JsonSerializer()
+    message = serializer.message_from_object(Model(id=1, name="model"))
+
+    assert orjson.loads(message)["$index$"] == [["$object$"]]
+    assert serializer.message_to_object(message).name == "model"
+
+
+def test_message_from_object__without_models() -> None:
+    serializer = JsonSerializer()
+    message = serializer.message_from_object({"values": {1}})
+
+    assert message == b'{"values":[1]}'
+    assert serializer.message_to_object(message) == {"values": [1]}
+
+
+@mark.parametrize("compression", ["lzma", "zlib"])
+def test_message__compression(compression: str) -> None:
+    models = [Model(id=n, name="model") for n in range(100)]
+    serializer = JsonSerializer(compression=compression, compression_threshold=1024)
+    message = serializer.message_from_args(Args(arg=None, args=[models], kwargs={}))
+
+    args = serializer.message_to_args(message)
+
+    assert is_compressed(message)
+    assert args.args
+    assert [model.name for model in args.args[0]] == ["model"] * 100
+    assert len(serializer.message_to_object(message).args[0]) == 100
+
+
+def test_message__compression_below_threshold() -> None:
+    serializer = JsonSerializer(compression="zlib", compression_threshold=1024)
+    message = serializer.message_from_args(
+        Args(arg=Model(id=1, name="model"), args=[], kwargs={})
+    )
+
+    assert not is_compressed(message)
+    assert serializer.message_to_args(message).arg.name == "model"  # type: ignore
+
+
+def test_message_from_object__compression() -> None:
+    value = {"values": list(range(1000))}
+    serializer = JsonSerializer(compression="zlib", compression_threshold=1024)
+    message = serializer.message_from_object(value)
+
+    assert is_compressed(message)
+    assert serializer.message_to_object(message) == value
+
+
+def test_message_to_args__compressed_without_compression() -> None:
+    models = [Model(id=n, name="model") for n in range(100)]
+    message = JsonSerializer(
+        compression="zlib", compression_threshold=0
+    ).message_from_args(Args(arg=None, args=[models], kwargs={}))
+
+    args = JsonSerializer().message_to_args(message)
+
+    assert args.args
+    assert len(args.args[0]) == 100
+
+
+@patch(f"{PATH}.JsonSerializer.json_to_args")
+@patch(f"{PATH}.orjson")
+def test_message_to_object(orjson: Mock, json_to_args: Mock) -> None:
+    message = Mock()
+    orjson.loads.return_value = {"$arg$": None, "$args$": [], "$kwargs$": {}}
+    serializer = JsonSerializer()
+
+    assert serializer.message_to_object(message) == json_to_args.return_value
+
+    orjson.loads.assert_called_once_with(message)
+    json_to_args.assert_called_once_with(orjson.loads.return_value)
+
+
+@mark.parametrize(
+    "json", [None, 1, "test", [1], {"test": 1}, {"$args$": [], "$kwargs$": {}}]
+)
+@patch(f"{PATH}.JsonSerializer.json_to_args")
+@patch(f"{PATH}.orjson")
+def test_message_to_object__celery_message(
+    orjson: Mock, json_to_args: Mock, json: Any
+) -> None:
+    message = Mock()
+    orjson.loads.return_value = json
+    serializer = JsonSerializer()
+
+    assert serializer.message_to_object(message) == json
+
+    orjson.loads.assert_called_once_with(message)
+    json_to_args.assert_not_called()
 
 
 @patch(f"{PATH}.JsonSerializer.arg_from_json")
@@ -296,9 +1722,9 @@ def test_message_to_args(orjson: Mock, arg_from_json: Mock) -> None:
     orjson.loads.assert_called_with(message)
 
     assert arg_from_json.call_args_list == [
-        call(arg_value),
-        call(arg_value),
-        call(kwarg_value),
+        call(arg_value, None, {}),
+        call(arg_value, None, {}),
+        call(kwarg_value, None, {}),
     ]
 
     assert args.arg
@@ -3,12 +3,18 @@
 # --------------------------------------------------------------------------------------
 
 # celery-sqlalchemy imports
+from celery_sqlalchemy.json import TemporalParams
 from celery_sqlalchemy.json import postgresql
 
+from celery_sqlalchemy.schema import is_identity
+
 # system imports
 from unittest.mock import Mock
 from unittest.mock import patch
 
+# dependency imports
+from pytest import mark
+
 PATH = "celery_sqlalchemy.json.postgresql"
 
 
@@ -627,44 +633,79 @@ def test_postgresql_regconfig_to_json() -> None:
     assert postgresql.postgresql_regconfig_to_json(field, value) == value
 
 
-def test_postgresql_time_from_json() -> None:
+@patch(f"{PATH}.sqlalchemy")
+def test_postgresql_time_from_json(sqlalchemy: Mock) -> None:
     field = Mock()
     value = Mock()
 
-    assert postgresql.postgresql_time_from_json(field, value) == value
+    assert (
+        postgresql.postgresql_time_from_json(field, value)
+        == sqlalchemy.time_from_json.return_value
+    )
 
+    sqlalchemy.time_from_json.assert_called_with(field, value)
 
-def test_postgresql_time_params() -> None:
+
+@patch(f"{PATH}.sqlalchemy")
+def test_postgresql_time_params(sqlalchemy: Mock) -> None:
     column = Mock()
 
-    assert not postgresql.postgresql_time_params(column)
+    assert (
+        postgresql.postgresql_time_params(column) == sqlalchemy.time_params.return_value
+    )
+
+    sqlalchemy.time_params.assert_called_with(column)
 
 
-def test_postgresql_time_to_json() -> None:
+@patch(f"{PATH}.sqlalchemy")
+def test_postgresql_time_to_json(sqlalchemy: Mock) -> None:
     field = Mock()
     value = Mock()
 
-    assert postgresql.postgresql_time_to_json(field, value) == value
+    assert (
+        postgresql.postgresql_time_to_json(field, value)
+        == sqlalchemy.time_to_json.return_value
+    )
+
+    sqlalchemy.time_to_json.assert_called_with(field, value)
 
 
-def test_postgresql_timestamp_from_json() -> None:
+@patch(f"{PATH}.sqlalchemy")
+def test_postgresql_timestamp_from_json(sqlalchemy: Mock) -> None:
     field = Mock()
     value = Mock()
 
-    assert postgresql.postgresql_timestamp_from_json(field, value) == value
+    assert (
+        postgresql.postgresql_timestamp_from_json(field, value)
+        == sqlalchemy.datetime_from_json.return_value
+    )
+
+    sqlalchemy.datetime_from_json.assert_called_with(field, value)
 
 
-def test_postgresql_timestamp_params() -> None:
+@patch(f"{PATH}.sqlalchemy")
+def test_postgresql_timestamp_params(sqlalchemy: Mock) -> None:
     column = Mock()
 
-    assert not postgresql.postgresql_timestamp_params(column)
+    assert (
+        postgresql.postgresql_timestamp_params(column)
+        == sqlalchemy.datetime_params.return_value
+    )
 
+    sqlalchemy.datetime_params.assert_called_with(column)
 
-def test_postgresql_timestamp_to_json() -> None:
+
+@patch(f"{PATH}.sqlalchemy")
+def test_postgresql_timestamp_to_json(sqlalchemy: Mock) -> None:
     field = Mock()
     value = Mock()
 
-    assert postgresql.postgresql_timestamp_to_json(field, value) == value
+    assert (
+        postgresql.postgresql_timestamp_to_json(field, value)
+        == sqlalchemy.datetime_to_json.return_value
+    )
+
+    sqlalchemy.datetime_to_json.assert_called_with(field, value)
 
 
 def test_postgresql_tsquery_from_json() -> None:
@@ -785,3 +826,45 @@ def test_postgresql_tsvector_to_json() -> None:
     value = Mock()
 
     assert postgresql.postgresql_tsvector_to_json(field, value) == value
+
+
+TRANSFORMING_FUNCTIONS = [
+    "postgresql_json_from_json",
+    "postgresql_json_to_json",
+    "postgresql_jsonb_from_json",
+    "postgresql_jsonb_to_json",
+    "postgresql_time_from_json",
+    "postgresql_timestamp_from_json",
+]
+
+TEXT_IDENTITY_FUNCTIONS = [
+    "postgresql_time_to_json",
+    "postgresql_timestamp_to_json",
+]
+
+
+@mark.parametrize(
+    "name",
+    [
+        name
+        for name in dir(postgresql)
+        if name.endswith(("_from_json", "_to_json"))
+        and name not in TRANSFORMING_FUNCTIONS
+        and name not in TEXT_IDENTITY_FUNCTIONS
+    ],
+)
+def test_identity_functions(name: str) -> None:
+    assert is_identity(getattr(postgresql, name))
+
+
+@mark.parametrize("name", TRANSFORMING_FUNCTIONS)
+def test_transforming_functions(name: str) -> None:
+    assert not is_identity(getattr(postgresql, name))
+
+
+@mark.parametrize("name", TEXT_IDENTITY_FUNCTIONS)
+def test_text_identity_functions(name: str) -> None:
+    function = getattr(postgresql, name)
+
+    assert is_identity(function, Mock(params=None))
+    assert not is_identity(function, Mock(params=TemporalParams(True, False, False)))
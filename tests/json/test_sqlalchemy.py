@@ -3,15 +3,51 @@
 # --------------------------------------------------------------------------------------
 
 # celery-sqlalchemy types
+from celery_sqlalchemy.json import TemporalParams
 from celery_sqlalchemy.json import sqlalchemy
 
+from celery_sqlalchemy.raw_json import RawJson
+
+from celery_sqlalchemy.schema import EPOCH_TEMPORAL
+from celery_sqlalchemy.schema import MEMOIZE_TEMPORAL
+from celery_sqlalchemy.schema import SCALED_NUMERIC
+from celery_sqlalchemy.schema import is_identity
+
+from celery_sqlalchemy.temporal import message_memo
+
 # system imports
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from datetime import timezone
+
+from decimal import Decimal
+
+from typing import Any
+
 from unittest.mock import MagicMock
 from unittest.mock import Mock
 from unittest.mock import patch
 
+# dependency imports
+from pytest import mark
+
+from sqlalchemy import Column
+from sqlalchemy import Date
+from sqlalchemy import DateTime
+from sqlalchemy import Numeric
+from sqlalchemy import Time
+
 PATH = "celery_sqlalchemy.json.sqlalchemy"
 
+EPOCH_DATE_COLUMN = Column(Date, info={EPOCH_TEMPORAL: True})
+EPOCH_DATETIME_COLUMN = Column(DateTime, info={EPOCH_TEMPORAL: True})
+EPOCH_TIME_COLUMN = Column(Time, info={EPOCH_TEMPORAL: True})
+MEMOIZED_DATE_COLUMN = Column(Date, info={MEMOIZE_TEMPORAL: True})
+MEMOIZED_DATETIME_COLUMN = Column(DateTime, info={MEMOIZE_TEMPORAL: True})
+SCALED_COLUMN = Column(Numeric(12, 2), info={SCALED_NUMERIC: True})
+
 
 def test_array_from_json() -> None:
     field = Mock()
@@ -75,7 +111,7 @@ def test_boolean_to_json() -> None:
 
 @patch(f"{PATH}.date")
 def test_date_from_json(date: Mock) -> None:
-    field = Mock()
+    field = Mock(params=None)
     value = Mock()
 
     assert sqlalchemy.date_from_json(field, value) == date.fromisoformat.return_value
@@ -83,6 +119,30 @@ def test_date_from_json(date: Mock) -> None:
     date.fromisoformat.assert_called_with(value)
 
 
+def test_date_from_json__epoch() -> None:
+    field = Mock(params=sqlalchemy.date_params(EPOCH_DATE_COLUMN))
+
+    assert sqlalchemy.date_from_json(field, 19723) == date(2024, 1, 1)
+    assert sqlalchemy.date_from_json(field, "2024-01-01") == date(2024, 1, 1)
+
+
+def test_date_from_json__epoch_without_params() -> None:
+    field = Mock(params=None)
+
+    assert sqlalchemy.date_from_json(field, 19723) == date(2024, 1, 1)
+
+
+def test_date_from_json__memoized() -> None:
+    field = Mock(params=sqlalchemy.date_params(MEMOIZED_DATE_COLUMN))
+
+    with message_memo():
+        value = sqlalchemy.date_from_json(field, "2024-01-01")
+
+        assert sqlalchemy.date_from_json(field, "2024-01-01") is value
+
+    assert sqlalchemy.date_from_json(field, "2024-01-01") is not value
+
+
 def test_date_from_json__none() -> None:
     field = Mock()
     value = None
@@ -91,21 +151,38 @@ def test_date_from_json__none() -> None:
 
 
 def test_date_params() -> None:
-    column = Mock()
+    assert sqlalchemy.date_params(Column(Date)) is None
 
-    assert not sqlalchemy.date_params(column)
+
+def test_date_params__epoch() -> None:
+    assert sqlalchemy.date_params(EPOCH_DATE_COLUMN) == TemporalParams(
+        epoch=True, memoize=False, timezone=False
+    )
 
 
 def test_date_to_json() -> None:
-    field = Mock()
+    field = Mock(params=None)
     value = Mock()
 
     assert sqlalchemy.date_to_json(field, value) == value
 
 
+def test_date_to_json__epoch() -> None:
+    field = Mock(params=sqlalchemy.date_params(EPOCH_DATE_COLUMN))
+
+    assert sqlalchemy.date_to_json(field, date(2024, 1, 1)) == 19723
+    assert sqlalchemy.date_to_json(field, None) is None
+
+
+def test_date_to_json__memoized() -> None:
+    field = Mock(params=sqlalchemy.date_params(MEMOIZED_DATE_COLUMN))
+
+    assert sqlalchemy.date_to_json(field, date(2024, 1, 1)) == date(2024, 1, 1)
+
+
 @patch(f"{PATH}.datetime")
 def test_datetime_from_json(datetime: Mock) -> None:
-    field = Mock()
+    field = Mock(params=None)
     value = Mock()
 
     assert (
@@ -116,6 +193,44 @@ def test_datetime_from_json(datetime: Mock) -> None:
     datetime.fromisoformat.assert_called_with(value)
 
 
+def test_datetime_from_json__epoch() -> None:
+    field = Mock(params=sqlalchemy.datetime_params(EPOCH_DATETIME_COLUMN))
+
+    assert sqlalchemy.datetime_from_json(field, 1704067200000001) == datetime(
+        2024, 1, 1, 0, 0, 0, 1
+    )
+    assert sqlalchemy.datetime_from_json(field, "2024-01-01T00:00:00") == datetime(
+        2024, 1, 1
+    )
+
+
+def test_datetime_from_json__epoch_timezone() -> None:
+    column = Column(DateTime(timezone=True), info={EPOCH_TEMPORAL: True})
+    field = Mock(params=sqlalchemy.datetime_params(column))
+
+    assert sqlalchemy.datetime_from_json(field, 1704067200000000) == datetime(
+        2024, 1, 1, tzinfo=timezone.utc
+    )
+
+
+def test_datetime_from_json__epoch_without_params() -> None:
+    field = Mock(params=None)
+
+    assert sqlalchemy.datetime_from_json(field, 1704067200000001) == datetime(
+        2024, 1, 1, 0, 0, 0, 1, tzinfo=timezone.utc
+    )
+
+
+def test_datetime_from_json__memoized() -> None:
+    field = Mock(params=sqlalchemy.datetime_params(MEMOIZED_DATETIME_COLUMN))
+
+    with message_memo():
+        value = sqlalchemy.datetime_from_json(field, "2024-01-01T00:00:00Z")
+
+        assert value == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert sqlalchemy.datetime_from_json(field, "2024-01-01T00:00:00Z") is value
+
+
 def test_datetime_from_json__none() -> None:
     field = Mock()
     value = None
@@ -124,18 +239,46 @@ def test_datetime_from_json__none() -> None:
 
 
 def test_datetime_params() -> None:
-    column = Mock()
+    assert sqlalchemy.datetime_params(Column(DateTime)) is None
+
 
-    assert not sqlalchemy.datetime_params(column)
+def test_datetime_params__epoch() -> None:
+    column = Column(DateTime(timezone=True), info={EPOCH_TEMPORAL: True})
+
+    assert sqlalchemy.datetime_params(column) == TemporalParams(
+        epoch=True, memoize=False, timezone=True
+    )
+
+
+def test_datetime_params__memoized() -> None:
+    assert sqlalchemy.datetime_params(MEMOIZED_DATETIME_COLUMN) == TemporalParams(
+        epoch=False, memoize=True, timezone=False
+    )
 
 
 def test_datetime_to_json() -> None:
-    field = Mock()
+    field = Mock(params=None)
     value = Mock()
 
     assert sqlalchemy.datetime_to_json(field, value) == value
 
 
+def test_datetime_to_json__epoch() -> None:
+    field = Mock(params=sqlalchemy.datetime_params(EPOCH_DATETIME_COLUMN))
+
+    assert (
+        sqlalchemy.datetime_to_json(field, datetime(2024, 1, 1, 0, 0, 0, 1))
+        == 1704067200000001
+    )
+    assert (
+        sqlalchemy.datetime_to_json(
+            field, datetime(2024, 1, 1, 1, tzinfo=timezone(timedelta(hours=1)))
+        )
+        == 1704067200000000
+    )
+    assert sqlalchemy.datetime_to_json(field, None) is None
+
+
 @patch(f"{PATH}.numeric_from_json")
 def test_double_from_json(numeric_from_json: Mock) -> None:
     field = Mock()
@@ -303,11 +446,17 @@ def test_largebinary_to_json() -> None:
 
 def test_json_from_json() -> None:
     field = Mock()
-    value = Mock()
+    value = {"name": "value"}
 
     assert sqlalchemy.json_from_json(field, value) == value
 
 
+def test_json_from_json__raw_json() -> None:
+    field = Mock()
+
+    assert sqlalchemy.json_from_json(field, {"$json$": "[1]"}) == RawJson("[1]")
+
+
 def test_json_params() -> None:
     column = Mock()
 
@@ -321,6 +470,13 @@ def test_json_to_json() -> None:
     assert sqlalchemy.json_to_json(field, value) == value
 
 
+def test_json_to_json__raw_json() -> None:
+    field = Mock()
+    value = RawJson('{"name": "value"}')
+
+    assert sqlalchemy.json_to_json(field, value) is value.fragment()
+
+
 @patch(f"{PATH}.Decimal")
 def test_numeric_from_json__decimal(Decimal: Mock) -> None:
     field = Mock(params=sqlalchemy.NumericParams(None, None, None, True))
@@ -331,6 +487,25 @@ def test_numeric_from_json__decimal(Decimal: Mock) -> None:
     Decimal.assert_called_with(value)
 
 
+@mark.parametrize(
+    "value, expected",
+    [
+        (1234567, "12345.67"),
+        (100, "1.00"),
+        (-5, "-0.05"),
+        (0, "0.00"),
+        ("12345.67", "12345.67"),
+    ],
+)
+def test_numeric_from_json__scaled(value: Any, expected: str) -> None:
+    field = Mock(params=sqlalchemy.numeric_params(SCALED_COLUMN))
+
+    decimal = sqlalchemy.numeric_from_json(field, value)
+
+    assert isinstance(decimal, Decimal)
+    assert str(decimal) == expected
+
+
 def test_numeric_from_json__float() -> None:
     field = Mock(params=sqlalchemy.NumericParams(None, None, None, False))
     value = Mock()
@@ -356,6 +531,47 @@ def test_numeric_params() -> None:
     assert params.asdecimal == column.type.asdecimal
 
 
+def test_numeric_params__scaled() -> None:
+    params = sqlalchemy.numeric_params(SCALED_COLUMN)
+
+    assert params.scale == 2
+    assert params.exponent == Decimal("0.01")
+    assert params.factor == Decimal(100)
+
+
+@mark.parametrize(
+    "column",
+    [
+        Column(Numeric(12), info={SCALED_NUMERIC: True}),
+        Column(Numeric(38, 10), info={SCALED_NUMERIC: True}),
+        Column(Numeric(scale=2), info={SCALED_NUMERIC: True}),
+        Column(Numeric(12, 2, asdecimal=False), info={SCALED_NUMERIC: True}),
+    ],
+)
+def test_numeric_params__not_scaled(column: Column) -> None:
+    params = sqlalchemy.numeric_params(column)
+
+    assert params.exponent is None
+    assert params.factor is None
+
+
+def test_numeric_params__scalable() -> None:
+    params = sqlalchemy.numeric_params(Column(Numeric(12, 2)))
+
+    assert params.exponent == Decimal("0.01")
+    assert params.factor is None
+
+
+def test_numeric__scaled_without_flag() -> None:
+    scaled = Mock(params=sqlalchemy.numeric_params(SCALED_COLUMN))
+    field = Mock(params=sqlalchemy.numeric_params(Column(Numeric(12, 2))))
+    value = sqlalchemy.numeric_to_json(scaled, Decimal("123.45"))
+
+    assert value == 12345
+    assert sqlalchemy.numeric_from_json(field, value) == Decimal("123.45")
+    assert sqlalchemy.numeric_to_json(field, Decimal("123.45")) == "123.45"
+
+
 @patch(f"{PATH}.round")
 def test_numeric_to_json__decimal(round: Mock) -> None:
     field = Mock(params=sqlalchemy.NumericParams(None, None, None, True))
@@ -366,6 +582,39 @@ def test_numeric_to_json__decimal(round: Mock) -> None:
     round.assert_called_with(value, field.params.scale)
 
 
+@mark.parametrize(
+    "value, expected",
+    [
+        (Decimal("12345.67"), 1234567),
+        (Decimal("5"), 500),
+        (Decimal("-0.05"), -5),
+        (Decimal("1.005"), 100),
+        (Decimal("1.015"), 102),
+        (Decimal("-0.125"), -12),
+        (1.25, 125),
+        (3, 300),
+    ],
+)
+def test_numeric_to_json__scaled(value: Any, expected: int) -> None:
+    field = Mock(params=sqlalchemy.numeric_params(SCALED_COLUMN))
+    json = sqlalchemy.numeric_to_json(field, value)
+
+    assert type(json) is int
+    assert json == expected
+    assert json == int(round(Decimal(str(value)), 2).scaleb(2))
+
+
+def test_numeric__scaled_exact() -> None:
+    column = Column(Numeric(28, 10), info={SCALED_NUMERIC: True})
+    field = Mock(params=sqlalchemy.numeric_params(column))
+    value = Decimal("-123456789012345678.0123456789")
+
+    json = sqlalchemy.numeric_to_json(field, value)
+
+    assert json == -1234567890123456780123456789
+    assert sqlalchemy.numeric_from_json(field, json) == value
+
+
 def test_numeric_to_json__float() -> None:
     field = Mock(params=sqlalchemy.NumericParams(None, None, None, False))
     value = Mock()
@@ -442,7 +691,7 @@ def test_text_to_json() -> None:
 
 @patch(f"{PATH}.time")
 def test_time_from_json(time: Mock) -> None:
-    field = Mock()
+    field = Mock(params=None)
     value = Mock()
 
     assert sqlalchemy.time_from_json(field, value) == time.fromisoformat.return_value
@@ -450,6 +699,21 @@ def test_time_from_json(time: Mock) -> None:
     time.fromisoformat.assert_called_with(value)
 
 
+def test_time_from_json__epoch() -> None:
+    field = Mock(params=sqlalchemy.time_params(EPOCH_TIME_COLUMN))
+
+    assert sqlalchemy.time_from_json(field, 3723000004) == time(1, 2, 3, 4)
+    assert sqlalchemy.time_from_json(field, "01:02:03+01:00") == time(
+        1, 2, 3, tzinfo=timezone(timedelta(hours=1))
+    )
+
+
+def test_time_from_json__epoch_without_params() -> None:
+    field = Mock(params=None)
+
+    assert sqlalchemy.time_from_json(field, 3723000004) == time(1, 2, 3, 4)
+
+
 def test_time_from_json__none() -> None:
     field = Mock()
     value = None
@@ -458,18 +722,32 @@ def test_time_from_json__none() -> None:
 
 
 def test_time_params() -> None:
-    column = Mock()
+    assert sqlalchemy.time_params(Column(Time)) is None
+
 
-    assert not sqlalchemy.time_params(column)
+def test_time_params__epoch() -> None:
+    assert sqlalchemy.time_params(EPOCH_TIME_COLUMN) == TemporalParams(
+        epoch=True, memoize=False, timezone=False
+    )
 
 
 def test_time_to_json() -> None:
-    field = Mock()
+    field = Mock(params=None)
     value = Mock()
 
     assert sqlalchemy.time_to_json(field, value) == value
 
 
+def test_time_to_json__epoch() -> None:
+    field = Mock(params=sqlalchemy.time_params(EPOCH_TIME_COLUMN))
+
+    assert sqlalchemy.time_to_json(field, time(1, 2, 3, 4)) == 3723000004
+    assert sqlalchemy.time_to_json(field, time(1, 2, 3, tzinfo=timezone.utc)) == (
+        "01:02:03+00:00"
+    )
+    assert sqlalchemy.time_to_json(field, None) is None
+
+
 def test_unicode_from_json() -> None:
     field = Mock()
     value = Mock()
@@ -538,3 +816,55 @@ def test_uuid_to_json() -> None:
     value = Mock()
 
     assert sqlalchemy.uuid_to_json(field, value) == value
+
+
+TRANSFORMING_FUNCTIONS = [
+    "date_from_json",
+    "datetime_from_json",
+    "double_from_json",
+    "double_to_json",
+    "float_from_json",
+    "float_to_json",
+    "interval_from_json",
+    "interval_to_json",
+    "json_from_json",
+    "json_to_json",
+    "numeric_from_json",
+    "numeric_to_json",
+    "time_from_json",
+    "uuid_from_json",
+]
+
+TEXT_IDENTITY_FUNCTIONS = [
+    "date_to_json",
+    "datetime_to_json",
+    "time_to_json",
+]
+
+
+@mark.parametrize(
+    "name",
+    [
+        name
+        for name in dir(sqlalchemy)
+        if name.endswith(("_from_json", "_to_json"))
+        and name not in TRANSFORMING_FUNCTIONS
+        and name not in TEXT_IDENTITY_FUNCTIONS
+    ],
+)
+def test_identity_functions(name: str) -> None:
+    assert is_identity(getattr(sqlalchemy, name))
+
+
+@mark.parametrize("name", TRANSFORMING_FUNCTIONS)
+def test_transforming_functions(name: str) -> None:
+    assert not is_identity(getattr(sqlalchemy, name))
+
+
+@mark.parametrize("name", TEXT_IDENTITY_FUNCTIONS)
+def test_text_identity_functions(name: str) -> None:
+    function = getattr(sqlalchemy, name)
+
+    assert is_identity(function, Mock(params=None))
+    assert is_identity(function, Mock(params=TemporalParams(False, True, False)))
+    assert not is_identity(function, Mock(params=TemporalParams(True, False, False)))
@@ -9,16 +9,44 @@ from celery_sqlalchemy.model import sqlalchemy_1_4
 from celery_sqlalchemy.model import sqlalchemy_2_0
 
 from celery_sqlalchemy.model import add_schema
+from celery_sqlalchemy.model import build_schemas
+from celery_sqlalchemy.model import fields_getter
 from celery_sqlalchemy.model import load_model
 from celery_sqlalchemy.model import map_model
+from celery_sqlalchemy.model import model_class
+from celery_sqlalchemy.model import model_classes
+from celery_sqlalchemy.model import SchemaRegistry
+from celery_sqlalchemy.model import rehydrate_model
 from celery_sqlalchemy.model import schema_for_model
+from celery_sqlalchemy.model import schema_fingerprint
 from celery_sqlalchemy.model import schema_for_model_path
 from celery_sqlalchemy.model import schema_map_key
+from celery_sqlalchemy.model import schema_maps
+from celery_sqlalchemy.model import schema_models
 from celery_sqlalchemy.model import type_maps
+from celery_sqlalchemy.model import values_from_json
+from celery_sqlalchemy.model import values_from_row
+from celery_sqlalchemy.model import values_to_json
+from celery_sqlalchemy.model import values_to_row
 
 from celery_sqlalchemy.schema import Field
+from celery_sqlalchemy.schema import Schema
+
+from celery_sqlalchemy import json
 
 # system imports
+from dataclasses import replace
+
+from threading import Barrier
+from threading import Thread
+
+from time import sleep
+
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
 from unittest.mock import MagicMock
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -26,14 +54,60 @@ from unittest.mock import patch
 # dependency imports
 from pytest import mark
 
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import object_session
+
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy import event
+from sqlalchemy import inspect
+
 PATH = "celery_sqlalchemy.model"
 
+Base = declarative_base()
+
+
+class Model(Base):  # type: ignore
+    __tablename__ = "model"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
 
+class Stamped(Base):  # type: ignore
+    __tablename__ = "stamped"
+
+    id = Column(Integer, primary_key=True)
+    created = Column(DateTime)
+
+
+def make_schema() -> Schema:
+    field = Mock()
+    field.name = "name"
+    field.from_json.side_effect = lambda field, value: f"from {value}"
+    field.to_json.side_effect = lambda field, value: f"to {value}"
+
+    return Schema(
+        fields=[Mock(), field],
+        model=Model,
+        from_json_transforms=((1, field),),
+        getter=fields_getter(("id", "name")),
+        names=("id", "name"),
+        to_json_transforms=((1, field),),
+    )
+
+
+@patch(f"{PATH}.schema_models")
 @patch(f"{PATH}.schema_maps")
 @patch(f"{PATH}.schema_map_key")
 @patch(f"{PATH}.map_model")
 def test_add_schema(
-    map_model: Mock, schema_map_key: Mock, schema_maps: MagicMock
+    map_model: Mock,
+    schema_map_key: Mock,
+    schema_maps: MagicMock,
+    schema_models: MagicMock,
 ) -> None:
     model = Mock()
     mapper = Mock()
@@ -41,10 +115,66 @@ def test_add_schema(
 
     assert add_schema(model, mapper, interface) == map_model.return_value
 
-    map_model.assert_called_with(model, mapper, interface)
-    schema_map_key.assert_called_with(model)
+    map_model.assert_called_with(model.__class__, mapper, interface, compiled=False)
+    schema_map_key.assert_called_with(model.__class__)
+
+    schema_maps.__setitem__.assert_called_with(
+        (interface, schema_map_key()), map_model()
+    )
+    schema_models.__setitem__.assert_called_with(
+        (interface, model.__class__), map_model()
+    )
+
+
+@patch(f"{PATH}.schema_models")
+@patch(f"{PATH}.schema_maps")
+@patch(f"{PATH}.map_model")
+def test_add_schema__model_class(
+    map_model: Mock, schema_maps: MagicMock, schema_models: MagicMock
+) -> None:
+    model = Model
+    mapper = Mock()
+    interface = Mock()
+
+    add_schema(model, mapper, interface)
+
+    map_model.assert_called_with(model, mapper, interface, compiled=False)
+
+    schema_maps.__setitem__.assert_called_with(
+        (interface, f"{__name__}.Model"), map_model()
+    )
+    schema_models.__setitem__.assert_called_with((interface, model), map_model())
+
+
+def test_build_schemas() -> None:
+    def clear() -> None:
+        for model in (Model, Stamped):
+            schema_maps.pop((json, f"{__name__}.{model.__name__}"), None)
+            schema_models.pop((json, model), None)
+
+    clear()
+
+    try:
+        assert build_schemas([Model, Stamped], json) == (2, 2)
+        assert build_schemas([Model, Stamped], json) == (2, 0)
+        assert build_schemas([Model], json, compiled=True) == (1, 1)
+        assert schema_models[(json, Model)].to_json
+        assert schema_maps[(json, f"{__name__}.Stamped")].model is Stamped
 
-    schema_maps.__setitem__.assert_called_with(schema_map_key(), map_model())
+    finally:
+        clear()
+
+
+@mark.parametrize(
+    "names, expected",
+    [
+        ((), ()),
+        (("id",), (1,)),
+        (("id", "name"), (1, "test")),
+    ],
+)
+def test_fields_getter(names: Any, expected: Any) -> None:
+    assert fields_getter(names)(Model(id=1, name="test")) == expected
 
 
 @patch(f"{PATH}.import_module")
@@ -61,7 +191,7 @@ def test_load_model(import_module: Mock) -> None:
 def test_map_model(type: type) -> None:
     column = Mock(type=Mock(__class__=type))
     model = Mock()
-    mapper = Mock(columns=[column])
+    mapper = Mock(columns=[column], primary_key=[column])
     format_module = Mock()
 
     from_json = Mock()
@@ -87,16 +217,95 @@ def test_map_model(type: type) -> None:
     ]
 
     assert schema.model == model
+    assert schema.primary_key == tuple(schema.fields)
+    assert not schema.from_json
+    assert not schema.to_json
+
+
+@patch(f"{PATH}.compile_to_row")
+@patch(f"{PATH}.compile_to_json")
+@patch(f"{PATH}.compile_from_row")
+@patch(f"{PATH}.compile_from_json")
+def test_map_model__compiled(
+    compile_from_json: Mock,
+    compile_from_row: Mock,
+    compile_to_json: Mock,
+    compile_to_row: Mock,
+) -> None:
+    column = Mock(type=Mock(__class__=next(iter(type_maps))))
+    model = Mock()
+    mapper = Mock(columns=[column], primary_key=[])
+    format_module = Mock()
+
+    schema = map_model(model, mapper, format_module, compiled=True)
+
+    compile_from_json.assert_called_with(schema.fields)
+    compile_from_row.assert_called_with(schema.fields)
+    compile_to_json.assert_called_with(schema.fields)
+    compile_to_row.assert_called_with(schema.fields)
+
+    assert schema.from_json == compile_from_json.return_value
+    assert schema.from_row == compile_from_row.return_value
+    assert schema.to_json == compile_to_json.return_value
+    assert schema.to_row == compile_to_row.return_value
+
+
+def test_map_model__fingerprint() -> None:
+    schema = map_model(Mock(), inspect(Model), Mock())
+
+    assert schema.fingerprint == schema_fingerprint(schema.fields)
+
+
+def test_map_model__transforms() -> None:
+    schema = map_model(Mock(), inspect(Stamped), json)
+    id, created = schema.fields
+
+    assert schema.names == ("id", "created")
+    assert schema.fields_by_name == {"id": id, "created": created}
+    assert schema.from_json_transforms == ((1, created),)
+    assert schema.to_json_transforms == ()
+    assert schema.getter
+    assert schema.getter(Stamped(id=1)) == (1, None)
+
+
+def test_rehydrate_model() -> None:
+    init = Mock()
+
+    event.listen(Model, "init", init)
+
+    try:
+        instance = rehydrate_model(Model, {"id": 1, "name": "test"})
+
+    finally:
+        event.remove(Model, "init", init)
+
+    state = inspect(instance)
+
+    init.assert_not_called()
+
+    assert isinstance(instance, Model)
+    assert instance.id == 1
+    assert instance.name == "test"
+    assert state.detached
+    assert state.key == inspect(Model).identity_key_from_primary_key([1])
+    assert not state.modified
+    assert not object_session(instance)
+
+
+def test_rehydrate_model__without_primary_key() -> None:
+    instance = rehydrate_model(Model, {"id": None, "name": "test"})
+    state = inspect(instance)
+
+    assert instance.name == "test"
+    assert state.transient
+    assert not state.key
 
 
 @patch(f"{PATH}.add_schema")
-@patch(f"{PATH}.schema_maps")
-@patch(f"{PATH}.schema_map_key")
-def test_schema_for_model(
-    schema_map_key: Mock, schema_maps: Mock, add_schema: Mock
-) -> None:
+@patch(f"{PATH}.schema_models")
+def test_schema_for_model(schema_models: Mock, add_schema: Mock) -> None:
     schema = Mock()
-    schema_maps.get.return_value = schema
+    schema_models.get.return_value = schema
 
     model = Mock()
     mapper = Mock()
@@ -105,19 +314,15 @@ def test_schema_for_model(
     assert schema_for_model(model, mapper, interface) == schema
 
     add_schema.assert_not_called()
-    schema_map_key.assert_called_with(model)
-    schema_maps.get.assert_called_with(schema_map_key())
+    schema_models.get.assert_called_with((interface, model.__class__))
 
 
 @patch(f"{PATH}.add_schema")
-@patch(f"{PATH}.schema_maps")
-@patch(f"{PATH}.schema_map_key")
-def test_schema_for_model__adds_schema(
-    schema_map_key: Mock, schema_maps: Mock, add_schema: Mock
-) -> None:
+@patch(f"{PATH}.schema_models")
+def test_schema_for_model__adds_schema(schema_models: Mock, add_schema: Mock) -> None:
     schema = Mock()
     add_schema.return_value = schema
-    schema_maps.get.return_value = None
+    schema_models.get.return_value = None
 
     model = Mock()
     mapper = Mock()
@@ -125,7 +330,25 @@ def test_schema_for_model__adds_schema(
 
     assert schema_for_model(model, mapper, interface) == schema
 
-    add_schema.assert_called_with(model, mapper, interface)
+    add_schema.assert_called_with(model, mapper, interface, compiled=False)
+
+
+@patch(f"{PATH}.add_schema")
+@patch(f"{PATH}.schema_models")
+def test_schema_for_model__compiled_adds_schema(
+    schema_models: Mock, add_schema: Mock
+) -> None:
+    schema_models.get.return_value = Mock(to_json=None)
+
+    model = Mock()
+    mapper = Mock()
+    interface = Mock()
+
+    assert schema_for_model(model, mapper, interface, compiled=True) == (
+        add_schema.return_value
+    )
+
+    add_schema.assert_called_with(model, mapper, interface, compiled=True)
 
 
 @patch(f"{PATH}.schema_maps")
@@ -137,7 +360,7 @@ def test_schema_for_model_path(schema_maps: Mock) -> None:
 
     assert schema_for_model_path(model_path, interface) == schema
 
-    schema_maps.get.assert_called_with(model_path)
+    schema_maps.get.assert_called_with((interface, model_path))
 
 
 @patch(f"{PATH}.add_schema")
@@ -161,13 +384,159 @@ def test_schema_for_model_path__adds_schema(
 
     load_model.assert_called_with(model_path)
     inspect.assert_called_with(model)
-    add_schema.assert_called_with(model, mapper, interface)
+    add_schema.assert_called_with(model, mapper, interface, compiled=False)
+
+    schema_maps.__setitem__.assert_called_with((interface, model_path), schema)
+
+
+@patch(f"{PATH}.add_schema")
+@patch(f"{PATH}.load_model")
+@patch(f"{PATH}.schema_models")
+@patch(f"{PATH}.schema_maps")
+def test_schema_for_model_path__aliased_model_path(
+    schema_maps: MagicMock,
+    schema_models: Mock,
+    load_model: Mock,
+    add_schema: Mock,
+) -> None:
+    schema = Mock()
+    schema_maps.get.return_value = None
+    schema_models.get.return_value = schema
+    model_path = Mock()
+    interface = Mock()
+
+    assert schema_for_model_path(model_path, interface) == schema
+
+    add_schema.assert_not_called()
+    schema_models.get.assert_called_with((interface, load_model.return_value))
+
+    schema_maps.__setitem__.assert_called_with((interface, model_path), schema)
+
+
+@patch(f"{PATH}.add_schema")
+@patch(f"{PATH}.inspect")
+@patch(f"{PATH}.load_model")
+@patch(f"{PATH}.schema_maps")
+def test_schema_for_model_path__compiled_adds_schema(
+    schema_maps: Mock, load_model: Mock, inspect: Mock, add_schema: Mock
+) -> None:
+    schema_maps.get.return_value = Mock(from_json=None)
+    model_path = Mock()
+    interface = Mock()
+
+    assert schema_for_model_path(model_path, interface, compiled=True) == (
+        add_schema.return_value
+    )
+
+    add_schema.assert_called_with(
+        load_model.return_value, inspect.return_value, interface, compiled=True
+    )
+
+
+@patch(f"{PATH}.schema_models", {})
+@patch(f"{PATH}.schema_maps", {})
+@patch(f"{PATH}.map_model", wraps=map_model)
+def test_schema_for_model_path__maps_model_once(map_model: Mock) -> None:
+    interface = Mock()
+
+    for _ in range(100):
+        schema_for_model_path(f"{__name__}.Model", interface)
+
+    map_model.assert_called_once_with(Model, inspect(Model), interface, compiled=False)
+
+    assert schema_for_model(Model(), inspect(Model), interface) == (
+        schema_for_model_path(f"{__name__}.Model", interface)
+    )
+
+
+def test_model_classes__base() -> None:
+    assert model_classes(Base) == [Model, Stamped]
+
+
+def test_model_classes__registry() -> None:
+    assert model_classes(Base.registry) == [Model, Stamped]
+
+
+def test_model_classes__list() -> None:
+    assert model_classes([Stamped, Model(), f"{__name__}.Model"]) == [
+        Stamped,
+        Model,
+        Model,
+    ]
+
+
+def test_model_class() -> None:
+    assert model_class(Model) == Model
+
+
+def test_model_class__instance() -> None:
+    assert model_class(Model()) == Model
 
 
 def test_schema_map_key() -> None:
-    model = Mock()
+    assert schema_map_key(Model) == f"{__name__}.Model"
+
+
+def test_schema_map_key__instance() -> None:
+    assert schema_map_key(Model()) == f"{__name__}.Model"
+
+
+def test_schema_registry__build_lock() -> None:
+    registry = SchemaRegistry()
+    interface = Mock()
 
-    assert schema_map_key(model) == f"{model.__module__}.{model.__class__.__name__}"
+    assert registry.build_lock(interface, Model) is registry.build_lock(
+        interface, Model
+    )
+    assert registry.build_lock(interface, Model) is not registry.build_lock(
+        interface, Stamped
+    )
+    assert registry.build_lock(interface, Model) is not registry.build_lock(
+        Mock(), Model
+    )
+
+
+@patch(f"{PATH}.registry", SchemaRegistry())
+@patch(f"{PATH}.schema_models", {})
+@patch(f"{PATH}.schema_maps", {})
+@patch(f"{PATH}.map_model")
+def test_schema_for_model__concurrent_first_use(mapped: Mock) -> None:
+    def slow_map_model(*args: Any, **kwargs: Any) -> Schema:
+        # widen the window in which other threads find the schema missing
+        sleep(0.001)
+
+        return map_model(*args, **kwargs)
+
+    def lookup(n: int) -> None:
+        barrier.wait()
+
+        models: List[Any] = [Model, Stamped]
+
+        for model in models:
+            if n % 2:
+                schema = schema_for_model(model, inspect(model), json)
+
+            else:
+                schema = schema_for_model_path(schema_map_key(model), json)
+
+            results.append((model, schema))
+
+    mapped.side_effect = slow_map_model
+    threads = 32
+    barrier = Barrier(threads)
+    results: List[Tuple[Any, Schema]] = []
+    workers = [Thread(target=lookup, args=(n,)) for n in range(threads)]
+
+    for worker in workers:
+        worker.start()
+
+    for worker in workers:
+        worker.join()
+
+    assert len(results) == threads * 2
+    assert mapped.call_count == 2
+    assert all(schema.model is model for model, schema in results)
+    assert len({id(schema) for _, schema in results}) == 2
 
 
 def test_type_maps() -> None:
@@ -177,3 +546,84 @@ def test_type_maps() -> None:
         **postgresql_1_4.type_maps,
         **postgresql_2_0.type_maps,
     }
+
+
+@patch(f"{PATH}.schema_models", {})
+@patch(f"{PATH}.schema_maps", {})
+@patch(f"{PATH}.map_model", wraps=map_model)
+def test_schema_for_model_path__maps_model_per_interface(map_model: Mock) -> None:
+    interfaces = [Mock(), Mock()]
+
+    schemas = [
+        schema_for_model_path(f"{__name__}.Model", interface)
+        for interface in interfaces
+    ]
+
+    assert schemas[0] is not schemas[1]
+    assert map_model.call_count == 2
+
+
+def test_schema_fingerprint() -> None:
+    fields = [
+        Field(from_json=Mock(), name="id", params=None, to_json=Mock(), type=Integer),
+        Field(from_json=Mock(), name="name", params=None, to_json=Mock(), type=String),
+    ]
+
+    assert schema_fingerprint(fields) == schema_fingerprint(list(fields))
+    assert len(schema_fingerprint(fields)) == 16
+
+
+@mark.parametrize(
+    "changed",
+    [
+        {"name": "other"},
+        {"type": String},
+        {"params": 1},
+    ],
+)
+def test_schema_fingerprint__changes(changed: Dict[str, Any]) -> None:
+    field = Field(
+        from_json=Mock(), name="id", params=None, to_json=Mock(), type=Integer
+    )
+
+    assert schema_fingerprint([field]) != schema_fingerprint(
+        [replace(field, **changed)]
+    )
+
+
+def test_schema_fingerprint__order() -> None:
+    fields = [
+        Field(from_json=Mock(), name="id", params=None, to_json=Mock(), type=Integer),
+        Field(from_json=Mock(), name="name", params=None, to_json=Mock(), type=String),
+    ]
+
+    assert schema_fingerprint(fields) != schema_fingerprint(fields[::-1])
+
+
+def test_values_from_json() -> None:
+    assert values_from_json(make_schema(), {"id": 1, "name": "test"}) == {
+        "id": 1,
+        "name": "from test",
+    }
+
+
+def test_values_from_json__missing() -> None:
+    assert values_from_json(make_schema(), {}) == {"id": None, "name": "from None"}
+
+
+def test_values_from_row() -> None:
+    assert values_from_row(make_schema(), [1, "test"]) == {
+        "id": 1,
+        "name": "from test",
+    }
+
+
+def test_values_to_json() -> None:
+    assert values_to_json(make_schema(), Model(id=1, name="test")) == {
+        "id": 1,
+        "name": "to test",
+    }
+
+
+def test_values_to_row() -> None:
+    assert values_to_row(make_schema(), Model(id=1, name="test")) == [1, "to test"]
@@ -0,0 +1,284 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.compression import is_compressed
+
+from celery_sqlalchemy.model import type_maps
+
+from celery_sqlalchemy.msgpack import MsgpackSerializer
+
+from celery_sqlalchemy.types import Args
+
+from celery_sqlalchemy import errors
+from celery_sqlalchemy import msgpack as interface
+
+# system imports
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from datetime import timezone
+
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from uuid import UUID
+
+# dependency imports
+from pytest import mark
+from pytest import raises
+
+from sqlalchemy.orm import declarative_base
+
+from sqlalchemy import Column
+from sqlalchemy import Date
+from sqlalchemy import DateTime
+from sqlalchemy import Integer
+from sqlalchemy import Interval
+from sqlalchemy import LargeBinary
+from sqlalchemy import Numeric
+from sqlalchemy import Time
+
+import sqlalchemy
+
+import msgpack
+
+PATH = "celery_sqlalchemy.msgpack"
+
+Base = declarative_base()
+
+
+class Model(Base):  # type: ignore
+    __tablename__ = "model"
+
+    id = Column(Integer, primary_key=True)
+    binary = Column(LargeBinary)
+    date = Column(Date)
+    datetime = Column(DateTime)
+    datetime_tz = Column(DateTime(timezone=True))
+    interval = Column(Interval)
+    numeric = Column(Numeric(10, 2))
+    time = Column(Time)
+    uuid = Column(sqlalchemy.UUID)
+
+
+UUID_VALUE = UUID("12345678-1234-5678-1234-567812345678")
+
+
+def make_model(id: int = 1) -> Model:
+    return Model(
+        id=id,
+        binary=b"\x00\xff" * 8,
+        date=date(2020, 1, 2),
+        datetime=datetime(2020, 1, 2, 3, 4, 5, 6),
+        datetime_tz=datetime(2020, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc),
+        interval=timedelta(days=1, seconds=2, microseconds=3),
+        time=time(1, 2, 3, 4),
+        uuid=UUID_VALUE,
+    )
+
+
+def test___init___set_interface() -> None:
+    serializer = MsgpackSerializer()
+
+    assert serializer.interface is interface
+
+
+@mark.parametrize("type", type_maps.keys())
+def test_interface(type: type) -> None:
+    assert callable(getattr(interface, type_maps[type].from_json))
+    assert callable(getattr(interface, type_maps[type].params))
+    assert callable(getattr(interface, type_maps[type].to_json))
+
+
+@mark.parametrize(
+    "arg, json",
+    [
+        (date(2020, 1, 2), "2020-01-02"),
+        (datetime(2020, 1, 2, 3, 4, 5), "2020-01-02T03:04:05"),
+        (time(1, 2, 3), "01:02:03"),
+        (UUID_VALUE, str(UUID_VALUE)),
+    ],
+)
+def test_arg_to_json__iso(arg: object, json: str) -> None:
+    serializer = MsgpackSerializer()
+
+    assert serializer.arg_to_json(arg) == json
+
+
+def test_arg_to_json__raises_serialization_error() -> None:
+    serializer = MsgpackSerializer()
+
+    with raises(errors.SerializationError) as ex:
+        serializer.arg_to_json(Mock())
+
+    assert str(ex.value) == "Cannot serialize type 'Mock'"
+
+
+@patch(f"{PATH}.msgpack")
+def test_dumps(msgpack: Mock) -> None:
+    json = Mock()
+    serializer = MsgpackSerializer()
+
+    assert serializer.dumps(json) == msgpack.Packer.return_value.pack.return_value
+
+    msgpack.Packer.assert_called_with(default=serializer.arg_to_json, use_bin_type=True)
+    msgpack.Packer.return_value.pack.assert_called_with(json)
+
+
+def test_pack() -> None:
+    serializer = MsgpackSerializer()
+    json = {
+        "$arg$": serializer.plain_arg({"n": [1, 2]}),
+        "$args$": [1, serializer.plain_arg([3, "text"]), [4, 5]],
+        "$kwargs$": {"plain": serializer.plain_arg(None), "nested": {"m": [6]}},
+    }
+
+    assert serializer.pack(json, serializer.arg_to_json) == msgpack.packb(
+        {
+            "$arg$": {"n": [1, 2]},
+            "$args$": [1, [3, "text"], [4, 5]],
+            "$kwargs$": {"plain": None, "nested": {"m": [6]}},
+        },
+        use_bin_type=True,
+    )
+
+
+def test_plain_arg() -> None:
+    serializer = MsgpackSerializer()
+
+    with patch.object(
+        serializer, "dumps_plain", wraps=serializer.dumps_plain
+    ) as dumps_plain:
+        message = serializer.message_from_args(
+            Args(arg=None, args=[list(range(100))], kwargs={"meta": {"n": 1}})
+        )
+
+    assert dumps_plain.call_count == 2
+    assert serializer.loads(message) == {
+        "$arg$": None,
+        "$args$": [list(range(100))],
+        "$kwargs$": {"meta": {"n": 1}},
+    }
+
+
+def test_plain_arg__model() -> None:
+    serializer = MsgpackSerializer()
+
+    assert serializer.plain_arg([Model(id=1)]) is None
+
+
+@patch(f"{PATH}.msgpack")
+def test_loads(msgpack: Mock) -> None:
+    message = Mock()
+    serializer = MsgpackSerializer()
+
+    assert serializer.loads(message) == msgpack.unpackb.return_value
+
+    msgpack.unpackb.assert_called_with(message, raw=False, strict_map_key=False)
+
+
+@mark.parametrize("batches", [False, True])
+@mark.parametrize("compiled", [False, True])
+def test_message(batches: bool, compiled: bool) -> None:
+    model = make_model()
+    serializer = MsgpackSerializer(batches=batches, compiled=compiled)
+    message = serializer.message_from_args(
+        Args(arg=None, args=[model, [model, make_model(2)]], kwargs={"n": 1})
+    )
+    args = serializer.message_to_args(message)
+
+    assert args.args
+    assert args.kwargs == {"n": 1}
+
+    for result in [args.args[0], *args.args[1]]:
+        for column in Model.__table__.columns:
+            if column.name != "id":
+                assert getattr(result, column.name) == getattr(model, column.name)
+
+
+def test_message__deduplicate_batches() -> None:
+    model = Model(id=1)
+    serializer = MsgpackSerializer(batches=True, deduplicate=True)
+    message = serializer.message_from_args(
+        Args(arg=None, args=[[model, model], model], kwargs={})
+    )
+
+    args = serializer.message_to_args(message)
+
+    assert args.args
+    assert args.args[0][0] is args.args[0][1] is args.args[1]
+
+
+def test_message_from_args__binary_native() -> None:
+    model = make_model()
+    serializer = MsgpackSerializer()
+    message = serializer.message_from_args(Args(arg=model, args=[], kwargs={}))
+    json = msgpack.unpackb(message)["$arg$"]
+
+    assert json["binary"] == model.binary
+    assert json["uuid"] == UUID_VALUE.bytes
+    assert json["datetime"] == 1577934245000006
+    assert json["date"] == 18263
+
+
+def test_message__nested_models() -> None:
+    serializer = MsgpackSerializer()
+    message = serializer.message_from_args(
+        Args(arg=None, args=[{"model": make_model(), 1: [make_model(2)]}], kwargs={})
+    )
+
+    args = serializer.message_to_args(message)
+
+    assert args.args
+    assert args.args[0]["model"].id == 1
+    assert args.args[0][1][0].id == 2
+
+
+def test_message__compression() -> None:
+    models = [make_model(n) for n in range(1, 50)]
+    serializer = MsgpackSerializer(compression="zlib", compression_threshold=1024)
+    message = serializer.message_from_args(Args(arg=None, args=[models], kwargs={}))
+
+    args = serializer.message_to_args(message)
+
+    assert is_compressed(message)
+    assert args.args
+    assert [model.id for model in args.args[0]] == list(range(1, 50))
+
+
+def test_message_from_object() -> None:
+    serializer = MsgpackSerializer()
+    message = serializer.message_from_object({"eta": datetime(2020, 1, 2), "n": 1})
+
+    assert serializer.message_to_object(message) == {
+        "eta": "2020-01-02T00:00:00",
+        "n": 1,
+    }
+
+
+def test_message_from_object__models() -> None:
+    models = [make_model(n) for n in range(1, 4)]
+    serializer = MsgpackSerializer()
+    message = serializer.message_from_object(
+        {"date_done": datetime(2020, 1, 2), "result": models}
+    )
+
+    value = serializer.message_to_object(message)
+
+    assert value["date_done"] == "2020-01-02T00:00:00"
+    assert [model.id for model in value["result"]] == [1, 2, 3]
+
+
+def test_message_to_object() -> None:
+    model = make_model()
+    serializer = MsgpackSerializer()
+    message = serializer.message_from_args(Args(arg=model, args=[], kwargs={}))
+
+    args = serializer.message_to_object(message)
+
+    assert isinstance(args, Args)
+    assert args.arg
+    assert args.arg.uuid == UUID_VALUE
@@ -0,0 +1,64 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.msgpack import postgresql
+
+# system imports
+from unittest.mock import Mock
+from unittest.mock import patch
+
+# dependency imports
+from pytest import mark
+
+PATH = "celery_sqlalchemy.msgpack.postgresql"
+
+
+@mark.parametrize(
+    "function, delegate",
+    [
+        ("postgresql_interval_from_json", "interval_from_json"),
+        ("postgresql_interval_to_json", "interval_to_json"),
+        ("postgresql_json_from_json", "json_from_json"),
+        ("postgresql_json_to_json", "json_to_json"),
+        ("postgresql_jsonb_from_json", "json_from_json"),
+        ("postgresql_jsonb_to_json", "json_to_json"),
+        ("postgresql_time_from_json", "time_from_json"),
+        ("postgresql_time_to_json", "time_to_json"),
+        ("postgresql_timestamp_from_json", "datetime_from_json"),
+        ("postgresql_timestamp_to_json", "datetime_to_json"),
+    ],
+)
+@patch(f"{PATH}.sqlalchemy")
+def test_postgresql_conversion(sqlalchemy: Mock, function: str, delegate: str) -> None:
+    field = Mock()
+    value = Mock()
+
+    assert (
+        getattr(postgresql, function)(field, value)
+        == getattr(sqlalchemy, delegate).return_value
+    )
+
+    getattr(sqlalchemy, delegate).assert_called_with(field, value)
+
+
+@mark.parametrize(
+    "function, delegate",
+    [
+        ("postgresql_interval_params", "interval_params"),
+        ("postgresql_json_params", "json_params"),
+        ("postgresql_jsonb_params", "json_params"),
+        ("postgresql_time_params", "time_params"),
+        ("postgresql_timestamp_params", "datetime_params"),
+    ],
+)
+@patch(f"{PATH}.sqlalchemy")
+def test_postgresql_params(sqlalchemy: Mock, function: str, delegate: str) -> None:
+    column = Mock()
+
+    assert getattr(postgresql, function)(column) == (
+        getattr(sqlalchemy, delegate).return_value
+    )
+
+    getattr(sqlalchemy, delegate).assert_called_with(column)
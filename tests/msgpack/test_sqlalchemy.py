@@ -0,0 +1,249 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.msgpack import sqlalchemy
+
+from celery_sqlalchemy.raw_json import RawJson
+
+# system imports
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from datetime import timezone
+
+from unittest.mock import Mock
+
+from uuid import UUID
+
+# dependency imports
+from pytest import mark
+
+PATH = "celery_sqlalchemy.msgpack.sqlalchemy"
+
+UUID_VALUE = UUID("12345678-1234-5678-1234-567812345678")
+
+
+def test_date_from_json() -> None:
+    field = Mock()
+
+    assert sqlalchemy.date_from_json(field, 18262) == date(2020, 1, 1)
+
+
+def test_date_from_json__none() -> None:
+    field = Mock()
+
+    assert sqlalchemy.date_from_json(field, None) is None
+
+
+def test_date_params() -> None:
+    column = Mock()
+
+    assert not sqlalchemy.date_params(column)
+
+
+def test_date_to_json() -> None:
+    field = Mock()
+
+    assert sqlalchemy.date_to_json(field, date(2020, 1, 1)) == 18262
+
+
+def test_date_to_json__none() -> None:
+    field = Mock()
+
+    assert sqlalchemy.date_to_json(field, None) is None
+
+
+def test_datetime_from_json() -> None:
+    field = Mock(params=False)
+
+    assert sqlalchemy.datetime_from_json(field, 1577836800000001) == datetime(
+        2020, 1, 1, microsecond=1
+    )
+
+
+def test_datetime_from_json__none() -> None:
+    field = Mock()
+
+    assert sqlalchemy.datetime_from_json(field, None) is None
+
+
+def test_datetime_from_json__timezone() -> None:
+    field = Mock(params=True)
+
+    assert sqlalchemy.datetime_from_json(field, 1577836800000000) == datetime(
+        2020, 1, 1, tzinfo=timezone.utc
+    )
+
+
+@mark.parametrize("timezone", [False, True])
+def test_datetime_params(timezone: bool) -> None:
+    column = Mock(type=Mock(timezone=timezone))
+
+    assert sqlalchemy.datetime_params(column) is timezone
+
+
+def test_datetime_to_json() -> None:
+    field = Mock()
+
+    assert (
+        sqlalchemy.datetime_to_json(field, datetime(2020, 1, 1, microsecond=1))
+        == 1577836800000001
+    )
+
+
+def test_datetime_to_json__none() -> None:
+    field = Mock()
+
+    assert sqlalchemy.datetime_to_json(field, None) is None
+
+
+def test_datetime_to_json__timezone() -> None:
+    field = Mock()
+    value = datetime(2020, 1, 1, 2, tzinfo=timezone(timedelta(hours=2)))
+
+    assert sqlalchemy.datetime_to_json(field, value) == 1577836800000000
+
+
+def test_interval_from_json() -> None:
+    field = Mock()
+
+    assert sqlalchemy.interval_from_json(field, 86400000001) == timedelta(
+        days=1, microseconds=1
+    )
+
+
+def test_interval_from_json__none() -> None:
+    field = Mock()
+
+    assert sqlalchemy.interval_from_json(field, None) is None
+
+
+def test_interval_params() -> None:
+    column = Mock()
+
+    assert not sqlalchemy.interval_params(column)
+
+
+def test_interval_to_json() -> None:
+    field = Mock()
+
+    assert (
+        sqlalchemy.interval_to_json(field, timedelta(days=1, microseconds=1))
+        == 86400000001
+    )
+
+
+def test_interval_to_json__none() -> None:
+    field = Mock()
+
+    assert sqlalchemy.interval_to_json(field, None) is None
+
+
+def test_json_from_json() -> None:
+    field = Mock()
+
+    assert sqlalchemy.json_from_json(field, {"$json$": "[1]"}) == RawJson("[1]")
+    assert sqlalchemy.json_from_json(field, [1]) == [1]
+
+
+def test_json_params() -> None:
+    column = Mock()
+
+    assert not sqlalchemy.json_params(column)
+
+
+def test_json_to_json() -> None:
+    field = Mock()
+
+    assert sqlalchemy.json_to_json(field, RawJson("[1]")) == {"$json$": "[1]"}
+    assert sqlalchemy.json_to_json(field, [1]) == [1]
+
+
+def test_json_to_json__marker() -> None:
+    field = Mock()
+    value = {"$json$": "[1]"}
+
+    assert (
+        sqlalchemy.json_from_json(field, sqlalchemy.json_to_json(field, value)) == value
+    )
+
+
+def test_time_from_json() -> None:
+    field = Mock()
+
+    assert sqlalchemy.time_from_json(field, 3723000004) == time(1, 2, 3, 4)
+
+
+def test_time_from_json__iso() -> None:
+    field = Mock()
+
+    assert sqlalchemy.time_from_json(field, "01:02:03+00:00") == time(
+        1, 2, 3, tzinfo=timezone.utc
+    )
+
+
+def test_time_from_json__none() -> None:
+    field = Mock()
+
+    assert sqlalchemy.time_from_json(field, None) is None
+
+
+def test_time_params() -> None:
+    column = Mock()
+
+    assert not sqlalchemy.time_params(column)
+
+
+def test_time_to_json() -> None:
+    field = Mock()
+
+    assert sqlalchemy.time_to_json(field, time(1, 2, 3, 4)) == 3723000004
+
+
+def test_time_to_json__none() -> None:
+    field = Mock()
+
+    assert sqlalchemy.time_to_json(field, None) is None
+
+
+def test_time_to_json__timezone() -> None:
+    field = Mock()
+
+    assert (
+        sqlalchemy.time_to_json(field, time(1, 2, 3, tzinfo=timezone.utc))
+        == "01:02:03+00:00"
+    )
+
+
+def test_uuid_from_json() -> None:
+    field = Mock()
+
+    assert sqlalchemy.uuid_from_json(field, UUID_VALUE.bytes) == UUID_VALUE
+
+
+def test_uuid_from_json__none() -> None:
+    field = Mock()
+
+    assert sqlalchemy.uuid_from_json(field, None) is None
+
+
+def test_uuid_params() -> None:
+    column = Mock()
+
+    assert not sqlalchemy.uuid_params(column)
+
+
+@mark.parametrize("value", [UUID_VALUE, str(UUID_VALUE)])
+def test_uuid_to_json(value: UUID) -> None:
+    field = Mock()
+
+    assert sqlalchemy.uuid_to_json(field, value) == UUID_VALUE.bytes
+
+
+def test_uuid_to_json__none() -> None:
+    field = Mock()
+
+    assert sqlalchemy.uuid_to_json(field, None) is None
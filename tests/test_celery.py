@@ -4,42 +4,103 @@
 
 # celery-sqlalchemy types
 from celery_sqlalchemy.celery import deserialize
+from celery_sqlalchemy.celery import deserialize_message
+from celery_sqlalchemy.celery import fallback_messages
+from celery_sqlalchemy.celery import get_serializer
 from celery_sqlalchemy.celery import initialize
 from celery_sqlalchemy.celery import serialize
+from celery_sqlalchemy.celery import serialize_args
+from celery_sqlalchemy.celery import warm_up
+
+from celery_sqlalchemy.claim_check import FileBlobStore
+from celery_sqlalchemy.claim_check import is_claim_check
+
+from celery_sqlalchemy.json import JsonSerializer
+
+from celery_sqlalchemy.positional import PositionalSerializer
+
+from celery_sqlalchemy.types import Args
+from celery_sqlalchemy.types import Measurement
+from celery_sqlalchemy.types import Message
+from celery_sqlalchemy.types import Serializer
+from celery_sqlalchemy.types import WarmUp
 
 from celery_sqlalchemy import errors
 
 # system imports
+from pathlib import Path
+
 from typing import Any
 from typing import Dict
+from typing import List
+from typing import Tuple
 
 from unittest.mock import Mock
 from unittest.mock import patch
 
 # dependency imports
+from kombu import serialization
+
 from pytest import mark
 from pytest import raises
 
+import orjson
+
 PATH = "celery_sqlalchemy.celery"
 
 
+class ArgsSerializer:
+    # custom serializer that only serializes task messages
+    def arg_from_json(self, arg: Any) -> Any:
+        return arg
+
+    def arg_to_json(self, arg: Any) -> Any:
+        return arg
+
+    def message_from_args(self, args: Args) -> Message:
+        return orjson.dumps({"arg": args.arg, "args": args.args, "kwargs": args.kwargs})
+
+    def message_to_args(self, message: Message) -> Args:
+        json = orjson.loads(message)
+
+        return Args(arg=json["arg"], args=json["args"], kwargs=json["kwargs"])
+
+
+class ProtocolSerializer(ArgsSerializer, Serializer):
+    pass
+
+
+def assert_registered(
+    serialization: Mock,
+    content_type: Any,
+    serializer: Any,
+    mime_type: Any = "json",
+    content_encoding: Any = "utf-8",
+    on_measurement: Any = None,
+) -> None:
+    registered_type, encoder, decoder, *encoding = serialization.register.call_args.args
+
+    assert registered_type == content_type
+    assert encoder.func is serialize_args
+    assert encoder.args == (serializer, on_measurement)
+    assert decoder.func is deserialize_message
+    assert decoder.args == (serializer, on_measurement)
+    assert encoding == [mime_type, content_encoding]
+
+
 @patch(f"{PATH}.serialization")
 def test___init__(serialization: Mock) -> None:
     celery = Mock()
-    serializer = Mock()
+    serializer = Mock(compression=None)
     content_type = "json+sqlalchemy"
 
     initialize(celery, serializer)
 
-    serialization.register.assert_called_with(
-        content_type,
-        serialize,
-        deserialize,
-        "json",
-    )
+    assert_registered(serialization, content_type, serializer)
 
     assert celery.conf.accept_content == [content_type]
     assert celery.conf.result_accept_content == [content_type]
+    assert celery.conf.result_serializer == content_type
     assert celery.conf.task_serializer == content_type
 
     from celery_sqlalchemy.celery import __SERIALIZER__
@@ -50,70 +111,269 @@ def test___init__(serialization: Mock) -> None:
 @patch(f"{PATH}.serialization")
 def test___init___set_apply_serializer__false(serialization: Mock) -> None:
     celery = Mock()
-    serializer = Mock()
+    serializer = Mock(compression=None)
 
     celery.conf.accept_content = None
     celery.conf.result_accept_content = None
+    celery.conf.result_serializer = None
     celery.conf.task_serializer = None
 
     initialize(celery, serializer, apply_serializer=False)
 
-    serialization.register.assert_called_with(
-        "json+sqlalchemy",
-        serialize,
-        deserialize,
-        "json",
-    )
+    assert_registered(serialization, "json+sqlalchemy", serializer)
 
     assert not celery.conf.accept_content
     assert not celery.conf.result_accept_content
+    assert not celery.conf.result_serializer
     assert not celery.conf.task_serializer
 
 
 @patch(f"{PATH}.serialization")
 def test___init___set_apply_serializer__true(serialization: Mock) -> None:
     celery = Mock()
-    serializer = Mock()
+    serializer = Mock(compression=None)
     content_type = "json+sqlalchemy"
 
     celery.conf.accept_content = None
     celery.conf.result_accept_content = None
+    celery.conf.result_serializer = None
     celery.conf.task_serializer = None
 
     initialize(celery, serializer, apply_serializer=True)
 
-    serialization.register.assert_called_with(
-        content_type,
-        serialize,
-        deserialize,
-        "json",
-    )
+    assert_registered(serialization, content_type, serializer)
 
     assert celery.conf.accept_content == [content_type]
     assert celery.conf.result_accept_content == [content_type]
+    assert celery.conf.result_serializer == content_type
     assert celery.conf.task_serializer == content_type
 
 
+@patch(f"{PATH}.__MIME_TYPES__", {})
 @patch(f"{PATH}.serialization")
 def test___init___set_content_type(serialization: Mock) -> None:
     celery = Mock()
-    serializer = Mock()
+    serializer = Mock(compression=None)
     content_type = Mock()
 
     initialize(celery, serializer, content_type=content_type)
 
-    serialization.register.assert_called_with(
-        content_type,
-        serialize,
-        deserialize,
-        "json",
-    )
+    assert_registered(serialization, content_type, serializer)
 
     assert celery.conf.accept_content == [content_type]
     assert celery.conf.result_accept_content == [content_type]
+    assert celery.conf.result_serializer == content_type
     assert celery.conf.task_serializer == content_type
 
 
+@patch(f"{PATH}.serialization")
+def test___init___set_on_measurement(serialization: Mock) -> None:
+    measurement = Mock()
+
+    from celery_sqlalchemy import celery
+
+    initialize(Mock(), Mock(), on_measurement=measurement)
+
+    try:
+        assert celery.__MEASUREMENT__ is measurement
+
+    finally:
+        initialize(Mock(), Mock())
+
+    assert celery.__MEASUREMENT__ is None
+
+
+@patch(f"{PATH}.warm_up")
+@patch(f"{PATH}.serialization")
+def test___init___set_models(serialization: Mock, warm_up: Mock) -> None:
+    models = Mock()
+
+    serializer = Mock()
+
+    assert initialize(Mock(), serializer, models=models) == warm_up.return_value
+
+    warm_up.assert_called_with(models, serializer)
+
+
+@patch(f"{PATH}.warm_up")
+@patch(f"{PATH}.serialization")
+def test___init___without_models(serialization: Mock, warm_up: Mock) -> None:
+    assert initialize(Mock(), Mock()) is None
+
+    warm_up.assert_not_called()
+
+
+@patch(f"{PATH}.__MIME_TYPES__", {})
+@patch(f"{PATH}.__SERIALIZERS__", {})
+@patch(f"{PATH}.__SERIALIZER__", None)
+@patch(f"{PATH}.serialization")
+def test___init___multiple_content_types(serialization: Mock) -> None:
+    celery = Mock()
+    json_serializer = Mock()
+    binary_serializer = Mock()
+    binary_serializer.message_from_object.return_value = b"message"
+    measurement = Mock()
+
+    initialize(celery, json_serializer)
+    json_encoder = serialization.register.call_args.args[1]
+
+    initialize(
+        celery,
+        binary_serializer,
+        apply_serializer=False,
+        content_type="msgpack+sqlalchemy",
+        mime_type="msgpack",
+        content_encoding="binary",
+        on_measurement=measurement,
+    )
+    binary_encoder = serialization.register.call_args.args[1]
+
+    assert get_serializer() is json_serializer
+    assert get_serializer("json+sqlalchemy") is json_serializer
+    assert get_serializer("msgpack+sqlalchemy") is binary_serializer
+    assert celery.conf.task_serializer == "json+sqlalchemy"
+
+    assert json_encoder({}) == json_serializer.message_from_object.return_value
+    assert binary_encoder({}) == b"message"
+    assert measurement.call_args.args[0].size == 7
+
+    assert_registered(
+        serialization,
+        "msgpack+sqlalchemy",
+        binary_serializer,
+        mime_type="msgpack",
+        content_encoding="binary",
+        on_measurement=measurement,
+    )
+
+
+@patch(f"{PATH}.__MIME_TYPES__", {})
+@patch(f"{PATH}.__SERIALIZERS__", {})
+@patch(f"{PATH}.__SERIALIZER__", None)
+def test___init___decodes_each_content_type() -> None:
+    args: Tuple[List[Any], Dict[str, Any], Any] = ([1, "a"], {"b": 2}, None)
+    content_types = {
+        "json+test": (JsonSerializer(), "application/x-json+test", "utf-8"),
+        "positional+test": (
+            PositionalSerializer(),
+            "application/x-positional+test",
+            "binary",
+        ),
+    }
+
+    try:
+        for content_type, (serializer, mime_type, encoding) in content_types.items():
+            initialize(
+                Mock(),
+                serializer,
+                apply_serializer=False,
+                content_type=content_type,
+                mime_type=mime_type,
+                content_encoding=encoding,
+            )
+
+        for content_type, (_, mime_type, encoding) in content_types.items():
+            sent_type, sent_encoding, message = serialization.dumps(
+                args, serializer=content_type
+            )
+
+            assert (sent_type, sent_encoding) == (mime_type, encoding)
+            assert serialization.loads(
+                message, sent_type, sent_encoding, accept=[sent_type]
+            ) == [[1, "a"], {"b": 2}, None]
+
+    finally:
+        for content_type in content_types:
+            serialization.registry.unregister(content_type)
+
+
+@patch(f"{PATH}.__MIME_TYPES__", {})
+@patch(f"{PATH}.__SERIALIZERS__", {})
+@patch(f"{PATH}.__SERIALIZER__", None)
+@patch(f"{PATH}.serialization")
+def test___init___mime_type_registered(serialization: Mock) -> None:
+    initialize(Mock(), Mock())
+
+    with raises(errors.SerializationError) as ex:
+        initialize(Mock(), Mock(), content_type="other+sqlalchemy")
+
+    assert str(ex.value) == "Mime type json is registered to json+sqlalchemy"
+    assert serialization.register.call_count == 1
+
+
+@patch(f"{PATH}.__MIME_TYPES__", {})
+@patch(f"{PATH}.__SERIALIZERS__", {})
+@patch(f"{PATH}.__SERIALIZER__", None)
+@patch(f"{PATH}.serialization")
+def test___init___apply_serializer_sets_default(serialization: Mock) -> None:
+    serializer = Mock()
+
+    initialize(Mock(), Mock())
+    initialize(Mock(), serializer, content_type="other+sqlalchemy", mime_type="other")
+
+    assert get_serializer() is serializer
+
+
+@patch(f"{PATH}.serialization")
+def test___init___compression(serialization: Mock) -> None:
+    serializer = Mock(compression="zlib")
+
+    initialize(Mock(), serializer)
+
+    assert_registered(serialization, "json+sqlalchemy", serializer, "json", "binary")
+
+
+@mark.parametrize("compression", [None, "zlib"])
+@patch(f"{PATH}.__SERIALIZERS__", {})
+@patch(f"{PATH}.serialization")
+def test___init___set_blob_store(
+    serialization: Mock, tmp_path: Path, compression: Any
+) -> None:
+    blob_store = FileBlobStore(str(tmp_path))
+    args: Tuple[List[Any], Dict[str, Any], Any] = ([list(range(1000))], {}, None)
+
+    initialize(
+        Mock(),
+        JsonSerializer(compression=compression, compression_threshold=0),
+        apply_serializer=False,
+        blob_store=blob_store,
+        blob_threshold=1024,
+    )
+
+    _, encoder, decoder, *_ = serialization.register.call_args.args
+    message = encoder(args)
+
+    assert is_claim_check(message)
+    assert len(list(tmp_path.iterdir())) == 1
+    assert decoder(message) == [[list(range(1000))], {}, None]
+    assert not is_claim_check(encoder(([1], {}, None)))
+
+
+@patch(f"{PATH}.serialization")
+def test___init___set_mime_type(serialization: Mock) -> None:
+    celery = Mock()
+    serializer = Mock(compression=None)
+    content_type = Mock()
+    mime_type = Mock()
+    content_encoding = Mock()
+
+    initialize(
+        celery,
+        serializer,
+        content_type=content_type,
+        mime_type=mime_type,
+        content_encoding=content_encoding,
+    )
+
+    assert_registered(
+        serialization,
+        content_type,
+        serializer,
+        mime_type=mime_type,
+        content_encoding=content_encoding,
+    )
+
+
 def test_deserialize() -> None:
     serializer = Mock()
 
@@ -121,31 +381,58 @@ def test_deserialize() -> None:
 
     celery.__SERIALIZER__ = serializer
 
-    args = Mock()
+    args = Args(arg=Mock(), args=[Mock()], kwargs={"name": Mock()})
     message = Mock()
-    serializer.message_to_args.return_value = args
+    serializer.message_to_object.return_value = args
+    fallback_count = fallback_messages()
 
     assert deserialize(message) == [args.args, args.kwargs, args.arg]
+    assert fallback_messages() == fallback_count
 
-    serializer.message_to_args.assert_called_with(message)
+    serializer.message_to_object.assert_called_once_with(message)
 
 
-@mark.parametrize("ex", [KeyError(), TypeError()])
-@patch(f"{PATH}.orjson")
-def test_deserialize__celery_message(orjson: Mock, ex: Exception) -> None:
+def test_deserialize__celery_message() -> None:
     serializer = Mock()
-    serializer.message_to_args.side_effect = ex
 
     from celery_sqlalchemy import celery
 
     celery.__SERIALIZER__ = serializer
 
     message = Mock()
+    fallback_count = fallback_messages()
+
+    assert deserialize(message) == serializer.message_to_object.return_value
+    assert fallback_messages() == fallback_count + 1
 
-    assert deserialize(message) == orjson.loads.return_value
+    serializer.message_to_object.assert_called_once_with(message)
+    serializer.message_to_args.assert_not_called()
 
-    serializer.message_to_args.assert_called_with(message)
-    orjson.loads.assert_called_with(message)
+
+@mark.parametrize("serializer", [ArgsSerializer(), ProtocolSerializer()])
+def test_deserialize_message__without_message_to_object(serializer: Any) -> None:
+    message = serializer.message_from_args(Args(arg=1, args=[2], kwargs={"n": 3}))
+
+    assert deserialize_message(serializer, None, message) == [[2], {"n": 3}, 1]
+    assert deserialize_message(serializer, None, b'{"result": 1}') == {"result": 1}
+
+
+@patch(f"{PATH}.perf_counter")
+def test_deserialize__measurement(perf_counter: Mock) -> None:
+    measurement = Mock()
+    serializer = Mock()
+    perf_counter.side_effect = [1.0, 3.0]
+
+    from celery_sqlalchemy import celery
+
+    celery.__SERIALIZER__ = serializer
+
+    with patch(f"{PATH}.__MEASUREMENT__", measurement):
+        deserialize(b"message")
+
+    measurement.assert_called_once_with(
+        Measurement(operation="deserialize", seconds=2.0, size=7)
+    )
 
 
 def test_deserialize__raises_serialization_error() -> None:
@@ -159,8 +446,19 @@ def test_deserialize__raises_serialization_error() -> None:
     assert str(ex.value) == "Serializer has not been initialized"
 
 
-@patch(f"{PATH}.orjson")
-def test_serialize__dict(orjson: Mock) -> None:
+@patch(f"{PATH}.__SERIALIZERS__", {})
+@patch(f"{PATH}.__SERIALIZER__", None)
+def test_get_serializer__raises_serialization_error() -> None:
+    with raises(errors.SerializationError) as ex:
+        get_serializer()
+
+    assert str(ex.value) == "Serializer has not been initialized"
+
+    with raises(errors.SerializationError):
+        get_serializer("json+sqlalchemy")
+
+
+def test_serialize__dict() -> None:
     serializer = Mock()
 
     from celery_sqlalchemy import celery
@@ -169,9 +467,36 @@ def test_serialize__dict(orjson: Mock) -> None:
 
     args: Dict[str, Any] = dict()
 
-    serialize(args)
+    assert serialize(args) == serializer.message_from_object.return_value
+
+    serializer.message_from_object.assert_called_with(args)
+
+
+@mark.parametrize("serializer", [ArgsSerializer(), ProtocolSerializer()])
+def test_serialize_args__without_message_from_object(serializer: Any) -> None:
+    assert serialize_args(serializer, None, {"result": 1}) == b'{"result":1}'
+    assert serialize_args(serializer, None, ([2], {"n": 3}, 1)) == (
+        b'{"arg":1,"args":[2],"kwargs":{"n":3}}'
+    )
+
+
+@patch(f"{PATH}.perf_counter")
+def test_serialize__measurement(perf_counter: Mock) -> None:
+    measurement = Mock()
+    serializer = Mock()
+    serializer.message_from_args.return_value = b"message"
+    perf_counter.side_effect = [1.0, 3.0]
+
+    from celery_sqlalchemy import celery
+
+    celery.__SERIALIZER__ = serializer
 
-    orjson.dumps.assert_called_with(args)
+    with patch(f"{PATH}.__MEASUREMENT__", measurement):
+        assert serialize(([], {}, None)) == b"message"
+
+    measurement.assert_called_once_with(
+        Measurement(operation="serialize", seconds=2.0, size=7)
+    )
 
 
 def test_serialize__raises_serialization_error() -> None:
@@ -185,6 +510,30 @@ def test_serialize__raises_serialization_error() -> None:
     assert str(ex.value) == "Serializer has not been initialized"
 
 
+def test_serialize__blob_store() -> None:
+    blob_store = Mock()
+    serializer = Mock()
+    serializer.message_from_object.return_value = b"message"
+
+    from celery_sqlalchemy import celery
+
+    celery.__SERIALIZER__ = serializer
+
+    with patch(f"{PATH}.__BLOB_STORE__", blob_store):
+        with patch(f"{PATH}.__BLOB_THRESHOLD__", 1):
+            message = serialize({})
+
+        with patch(f"{PATH}.__MEASUREMENT__", None):
+            serializer.message_to_object.return_value = {}
+
+            assert deserialize(message) == {}
+
+    assert is_claim_check(message)
+    assert blob_store.put.call_args.args[1] == b"message"
+
+    serializer.message_to_object.assert_called_with(blob_store.get.return_value)
+
+
 @patch(f"{PATH}.Args")
 def test_serialize__tuple(Args: Mock) -> None:
     serializer = Mock()
@@ -199,3 +548,61 @@ def test_serialize__tuple(Args: Mock) -> None:
 
     Args.assert_called_with(arg=args[2], args=args[0], kwargs=args[1])
     serializer.message_from_args.assert_called_with(Args())
+
+
+@patch(f"{PATH}.perf_counter")
+@patch(f"{PATH}.build_schemas")
+def test_warm_up(build_schemas: Mock, perf_counter: Mock) -> None:
+    measurement = Mock()
+    models = Mock()
+    serializer = Mock(compiled=True)
+    build_schemas.return_value = (3, 2)
+    perf_counter.side_effect = [1.0, 1.5]
+
+    from celery_sqlalchemy import celery
+
+    celery.__SERIALIZER__ = serializer
+
+    with patch(f"{PATH}.__MEASUREMENT__", measurement):
+        report = warm_up(models)
+
+    build_schemas.assert_called_with(models, serializer.interface, compiled=True)
+    measurement.assert_called_once_with(
+        Measurement(operation="warm_up", seconds=0.5, instances=2)
+    )
+
+    assert report == WarmUp(built=2, models=3, seconds=0.5)
+
+
+@patch(f"{PATH}.build_schemas")
+def test_warm_up__serializer(build_schemas: Mock) -> None:
+    serializer = Mock(compiled=False)
+    build_schemas.return_value = (1, 1)
+
+    from celery_sqlalchemy import celery
+
+    celery.__SERIALIZER__ = None
+
+    assert warm_up(["path.Model"], serializer).built == 1
+
+    build_schemas.assert_called_with(
+        ["path.Model"], serializer.interface, compiled=False
+    )
+
+
+def test_warm_up__raises_serialization_error() -> None:
+    from celery_sqlalchemy import celery
+
+    celery.__SERIALIZER__ = None
+
+    with raises(errors.SerializationError) as ex:
+        warm_up(Mock())
+
+    assert str(ex.value) == "Serializer has not been initialized"
+
+
+def test_warm_up__without_interface__raises_serialization_error() -> None:
+    with raises(errors.SerializationError) as ex:
+        warm_up(Mock(), Mock(interface=None))
+
+    assert str(ex.value) == "Serializer does not build schemas"
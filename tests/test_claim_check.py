@@ -0,0 +1,182 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.claim_check import CLAIM_CHECK_HEADER
+from celery_sqlalchemy.claim_check import FileBlobStore
+from celery_sqlalchemy.claim_check import check_in
+from celery_sqlalchemy.claim_check import check_out
+from celery_sqlalchemy.claim_check import is_claim_check
+
+from celery_sqlalchemy import errors
+
+# system imports
+from hashlib import blake2b
+
+from pathlib import Path
+
+from typing import Any
+from typing import Callable
+
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import os
+
+# dependency imports
+from pytest import mark
+from pytest import raises
+
+PATH = "celery_sqlalchemy.claim_check"
+
+MESSAGE = b'{"name": "model"}' * 100
+KEY = blake2b(MESSAGE, digest_size=32).hexdigest()
+
+
+def test_file_blob_store(tmp_path: Path) -> None:
+    store = FileBlobStore(str(tmp_path / "blobs"))
+
+    store.put(KEY, MESSAGE)
+
+    data = store.get(KEY)
+
+    assert isinstance(data, memoryview)
+    assert data == MESSAGE
+    assert (tmp_path / "blobs" / KEY).read_bytes() == MESSAGE
+
+
+def test_file_blob_store__get_empty(tmp_path: Path) -> None:
+    store = FileBlobStore(str(tmp_path))
+    (tmp_path / KEY).write_bytes(b"")
+
+    assert store.get(KEY) == b""
+
+
+def test_file_blob_store__get_missing(tmp_path: Path) -> None:
+    assert FileBlobStore(str(tmp_path)).get(KEY) is None
+
+
+@mark.parametrize("key", ["", "../secret", KEY.upper(), KEY + "0"])
+def test_file_blob_store__raises_serialization_error(tmp_path: Path, key: str) -> None:
+    with raises(errors.SerializationError) as ex:
+        FileBlobStore(str(tmp_path)).get(key)
+
+    assert str(ex.value) == f"Invalid claim check key: {key!r}"
+
+
+def test_file_blob_store__put_stored(tmp_path: Path) -> None:
+    store = FileBlobStore(str(tmp_path))
+    path = tmp_path / KEY
+
+    store.put(KEY, MESSAGE)
+    os.utime(path, (0, 0))
+
+    with patch(f"{PATH}.tempfile") as tempfile:
+        store.put(KEY, MESSAGE)
+
+    tempfile.mkstemp.assert_not_called()
+
+    assert path.stat().st_mtime > 0
+
+
+def test_file_blob_store__put_cleans_up(tmp_path: Path) -> None:
+    store = FileBlobStore(str(tmp_path))
+
+    with patch(f"{PATH}.os.replace", Mock(side_effect=OSError)):
+        with raises(OSError):
+            store.put(KEY, MESSAGE)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_file_blob_store__cleanup(tmp_path: Path) -> None:
+    store = FileBlobStore(str(tmp_path), ttl=60)
+    other = blake2b(b"other", digest_size=32).hexdigest()
+
+    store.put(KEY, MESSAGE)
+    store.put(other, b"other")
+    (tmp_path / "partial.tmp").write_bytes(b"partial")
+
+    os.utime(tmp_path / KEY, (1000, 1000))
+    os.utime(tmp_path / "partial.tmp", (1000, 1000))
+    os.utime(tmp_path / other, (1100, 1100))
+
+    assert store.cleanup(now=1090) == 2
+    assert [path.name for path in tmp_path.iterdir()] == [other]
+
+
+def test_file_blob_store__cleanup_without_ttl(tmp_path: Path) -> None:
+    store = FileBlobStore(str(tmp_path), ttl=None)
+
+    store.put(KEY, MESSAGE)
+    os.utime(tmp_path / KEY, (0, 0))
+
+    assert store.cleanup() == 0
+    assert store.get(KEY) == MESSAGE
+
+
+def test_check_in() -> None:
+    blob_store = Mock()
+
+    assert check_in(MESSAGE, blob_store, 1024) == CLAIM_CHECK_HEADER + KEY.encode()
+
+    blob_store.put.assert_called_once_with(KEY, MESSAGE)
+
+
+def test_check_in__below_threshold() -> None:
+    blob_store = Mock()
+
+    assert check_in(MESSAGE, blob_store, len(MESSAGE) + 1) is MESSAGE
+
+    blob_store.put.assert_not_called()
+
+
+def test_check_in__str() -> None:
+    blob_store = Mock()
+
+    assert check_in(MESSAGE.decode(), blob_store, 0) == (
+        CLAIM_CHECK_HEADER + KEY.encode()
+    )
+
+    blob_store.put.assert_called_once_with(KEY, MESSAGE)
+
+
+def test_check_in__stored_once(tmp_path: Path) -> None:
+    blob_store = FileBlobStore(str(tmp_path))
+
+    assert check_in(MESSAGE, blob_store, 0) == check_in(MESSAGE, blob_store, 0)
+    assert [path.name for path in tmp_path.iterdir()] == [KEY]
+
+
+@mark.parametrize("claim_check", [lambda m: m, lambda m: m.decode()])
+def test_check_out(tmp_path: Path, claim_check: Callable[[Any], Any]) -> None:
+    blob_store = FileBlobStore(str(tmp_path))
+    message = claim_check(check_in(MESSAGE, blob_store, 0))
+
+    assert check_out(message, blob_store) == MESSAGE
+
+
+def test_check_out__other_than_claim_check() -> None:
+    blob_store = Mock()
+
+    assert check_out(MESSAGE, blob_store) is MESSAGE
+
+    blob_store.get.assert_not_called()
+
+
+def test_check_out__raises_serialization_error() -> None:
+    blob_store = Mock()
+    blob_store.get.return_value = None
+
+    with raises(errors.SerializationError) as ex:
+        check_out(CLAIM_CHECK_HEADER + KEY.encode(), blob_store)
+
+    assert str(ex.value) == f"Claim check payload not found: {KEY}"
+
+
+def test_is_claim_check() -> None:
+    assert is_claim_check(CLAIM_CHECK_HEADER + KEY.encode())
+    assert is_claim_check((CLAIM_CHECK_HEADER + KEY.encode()).decode())
+    assert not is_claim_check(MESSAGE)
+    assert not is_claim_check(MESSAGE.decode())
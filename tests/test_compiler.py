@@ -0,0 +1,232 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy types
+from celery_sqlalchemy.compiler import compile_attribute
+from celery_sqlalchemy.compiler import compile_conversion
+from celery_sqlalchemy.compiler import compile_from_json
+from celery_sqlalchemy.compiler import compile_from_row
+from celery_sqlalchemy.compiler import compile_function
+from celery_sqlalchemy.compiler import compile_to_json
+from celery_sqlalchemy.compiler import compile_to_row
+
+from celery_sqlalchemy.schema import Field
+from celery_sqlalchemy.schema import identity
+from celery_sqlalchemy.schema import identity_when
+
+# system imports
+from typing import Any
+from typing import Dict
+
+from unittest.mock import Mock
+
+
+@identity
+def identity_json(field: Field, value: Any) -> Any:
+    return value
+
+
+@identity_when(lambda params: params is None)
+def unparameterized_json(field: Field, value: Any) -> Any:
+    return value
+
+
+def make_field(name: str, function: Any) -> Field:
+    return Field(
+        from_json=function, name=name, params=None, to_json=function, type=Mock
+    )
+
+
+class Model:
+    def __init__(self) -> None:
+        self.name = "test"
+        self.converted = 1
+
+
+def test_compile_attribute() -> None:
+    assert compile_attribute(make_field("name", identity_json)) == "instance.name"
+
+
+def test_compile_attribute__keyword_name() -> None:
+    assert compile_attribute(make_field("class", identity_json)) == (
+        "getattr(instance, 'class')"
+    )
+
+
+def test_compile_conversion() -> None:
+    converter = Mock()
+    field = make_field("name", converter)
+    namespace: Dict[str, Any] = {}
+
+    assert compile_conversion(1, field, converter, "value", namespace) == (
+        "convert_1(field_1, value)"
+    )
+    assert namespace == {"convert_1": converter, "field_1": field}
+
+
+def test_compile_conversion__identity() -> None:
+    field = make_field("name", identity_json)
+    namespace: Dict[str, Any] = {}
+
+    assert compile_conversion(1, field, identity_json, "value", namespace) == "value"
+    assert not namespace
+
+
+def test_compile_conversion__identity_when() -> None:
+    field = make_field("name", unparameterized_json)
+    namespace: Dict[str, Any] = {}
+
+    assert (
+        compile_conversion(1, field, unparameterized_json, "value", namespace)
+        == "value"
+    )
+    assert not namespace
+
+
+def test_compile_conversion__identity_when_params() -> None:
+    field = Field(
+        from_json=unparameterized_json,
+        name="name",
+        params=True,
+        to_json=unparameterized_json,
+        type=Mock,
+    )
+    namespace: Dict[str, Any] = {}
+
+    assert compile_conversion(1, field, unparameterized_json, "value", namespace) == (
+        "convert_1(field_1, value)"
+    )
+
+
+def test_compile_from_json() -> None:
+    converter = Mock()
+    converted = make_field("converted", converter)
+    fields = [make_field("name", identity_json), converted]
+
+    from_json = compile_from_json(fields)
+
+    assert from_json({"name": "test", "converted": 1}) == {
+        "name": "test",
+        "converted": converter.return_value,
+    }
+
+    converter.assert_called_once_with(converted, 1)
+
+
+def test_compile_from_json__missing_value() -> None:
+    from_json = compile_from_json([make_field("name", identity_json)])
+
+    assert from_json({}) == {"name": None}
+
+
+def test_compile_from_json__name() -> None:
+    assert compile_from_json([], name="test").__name__ == "test"
+
+
+def test_compile_from_row() -> None:
+    converter = Mock()
+    converted = make_field("converted", converter)
+    fields = [make_field("name", identity_json), converted]
+
+    from_row = compile_from_row(fields)
+
+    assert from_row(["test", 1]) == {
+        "name": "test",
+        "converted": converter.return_value,
+    }
+
+    converter.assert_called_once_with(converted, 1)
+
+
+def test_compile_from_row__name() -> None:
+    assert compile_from_row([], name="test").__name__ == "test"
+
+
+def test_compile_function() -> None:
+    value = Mock()
+    function = compile_function(
+        "test", ["def test():", "    return value"], {"value": value}
+    )
+
+    assert function.__name__ == "test"
+    assert function() == value
+
+
+def test_compile_to_json() -> None:
+    converter = Mock()
+    converted = make_field("converted", converter)
+    fields = [make_field("name", identity_json), converted]
+    instance = Mock()
+
+    to_json = compile_to_json(fields)
+
+    assert to_json(instance) == {
+        "name": instance.name,
+        "converted": converter.return_value,
+    }
+
+    converter.assert_called_once_with(converted, instance.converted)
+
+
+def test_compile_to_json__loaded() -> None:
+    converter = Mock()
+    converted = make_field("converted", converter)
+    fields = [make_field("name", identity_json), converted]
+    instance = Model()
+
+    to_json = compile_to_json(fields)
+
+    assert to_json(instance) == {
+        "name": "test",
+        "converted": converter.return_value,
+    }
+
+    converter.assert_called_once_with(converted, 1)
+
+
+def test_compile_to_json__keyword_name() -> None:
+    instance = Mock()
+    to_json = compile_to_json([make_field("class", identity_json)])
+
+    assert to_json(instance) == {"class": getattr(instance, "class")}
+
+
+def test_compile_to_json__name() -> None:
+    assert compile_to_json([], name="test").__name__ == "test"
+
+
+def test_compile_to_json__non_identifier_name() -> None:
+    instance = Mock()
+    to_json = compile_to_json([make_field("first name", identity_json)])
+
+    assert to_json(instance) == {"first name": getattr(instance, "first name")}
+
+
+def test_compile_to_row() -> None:
+    converter = Mock()
+    converted = make_field("converted", converter)
+    fields = [make_field("name", identity_json), converted]
+    instance = Mock()
+
+    to_row = compile_to_row(fields)
+
+    assert to_row(instance) == [instance.name, converter.return_value]
+
+    converter.assert_called_once_with(converted, instance.converted)
+
+
+def test_compile_to_row__loaded() -> None:
+    converter = Mock()
+    converted = make_field("converted", converter)
+    fields = [make_field("name", identity_json), converted]
+
+    to_row = compile_to_row(fields)
+
+    assert to_row(Model()) == ["test", converter.return_value]
+
+    converter.assert_called_once_with(converted, 1)
+
+
+def test_compile_to_row__name() -> None:
+    assert compile_to_row([], name="test").__name__ == "test"
@@ -0,0 +1,85 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.compression import COMPRESSION_HEADER
+from celery_sqlalchemy.compression import compress
+from celery_sqlalchemy.compression import decompress
+from celery_sqlalchemy.compression import is_compressed
+
+from celery_sqlalchemy import errors
+
+# system imports
+import lzma
+import os
+import zlib
+
+# dependency imports
+from pytest import mark
+from pytest import raises
+
+MESSAGE = b'{"name": "model", "value": 1}' * 100
+
+
+@mark.parametrize("compression", ["lzma", "zlib"])
+def test_compress(compression: str) -> None:
+    message = compress(MESSAGE, compression, 1024)
+
+    assert is_compressed(message)
+    assert len(message) < len(MESSAGE)
+    assert decompress(message) == MESSAGE
+
+
+def test_compress__header() -> None:
+    message = compress(MESSAGE, "zlib", 0)
+
+    assert message == COMPRESSION_HEADER + b"z" + zlib.compress(MESSAGE)
+
+
+def test_compress__level() -> None:
+    message = compress(MESSAGE, "lzma", 0, level=1)
+
+    assert message == COMPRESSION_HEADER + b"x" + lzma.compress(MESSAGE, preset=1)
+
+
+def test_compress__below_threshold() -> None:
+    assert compress(MESSAGE, "zlib", len(MESSAGE) + 1) is MESSAGE
+
+
+def test_compress__incompressible() -> None:
+    message = os.urandom(4096)
+
+    assert compress(message, "zlib", 0) is message
+
+
+def test_compress__str() -> None:
+    message = compress(MESSAGE.decode(), "zlib", 0)
+
+    assert decompress(message) == MESSAGE
+
+
+def test_compress__raises_serialization_error() -> None:
+    with raises(errors.SerializationError) as ex:
+        compress(MESSAGE, "brotli", 0)
+
+    assert str(ex.value) == "Unsupported compression: brotli"
+
+
+@mark.parametrize("message", [MESSAGE, MESSAGE.decode(), b""])
+def test_decompress__uncompressed(message: bytes) -> None:
+    assert decompress(message) is message
+
+
+@mark.parametrize("code", [b"", b"b"])
+def test_decompress__raises_serialization_error(code: bytes) -> None:
+    with raises(errors.SerializationError) as ex:
+        decompress(COMPRESSION_HEADER + code + MESSAGE)
+
+    assert str(ex.value) == "Unsupported message compression"
+
+
+def test_is_compressed() -> None:
+    assert not is_compressed(MESSAGE)
+    assert not is_compressed(MESSAGE.decode())
+    assert is_compressed(COMPRESSION_HEADER + b"z")
@@ -0,0 +1,103 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.instrumentation import Aggregator
+from celery_sqlalchemy.instrumentation import percentile
+
+from celery_sqlalchemy.types import Measurement
+
+# dependency imports
+from pytest import mark
+
+
+def test_aggregator() -> None:
+    aggregator = Aggregator()
+
+    for n in range(1, 101):
+        aggregator(
+            Measurement(
+                operation="encode",
+                seconds=n / 1000,
+                instances=2,
+                model_path="path.Model",
+                size=10,
+            )
+        )
+
+    aggregator(Measurement(operation="serialize", seconds=0.5, size=100))
+
+    assert aggregator.summary() == {
+        "encode": {
+            "path.Model": {
+                "count": 100,
+                "instances": 200,
+                "seconds": sum(n / 1000 for n in range(1, 101)),
+                "size": 1000,
+                "p50": 0.05,
+                "p90": 0.09,
+                "p99": 0.099,
+            }
+        },
+        "serialize": {
+            None: {
+                "count": 1,
+                "instances": 0,
+                "seconds": 0.5,
+                "size": 100,
+                "p50": 0.5,
+                "p90": 0.5,
+                "p99": 0.5,
+            }
+        },
+    }
+
+
+def test_aggregator__max_samples() -> None:
+    aggregator = Aggregator(max_samples=2)
+
+    for seconds in [3.0, 1.0, 2.0]:
+        aggregator(Measurement(operation="decode", seconds=seconds))
+
+    summary = aggregator.summary(percentiles=[0, 100])["decode"][None]
+
+    assert summary["count"] == 3
+    assert summary["seconds"] == 6.0
+    assert summary["p0"] == 1.0
+    assert summary["p100"] == 2.0
+
+
+def test_aggregator__missing_size() -> None:
+    aggregator = Aggregator()
+
+    aggregator(Measurement(operation="decode", seconds=1.0, size=None))
+
+    assert aggregator.summary()["decode"][None]["size"] == 0
+
+
+def test_aggregator__reset() -> None:
+    aggregator = Aggregator()
+
+    aggregator(Measurement(operation="decode", seconds=1.0))
+    aggregator.reset()
+
+    assert aggregator.summary() == {}
+
+
+@mark.parametrize(
+    "p, expected",
+    [
+        (0, 1.0),
+        (25, 1.0),
+        (50, 2.0),
+        (75, 3.0),
+        (100, 4.0),
+    ],
+)
+def test_percentile(p: float, expected: float) -> None:
+    assert percentile([1.0, 2.0, 3.0, 4.0], p) == expected
+
+
+def test_percentile__empty() -> None:
+    assert percentile([], 50) == 0.0
@@ -0,0 +1,272 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.json import JsonSerializer
+
+from celery_sqlalchemy.lazy import is_lazy
+from celery_sqlalchemy.lazy import materialize
+
+from celery_sqlalchemy.msgpack import MsgpackSerializer
+
+from celery_sqlalchemy.types import Args
+
+# system imports
+from dataclasses import replace
+
+from datetime import datetime
+from datetime import timezone
+
+from typing import Any
+
+from unittest.mock import Mock
+
+# dependency imports
+from pytest import mark
+
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import relationship
+
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy import inspect
+
+import orjson
+
+Base = declarative_base()
+
+
+class Model(Base):  # type: ignore
+    __tablename__ = "model"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    created = Column(DateTime)
+    parent_id = Column(Integer, ForeignKey("model.id"))
+
+    parent = relationship("Model", remote_side=[id])
+
+    def describe(self) -> str:
+        return f"{self.id}: {self.name}"
+
+
+def make_proxy(**options: Any) -> Any:
+    serializer = JsonSerializer(lazy=True, **options)
+    message = serializer.message_from_args(
+        Args(
+            arg=Model(id=1, name="model", created=datetime(2020, 1, 1)),
+            args=[],
+            kwargs={},
+        )
+    )
+
+    return serializer.message_to_args(message).arg
+
+
+def test_lazy_model__field() -> None:
+    proxy = make_proxy()
+
+    assert is_lazy(proxy)
+    assert proxy.created == datetime(2020, 1, 1, tzinfo=timezone.utc)
+    assert proxy._lazy_values == {"created": datetime(2020, 1, 1, tzinfo=timezone.utc)}
+    assert proxy._lazy_instance is None
+
+
+def test_lazy_model__field_converted_once() -> None:
+    proxy = make_proxy()
+
+    assert proxy.created is proxy.created
+
+
+def test_lazy_model__field_by_name() -> None:
+    proxy = make_proxy()
+    schema = proxy._lazy_schema
+    object.__setattr__(proxy, "_lazy_schema", replace(schema, fields=[]))
+
+    assert proxy.name == "model"
+    assert proxy._lazy_values == {"name": "model"}
+    assert proxy._lazy_instance is None
+
+
+def test_lazy_model__isinstance() -> None:
+    proxy = make_proxy()
+
+    assert isinstance(proxy, Model)
+    assert proxy._lazy_instance is None
+
+
+def test_lazy_model__method() -> None:
+    proxy = make_proxy()
+
+    assert proxy.describe() == "1: model"
+    assert proxy._lazy_instance is not None
+
+
+def test_lazy_model__relationship() -> None:
+    proxy = make_proxy(bypass_init=True)
+
+    assert proxy._lazy_instance is None
+    assert "parent" not in inspect(materialize(proxy)).dict
+
+
+def test_lazy_model__setattr() -> None:
+    proxy = make_proxy()
+
+    proxy.name = "changed"
+
+    assert proxy._lazy_instance.name == "changed"
+    assert proxy.name == "changed"
+
+
+def test_lazy_model__delattr() -> None:
+    proxy = make_proxy()
+
+    del proxy.name
+
+    assert proxy.name is None
+
+
+def test_lazy_model__repr() -> None:
+    proxy = make_proxy()
+
+    assert repr(proxy) == "<LazyModel Model>"
+
+    materialize(proxy)
+
+    assert repr(proxy) == repr(proxy._lazy_instance)
+
+
+def test_lazy_model__session_add() -> None:
+    engine = create_engine("sqlite://")
+    proxy = make_proxy()
+
+    Base.metadata.create_all(engine)
+
+    with Session(engine) as session:
+        session.add(proxy)
+        session.commit()
+
+        assert session.get(Model, 1) is proxy._lazy_instance
+
+
+def test_materialize() -> None:
+    proxy = make_proxy()
+    created = proxy.created
+    instance = materialize(proxy)
+
+    assert type(instance) is Model
+    assert instance.name == "model"
+    assert instance.created is created
+    assert materialize(proxy) is instance
+
+
+def test_materialize__bypass_init() -> None:
+    init = Mock()
+    proxy = make_proxy(bypass_init=True)
+
+    event.listen(Model, "init", init)
+
+    try:
+        instance = materialize(proxy)
+
+    finally:
+        event.remove(Model, "init", init)
+
+    init.assert_not_called()
+
+    assert inspect(instance).detached
+
+
+@mark.parametrize("compiled", [False, True])
+def test_materialize__compiled(compiled: bool) -> None:
+    instance = materialize(make_proxy(compiled=compiled))
+
+    assert (instance.id, instance.name) == (1, "model")
+
+
+def test_materialize__other_than_proxy() -> None:
+    arg = Mock()
+
+    assert materialize(arg) is arg
+
+
+def test_message__lazy_msgpack() -> None:
+    serializer = MsgpackSerializer(lazy=True)
+    message = serializer.message_from_args(
+        Args(arg=Model(id=1, created=datetime(2020, 1, 1)), args=[], kwargs={})
+    )
+
+    args = serializer.message_to_args(message)
+
+    assert is_lazy(args.arg)
+    assert args.arg.created == datetime(2020, 1, 1)  # type: ignore
+
+
+def test_message__lazy_relationships() -> None:
+    serializer = JsonSerializer(lazy=True, relationship_depth=1)
+    message = serializer.message_from_args(
+        Args(arg=Model(id=1, parent=Model(id=2)), args=[], kwargs={})
+    )
+
+    args = serializer.message_to_args(message)
+
+    assert not is_lazy(args.arg)
+    assert args.arg.parent.id == 2  # type: ignore
+
+
+def test_message__lazy_deduplicate() -> None:
+    serializer = JsonSerializer(deduplicate=True, lazy=True)
+    model = Model(id=1)
+    message = serializer.message_from_args(Args(arg=model, args=[model], kwargs={}))
+
+    args = serializer.message_to_args(message)
+
+    assert args.args
+    assert args.args[0] is args.arg
+
+
+def test_arg_to_json__lazy_unchanged() -> None:
+    proxy = make_proxy(deduplicate=True)
+    serializer = JsonSerializer(lazy=True)
+
+    assert serializer.arg_to_json(proxy) == {
+        "id": 1,
+        "name": "model",
+        "created": "2020-01-01T00:00:00+00:00",
+        "parent_id": None,
+        "$model_path$": f"{__name__}.Model",
+    }
+    assert proxy._lazy_instance is None
+
+
+def test_arg_to_json__lazy_changed() -> None:
+    proxy = make_proxy()
+    serializer = JsonSerializer()
+
+    proxy.name = "changed"
+
+    assert serializer.arg_to_json(proxy)["name"] == "changed"
+
+
+def test_arg_to_json__lazy_other_interface() -> None:
+    proxy = make_proxy()
+    message = MsgpackSerializer().message_from_args(Args(arg=proxy, args=[], kwargs={}))
+
+    assert proxy._lazy_instance is not None
+    assert MsgpackSerializer().message_to_args(message).arg.name == "model"  # type: ignore
+
+
+def test_message__lazy_resend() -> None:
+    serializer = JsonSerializer(lazy=True)
+    proxy = make_proxy()
+    message = serializer.message_from_args(Args(arg=proxy, args=[], kwargs={}))
+
+    assert orjson.loads(message)["$arg$"]["name"] == "model"
+    assert proxy._lazy_instance is None
@@ -0,0 +1,314 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.celery import deserialize_message
+from celery_sqlalchemy.celery import serialize_args
+
+from celery_sqlalchemy.instrumentation import Aggregator
+
+from celery_sqlalchemy.model import schema_for_model_path
+
+from celery_sqlalchemy.positional import MODEL_EXT
+from celery_sqlalchemy.positional import PositionalSerializer
+
+from celery_sqlalchemy.types import Args
+
+from celery_sqlalchemy import msgpack as interface
+
+# system imports
+from datetime import datetime
+
+from typing import Any
+from typing import Dict
+from typing import cast
+
+from unittest.mock import Mock
+from unittest.mock import patch
+
+# dependency imports
+from pytest import mark
+
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import make_transient_to_detached
+
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import Integer
+from sqlalchemy import String
+from sqlalchemy import event
+from sqlalchemy import inspect
+
+import msgpack
+
+PATH = "celery_sqlalchemy.positional"
+
+Base = declarative_base()
+
+
+class Model(Base):  # type: ignore
+    __tablename__ = "model"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    created = Column(DateTime)
+
+
+class Other(Base):  # type: ignore
+    __tablename__ = "other"
+
+    id = Column(Integer, primary_key=True)
+
+
+def make_models(count: int) -> list:
+    return [
+        Model(id=n, name=f"model {n}", created=datetime(2020, 1, 1, n))
+        for n in range(count)
+    ]
+
+
+@mark.parametrize("compiled", [False, True])
+def test_message(compiled: bool) -> None:
+    models = make_models(3)
+    serializer = PositionalSerializer(compiled=compiled)
+    message = serializer.message_from_args(
+        Args(arg=models[0], args=[models, Other(id=1)], kwargs={"n": [1, 2]})
+    )
+
+    args = serializer.message_to_args(message)
+
+    assert args.arg
+    assert args.arg.name == "model 0"
+    assert args.args
+    assert [(model.id, model.name, model.created) for model in args.args[0]] == [
+        (model.id, model.name, model.created) for model in models
+    ]
+    assert args.args[1].id == 1
+    assert args.kwargs == {"n": [1, 2]}
+
+
+def test_message_from_args__field_names_once() -> None:
+    serializer = PositionalSerializer()
+    message = serializer.message_from_args(
+        Args(arg=None, args=[make_models(10)], kwargs={})
+    )
+
+    assert cast(bytes, message).count(b"name") == 1
+
+    schemas, _ = msgpack.unpackb(message)
+
+    assert schemas == [
+        [
+            f"{__name__}.Model",
+            schema_for_model_path(f"{__name__}.Model", interface).fingerprint,
+            ["id", "name", "created"],
+        ]
+    ]
+
+
+def test_message_from_args__references() -> None:
+    model = make_models(1)[0]
+    serializer = PositionalSerializer(references=True)
+
+    make_transient_to_detached(model)
+
+    message = serializer.message_from_args(Args(arg=model, args=[], kwargs={}))
+
+    schemas, body = msgpack.unpackb(message)
+
+    assert schemas == []
+    assert msgpack.unpackb(body)["$arg$"] == {
+        "$model_path$": f"{__name__}.Model",
+        "$pk$": [0],
+    }
+
+
+def test_message_to_args__bypass_init() -> None:
+    init = Mock()
+    serializer = PositionalSerializer(bypass_init=True)
+    message = serializer.message_from_args(
+        Args(arg=make_models(1)[0], args=[], kwargs={})
+    )
+
+    event.listen(Model, "init", init)
+
+    try:
+        args = serializer.message_to_args(message)
+
+    finally:
+        event.remove(Model, "init", init)
+
+    init.assert_not_called()
+
+    assert args.arg
+    assert args.arg.name == "model 0"
+    assert inspect(args.arg).detached
+
+
+def test_message_to_args__fingerprint_differs() -> None:
+    serializer = PositionalSerializer()
+    schemas = [[f"{__name__}.Model", "drifted", ["name", "removed", "id"]]]
+    row = msgpack.packb([0, ["model 1", "value", 1]])
+    body = msgpack.packb(
+        {
+            "$arg$": msgpack.ExtType(MODEL_EXT, row),
+            "$args$": [],
+            "$kwargs$": {},
+        }
+    )
+
+    args = serializer.message_to_args(msgpack.packb([schemas, body]))
+
+    assert args.arg
+    assert args.arg.id == 1
+    assert args.arg.name == "model 1"
+    assert args.arg.created is None
+
+
+def test_message__measurement() -> None:
+    aggregator = Aggregator()
+    serializer = PositionalSerializer(measure_size=True, on_measurement=aggregator)
+    message = serializer.message_from_args(
+        Args(arg=None, args=[make_models(2)], kwargs={})
+    )
+
+    serializer.message_to_args(message)
+
+    summary = aggregator.summary()
+    path = f"{__name__}.Model"
+
+    assert summary["encode"][path]["count"] == 2
+    assert summary["encode"][path]["size"] > 0
+    assert summary["decode"][path]["count"] == 2
+
+
+def test_message__measurement_without_size() -> None:
+    measurement = Mock()
+    serializer = PositionalSerializer(on_measurement=measurement)
+
+    serializer.message_from_args(Args(arg=None, args=[make_models(2)], kwargs={}))
+
+    measurements = [call.args[0] for call in measurement.call_args_list]
+
+    assert [m.operation for m in measurements] == ["encode", "encode"]
+    assert all(m.size is None for m in measurements)
+    assert all(m.seconds >= 0 for m in measurements)
+
+
+@patch(f"{PATH}.schema_for_model_path")
+def test_schema_from_header(schema_for_model_path: Mock) -> None:
+    schema = Mock(fingerprint="fingerprint")
+    schema_for_model_path.return_value = schema
+    serializer = PositionalSerializer()
+
+    assert serializer.schema_from_header("path.Model", "fingerprint", ["id"]) == (
+        schema,
+        None,
+    )
+
+    schema_for_model_path.assert_called_with(
+        "path.Model", serializer.interface, compiled=False
+    )
+
+
+def test_loads__other_ext() -> None:
+    serializer = PositionalSerializer()
+    ext = msgpack.ExtType(MODEL_EXT + 1, b"data")
+
+    assert serializer.loads(msgpack.packb([[], msgpack.packb(ext)])) == ext
+
+
+def test_message_from_object() -> None:
+    serializer = PositionalSerializer()
+    message = serializer.message_from_object({"n": 1, "model": make_models(1)[0]})
+
+    value = serializer.message_to_object(message)
+
+    assert value["n"] == 1
+    assert value["model"].name == "model 0"
+
+
+def test_model_to_ext__relationship_depth() -> None:
+    serializer = PositionalSerializer(relationship_depth=1)
+
+    assert serializer.model_to_ext(make_models(1)[0], {}, []) is None
+
+
+def test_message__nested_models() -> None:
+    models = make_models(2)
+    serializer = PositionalSerializer(deduplicate=True)
+    message = serializer.message_from_args(
+        Args(arg=None, args=[], kwargs={"meta": {"models": models, "model": models[0]}})
+    )
+
+    args = serializer.message_to_args(message)
+
+    assert args.kwargs
+    assert [model.name for model in args.kwargs["meta"]["models"]] == [
+        "model 0",
+        "model 1",
+    ]
+    assert args.kwargs["meta"]["model"] is args.kwargs["meta"]["models"][0]
+
+
+def test_message_from_object__models() -> None:
+    models = make_models(3)
+    serializer = PositionalSerializer()
+    message = serializer.message_from_object({"status": "SUCCESS", "result": models})
+
+    value = serializer.message_to_object(message)
+
+    assert value["status"] == "SUCCESS"
+    assert [model.name for model in value["result"]] == [
+        "model 0",
+        "model 1",
+        "model 2",
+    ]
+
+
+@mark.parametrize(
+    "result",
+    [{"status": "SUCCESS", "result": [1, "text", None]}, "plain", 1, None],
+)
+def test_message_from_object__plain(result: Any) -> None:
+    serializer = PositionalSerializer()
+    message = serialize_args(serializer, None, result)
+
+    assert deserialize_message(serializer, None, message) == result
+
+
+def test_message_from_object__celery_models() -> None:
+    models = make_models(2)
+    serializer = PositionalSerializer()
+    message = serialize_args(serializer, None, {"status": "SUCCESS", "result": models})
+
+    value = cast(Dict[str, Any], deserialize_message(serializer, None, message))
+
+    assert value["status"] == "SUCCESS"
+    assert [model.name for model in value["result"]] == ["model 0", "model 1"]
+
+
+def test_message__deduplicate() -> None:
+    model = make_models(1)[0]
+    serializer = PositionalSerializer(deduplicate=True)
+    message = serializer.message_from_args(Args(arg=model, args=[model], kwargs={}))
+
+    args = serializer.message_to_args(message)
+
+    assert args.arg
+    assert args.args
+    assert args.args[0] is args.arg
+
+
+def test_message__deduplicate_batches() -> None:
+    model = make_models(1)[0]
+    serializer = PositionalSerializer(batches=True, deduplicate=True)
+    message = serializer.message_from_args(
+        Args(arg=None, args=[[model, model], model], kwargs={})
+    )
+
+    args = serializer.message_to_args(message)
+
+    assert args.args
+    assert args.args[0][0] is args.args[0][1] is args.args[1]
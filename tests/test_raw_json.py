@@ -0,0 +1,89 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.raw_json import RawJson
+from celery_sqlalchemy.raw_json import dumps
+from celery_sqlalchemy.raw_json import escape_raw_json
+from celery_sqlalchemy.raw_json import load_raw_json
+
+# system imports
+from typing import Any
+from unittest.mock import patch
+
+# dependency imports
+from pytest import mark
+
+import orjson
+
+PATH = "celery_sqlalchemy.raw_json"
+
+TEXT = '{"name": "value", "items": [1, 2]}'
+
+
+@mark.parametrize("text", [TEXT, TEXT.encode()])
+def test_raw_json(text: Any) -> None:
+    document = RawJson(text)
+
+    assert document.text == TEXT
+    assert document == RawJson(TEXT)
+    assert hash(document) == hash(RawJson(TEXT))
+    assert document != TEXT
+
+
+def test_raw_json__fragment() -> None:
+    document = RawJson(TEXT)
+
+    assert document.fragment() is document.fragment()
+    assert orjson.loads(orjson.dumps([document.fragment()])) == [{"$json$": TEXT}]
+
+
+@patch(f"{PATH}.orjson.loads", wraps=orjson.loads)
+def test_raw_json__value(loads: Any) -> None:
+    document = RawJson(TEXT)
+
+    loads.assert_not_called()
+
+    assert document.value == {"name": "value", "items": [1, 2]}
+    assert document.value is document.value
+
+    loads.assert_called_once_with(TEXT)
+
+
+def test_raw_json__repr() -> None:
+    assert repr(RawJson("[1]")) == "RawJson('[1]')"
+    assert repr(RawJson(TEXT * 2)) == f"RawJson({(TEXT * 2)[:40]!r}...)"
+
+
+def test_dumps() -> None:
+    assert dumps(RawJson(TEXT)) == TEXT
+    assert dumps({"name": "value"}) == '{"name":"value"}'
+
+
+@mark.parametrize(
+    "value",
+    [None, 1, "text", [1], {"name": "value"}, {"$json$": TEXT, "name": "value"}],
+)
+def test_escape_raw_json(value: Any) -> None:
+    assert escape_raw_json(value) is value
+
+
+@mark.parametrize("value", [{"$json$": TEXT}, {"$json$": [TEXT]}, {"$json$": None}])
+def test_escape_raw_json__marker(value: Any) -> None:
+    escaped = escape_raw_json(value)
+
+    assert escaped == {"$json$": [value]}
+    assert load_raw_json(orjson.loads(orjson.dumps(escaped))) == value
+
+
+@mark.parametrize(
+    "value",
+    [None, 1, "text", [1], {"name": "value"}, {"$json$": TEXT, "name": "value"}],
+)
+def test_load_raw_json(value: Any) -> None:
+    assert load_raw_json(value) is value
+
+
+def test_load_raw_json__raw_json() -> None:
+    assert load_raw_json({"$json$": TEXT}) == RawJson(TEXT)
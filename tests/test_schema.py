@@ -6,6 +6,9 @@
 from celery_sqlalchemy.schema import Field
 from celery_sqlalchemy.schema import Schema
 from celery_sqlalchemy.schema import TypeMap
+from celery_sqlalchemy.schema import identity
+from celery_sqlalchemy.schema import identity_when
+from celery_sqlalchemy.schema import is_identity
 
 # system dependencies
 from unittest.mock import Mock
@@ -21,3 +24,39 @@ def test_schema() -> None:
 
 def test_type_map() -> None:
     TypeMap(from_json=Mock(), params=Mock(), to_json=Mock())
+
+
+def test_identity() -> None:
+    def function() -> None:
+        pass
+
+    assert identity(function) == function
+    assert is_identity(function)
+
+
+def test_identity_when() -> None:
+    def function() -> None:
+        pass
+
+    assert identity_when(lambda params: params is None)(function) == function
+    assert is_identity(function, Mock(params=None))
+    assert not is_identity(function, Mock(params=True))
+    assert not is_identity(function)
+
+
+def test_is_identity__field() -> None:
+    def function() -> None:
+        pass
+
+    assert is_identity(identity(function), Mock(params=True))
+
+
+def test_is_identity__mock() -> None:
+    assert not is_identity(Mock())
+
+
+def test_is_identity__unmarked() -> None:
+    def function() -> None:
+        pass
+
+    assert not is_identity(function)
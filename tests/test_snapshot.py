@@ -0,0 +1,309 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.model import map_model
+from celery_sqlalchemy.model import schema_for_model_path
+from celery_sqlalchemy.model import schema_maps
+from celery_sqlalchemy.model import schema_models
+
+from celery_sqlalchemy.schema import EPOCH_TEMPORAL
+from celery_sqlalchemy.schema import MEMOIZE_TEMPORAL
+from celery_sqlalchemy.schema import SCALED_NUMERIC
+
+from celery_sqlalchemy.snapshot import SNAPSHOT_VERSION
+from celery_sqlalchemy.snapshot import build_snapshot
+from celery_sqlalchemy.snapshot import load_snapshot
+from celery_sqlalchemy.snapshot import models_hash
+from celery_sqlalchemy.snapshot import module_stamp
+from celery_sqlalchemy.snapshot import read_snapshot
+from celery_sqlalchemy.snapshot import use_snapshot
+from celery_sqlalchemy.snapshot import write_snapshot
+
+from celery_sqlalchemy import json
+from celery_sqlalchemy import msgpack
+
+# system imports
+from pathlib import Path
+
+from types import ModuleType
+
+from typing import Any
+from typing import Iterator
+
+from unittest.mock import Mock
+from unittest.mock import patch
+
+import pickle
+import sys
+
+# dependency imports
+from pytest import MonkeyPatch
+from pytest import fixture
+from pytest import mark
+from pytest import raises
+
+from sqlalchemy.orm import declarative_base
+
+from sqlalchemy import Column
+from sqlalchemy import DateTime
+from sqlalchemy import Integer
+from sqlalchemy import Numeric
+from sqlalchemy import String
+from sqlalchemy import inspect
+
+PATH = "celery_sqlalchemy.snapshot"
+
+Base = declarative_base()
+
+
+class Model(Base):  # type: ignore
+    __tablename__ = "model"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    price = Column(Numeric(10, 2))
+
+
+class Other(Base):  # type: ignore
+    __tablename__ = "other"
+
+    id = Column(Integer, primary_key=True)
+    key = Column(String, primary_key=True)
+
+
+def clear_registry() -> None:
+    for interface in (json, msgpack):
+        for model in (Model, Other):
+            schema_maps.pop((interface, f"{__name__}.{model.__name__}"), None)
+            schema_models.pop((interface, model), None)
+
+
+@fixture(autouse=True)
+def registry() -> Iterator[None]:
+    clear_registry()
+    yield
+    clear_registry()
+
+
+def assert_schema(interface: ModuleType, model: Any, compiled: bool = False) -> None:
+    schema = schema_for_model_path(f"{__name__}.{model.__name__}", interface)
+    expected = map_model(model, inspect(model), interface)
+
+    assert schema.model is model
+    assert schema.fields == expected.fields
+    assert schema.fingerprint == expected.fingerprint
+    assert schema.primary_key == expected.primary_key
+    assert bool(schema.to_json) is compiled
+
+
+def test_build_snapshot() -> None:
+    snapshot = build_snapshot([Model, Other], [json])
+
+    assert snapshot["hash"] == models_hash([Model, Other])
+    assert snapshot["version"] == SNAPSHOT_VERSION
+    assert snapshot["schemas"][0][:2] == [json.__name__, f"{__name__}.Model"]
+    assert snapshot["schemas"][0][2][2][:2] == [
+        "price",
+        "sqlalchemy.sql.sqltypes.Numeric",
+    ]
+    assert snapshot["schemas"][1][3] == ["id", "key"]
+
+
+@mark.parametrize("compiled", [False, True])
+def test_load_snapshot(compiled: bool) -> None:
+    snapshot = build_snapshot([Model, Other], [json, msgpack])
+
+    clear_registry()
+
+    with patch(f"{PATH}.schema_for_model") as schema_for_model:
+        assert load_snapshot(snapshot, [Model, Other], compiled=compiled) == 4
+
+    schema_for_model.assert_not_called()
+
+    for interface in (json, msgpack):
+        for model in (Model, Other):
+            assert_schema(interface, model, compiled=compiled)
+
+
+def test_models_hash__changes() -> None:
+    other = declarative_base()
+
+    class Model(other):  # type: ignore
+        __tablename__ = "model"
+
+        id = Column(Integer, primary_key=True)
+        name = Column(String)
+        cost = Column(Numeric(12, 2))
+
+    assert models_hash([Model]) != models_hash([globals()["Model"]])
+
+
+@mark.parametrize(
+    "column_type, changed",
+    [
+        (Numeric(12, 2), Numeric(12, 3)),
+        (Numeric(12, 2), Numeric(14, 2)),
+        (Numeric(12, 2), Numeric(12, 2, asdecimal=False)),
+        (Numeric(12, 2), Integer()),
+        (DateTime(), DateTime(timezone=True)),
+    ],
+)
+def test_models_hash__column_type(column_type: Any, changed: Any) -> None:
+    other = declarative_base()
+
+    class Model(other):  # type: ignore
+        __tablename__ = "model"
+
+        id = Column(Integer, primary_key=True)
+        value = Column(column_type)
+
+    before = models_hash([Model])
+
+    Model.__table__.c.value.type = changed
+
+    assert models_hash([Model]) != before
+
+
+@mark.parametrize("key", [EPOCH_TEMPORAL, MEMOIZE_TEMPORAL, SCALED_NUMERIC])
+def test_models_hash__info(key: str) -> None:
+    other = declarative_base()
+
+    class Model(other):  # type: ignore
+        __tablename__ = "model"
+
+        id = Column(Integer, primary_key=True)
+        value = Column(Numeric(12, 2), info={key: True})
+
+    before = models_hash([Model])
+
+    Model.__table__.c.value.info.clear()
+
+    assert models_hash([Model]) != before
+
+
+@patch(f"{PATH}.module_stamp")
+def test_models_hash__source_changes(module_stamp: Mock) -> None:
+    module_stamp.return_value = "before"
+    before = models_hash([Model, Other])
+
+    module_stamp.assert_called_once_with(__name__)
+    module_stamp.return_value = "after"
+
+    assert models_hash([Model, Other]) != before
+
+
+@patch(f"{PATH}.inspect")
+def test_models_hash__without_inspect(inspect: Mock) -> None:
+    models_hash([Model, Other])
+
+    inspect.assert_not_called()
+
+
+def test_models_hash__order() -> None:
+    assert models_hash([Model, Other]) == models_hash([Other, Model])
+
+
+def test_module_stamp(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    path = tmp_path / "models.py"
+    path.write_text("x = 1\n")
+    module = ModuleType("models")
+    module.__file__ = str(path)
+    monkeypatch.setitem(sys.modules, "models", module)
+    stamp = module_stamp("models")
+
+    assert stamp == module_stamp("models")
+
+    path.write_text("x = 10\n")
+
+    assert module_stamp("models") != stamp
+
+
+def test_module_stamp__without_source() -> None:
+    assert module_stamp("missing") != module_stamp("missing")
+
+
+def test_read_snapshot__missing(tmp_path: Path) -> None:
+    assert read_snapshot(str(tmp_path / "missing")) is None
+
+
+def test_read_snapshot__corrupt(tmp_path: Path) -> None:
+    path = tmp_path / "snapshot"
+    path.write_bytes(b"corrupt")
+
+    assert read_snapshot(str(path)) is None
+
+
+def test_read_snapshot__other_version(tmp_path: Path) -> None:
+    path = tmp_path / "snapshot"
+    path.write_bytes(pickle.dumps({"version": SNAPSHOT_VERSION + 1}))
+
+    assert read_snapshot(str(path)) is None
+
+
+def test_use_snapshot(tmp_path: Path) -> None:
+    path = str(tmp_path / "snapshot")
+
+    assert not use_snapshot(path, [Model, Other], [json])
+    assert read_snapshot(path) == build_snapshot([Model, Other], [json])
+
+    clear_registry()
+
+    assert use_snapshot(path, [Model, Other], [json])
+
+    assert_schema(json, Model)
+    assert_schema(json, Other)
+
+
+def test_use_snapshot__compiled(tmp_path: Path) -> None:
+    path = str(tmp_path / "snapshot")
+
+    assert not use_snapshot(path, [Model], [json], compiled=True)
+
+    assert_schema(json, Model, compiled=True)
+
+    clear_registry()
+
+    assert use_snapshot(path, [Model], [json], compiled=True)
+
+    assert_schema(json, Model, compiled=True)
+
+
+def test_use_snapshot__hash_differs(tmp_path: Path) -> None:
+    path = str(tmp_path / "snapshot")
+    snapshot = build_snapshot([Model], [json])
+
+    write_snapshot(path, {**snapshot, "hash": "stale"})
+
+    assert not use_snapshot(path, [Model], [json])
+    assert read_snapshot(path) == snapshot
+
+
+def test_use_snapshot__interfaces_differ(tmp_path: Path) -> None:
+    path = str(tmp_path / "snapshot")
+
+    use_snapshot(path, [Model], [json])
+
+    assert not use_snapshot(path, [Model], [json, msgpack])
+    assert use_snapshot(path, [Model], [json, msgpack])
+
+
+def test_use_snapshot__unknown_type(tmp_path: Path) -> None:
+    path = str(tmp_path / "snapshot")
+    snapshot = build_snapshot([Model], [json])
+    snapshot["schemas"][0][2][0][1] = "removed.Type"
+
+    write_snapshot(path, snapshot)
+
+    assert not use_snapshot(path, [Model], [json])
+
+
+def test_write_snapshot__cleans_up(tmp_path: Path) -> None:
+    path = str(tmp_path / "snapshot")
+
+    with patch(f"{PATH}.pickle.dump", Mock(side_effect=ValueError)):
+        with raises(ValueError):
+            write_snapshot(path, {})
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,123 @@
+# --------------------------------------------------------------------------------------
+# Copyright (c) 2023 Sean Kerr
+# --------------------------------------------------------------------------------------
+
+# celery-sqlalchemy imports
+from celery_sqlalchemy.temporal import date_from_epoch
+from celery_sqlalchemy.temporal import date_to_epoch
+from celery_sqlalchemy.temporal import datetime_from_epoch
+from celery_sqlalchemy.temporal import datetime_from_epoch_utc
+from celery_sqlalchemy.temporal import datetime_to_epoch
+from celery_sqlalchemy.temporal import is_text_temporal
+from celery_sqlalchemy.temporal import memo
+from celery_sqlalchemy.temporal import memoized
+from celery_sqlalchemy.temporal import message_memo
+from celery_sqlalchemy.temporal import time_from_epoch
+from celery_sqlalchemy.temporal import time_to_epoch
+
+# system imports
+from datetime import date
+from datetime import datetime
+from datetime import time
+from datetime import timedelta
+from datetime import timezone
+
+from unittest.mock import Mock
+
+# dependency imports
+from pytest import mark
+from pytest import raises
+
+
+@mark.parametrize(
+    "value, days",
+    [(date(1970, 1, 1), 0), (date(1969, 12, 31), -1), (date(2024, 1, 1), 19723)],
+)
+def test_date_epoch(value: date, days: int) -> None:
+    assert date_to_epoch(value) == days
+    assert date_from_epoch(days) == value
+
+
+@mark.parametrize(
+    "value",
+    [
+        datetime(1970, 1, 1),
+        datetime(1969, 12, 31, 23, 59, 59, 999999),
+        datetime(2024, 1, 1, 12, 30, 0, 1),
+        datetime(9999, 12, 31, 23, 59, 59, 999999),
+    ],
+)
+def test_datetime_epoch(value: datetime) -> None:
+    assert datetime_from_epoch(datetime_to_epoch(value)) == value
+
+
+def test_datetime_epoch__aware() -> None:
+    value = datetime(2024, 1, 1, 13, tzinfo=timezone(timedelta(hours=1)))
+
+    assert datetime_to_epoch(value) == 1704110400000000
+    assert datetime_from_epoch_utc(1704110400000000) == value
+    assert datetime_from_epoch_utc(1704110400000000).tzinfo is timezone.utc
+
+
+def test_is_text_temporal() -> None:
+    assert is_text_temporal(None)
+    assert is_text_temporal(Mock(epoch=False))
+    assert not is_text_temporal(Mock(epoch=True))
+
+
+def test_memoized() -> None:
+    decode = Mock()
+
+    with message_memo():
+        assert memoized(decode, "value") == decode.return_value
+        assert memoized(decode, "value") == decode.return_value
+
+    decode.assert_called_once_with("value")
+
+
+def test_memoized__by_decoder() -> None:
+    with message_memo():
+        assert memoized(date_from_epoch, 0) == date(1970, 1, 1)
+        assert memoized(datetime_from_epoch, 0) == datetime(1970, 1, 1)
+
+
+def test_memoized__without_memo() -> None:
+    decode = Mock()
+
+    memoized(decode, "value")
+    memoized(decode, "value")
+
+    assert decode.call_count == 2
+
+
+def test_message_memo() -> None:
+    with message_memo():
+        outer = memo.get()
+
+        with message_memo():
+            assert memo.get() is not outer
+
+        assert memo.get() is outer
+
+    assert memo.get() is None
+
+
+def test_message_memo__reset_on_error() -> None:
+    with raises(ValueError):
+        with message_memo():
+            raise ValueError
+
+    assert memo.get() is None
+
+
+@mark.parametrize(
+    "value, microseconds",
+    [(time(0, 0), 0), (time(1, 2, 3, 4), 3723000004), (time(23, 59), 86340000000)],
+)
+def test_time_epoch(value: time, microseconds: int) -> None:
+    assert time_to_epoch(value) == microseconds
+    assert time_from_epoch(microseconds) == value
+
+
+def test_time_to_epoch__aware() -> None:
+    assert time_to_epoch(time(1, 2, tzinfo=timezone.utc)) == "01:02:00+00:00"